@@ -0,0 +1,38 @@
+"""Compare list scans with the indexed Inventory for stock checks.
+
+Run with ``PYTHONPATH=. python benchmarks/bench_inventory.py``.
+"""
+
+from __future__ import annotations
+
+import random
+import timeit
+
+from pymixology.inventory import manager
+from pymixology.inventory.container import Inventory
+from pymixology.inventory.items import Ingredient
+
+SIZES = (1_000, 10_000, 100_000)
+QUERIES = 200
+
+
+def _build(size: int):
+    return [Ingredient(f"Item {i}", float(i % 50), "2030-01-01", value=1.0) for i in range(size)]
+
+
+def main() -> None:
+    for size in SIZES:
+        items = _build(size)
+        indexed = Inventory(items)
+        names = [f"item {random.randrange(size)}" for _ in range(QUERIES)]
+        list_time = timeit.timeit(lambda: [manager.check_stock(items, n) for n in names], number=1)
+        index_time = timeit.timeit(lambda: [manager.check_stock(indexed, n) for n in names], number=1)
+        print(
+            f"n={size:>7}: list {list_time * 1e3 / QUERIES:9.4f} ms/query, "
+            f"Inventory {index_time * 1e3 / QUERIES:9.4f} ms/query "
+            f"({list_time / index_time:,.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
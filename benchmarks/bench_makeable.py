@@ -0,0 +1,58 @@
+"""Compare get_makeable_cocktails over a catalog with the bitset MakeableEngine.
+
+Run with ``PYTHONPATH=. python benchmarks/bench_makeable.py``.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from pymixology.inventory.items import Ingredient
+from pymixology.recipes.catalog import RecipeCatalog
+from pymixology.recommendation import suggester
+from pymixology.recommendation.engine import MakeableEngine
+
+SIZE = 100_000
+VOCAB = 400
+STOCKED = 60
+QUERIES = 100
+
+
+def main() -> None:
+    rng = random.Random(533)
+    names = [f"ingredient {i}" for i in range(VOCAB)]
+    recipes = []
+    for i in range(SIZE):
+        pool = names[:40] if rng.random() < 0.5 else names
+        picks = rng.sample(pool, rng.randint(2, 6))
+        recipes.append({
+            "name": f"recipe {i}",
+            "ingredients": [{"name": n, "amount": rng.choice([None, 10, 20, 30, 60]), "unit": "ml"} for n in picks],
+        })
+    catalog = RecipeCatalog(recipes)
+    start = time.perf_counter()
+    engine = MakeableEngine(catalog)
+    print(f"compile: {time.perf_counter() - start:.2f} s for {SIZE:,} recipes")
+
+    stock = [Ingredient(name, rng.choice([5, 15, 100]), "2025-01-01") for name in names[:STOCKED]]
+    start = time.perf_counter()
+    expected = suggester.get_makeable_cocktails(stock, catalog)
+    print(f"catalog scan: {(time.perf_counter() - start) * 1000:.1f} ms ({len(expected):,} makeable)")
+
+    levels = engine.stock_levels(stock)
+    start = time.perf_counter()
+    engine.blocked_mask(levels)
+    print(f"engine mask, new stocked set: {(time.perf_counter() - start) * 1000:.3f} ms")
+    start = time.perf_counter()
+    for _ in range(QUERIES):
+        levels[next(iter(levels))] = rng.choice([5, 15, 100])
+        engine.blocked_mask(levels)
+    print(f"engine mask, quantities only: {(time.perf_counter() - start) * 1000 / QUERIES:.3f} ms")
+    start = time.perf_counter()
+    assert engine.makeable(stock) == expected
+    print(f"engine names: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
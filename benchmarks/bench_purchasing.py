@@ -0,0 +1,53 @@
+"""Time near-miss queries and the best-bottles optimizer on a large catalog.
+
+Run with ``PYTHONPATH=. python benchmarks/bench_purchasing.py``.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from pymixology.inventory.items import Ingredient
+from pymixology.recipes.catalog import RecipeCatalog
+from pymixology.recommendation import suggester
+from pymixology.recommendation.purchasing import PurchasePlanner
+
+SIZE = 100_000
+VOCAB = 400
+STOCKED = 60
+
+
+def main() -> None:
+    rng = random.Random(533)
+    names = [f"ingredient {i}" for i in range(VOCAB)]
+    recipes = []
+    for i in range(SIZE):
+        pool = names[:80] if rng.random() < 0.5 else names
+        picks = rng.sample(pool, rng.randint(2, 6))
+        recipes.append({
+            "name": f"recipe {i}",
+            "ingredients": [{"name": n, "amount": rng.choice([None, 10, 20, 30, 60]), "unit": "ml"} for n in picks],
+        })
+    catalog = RecipeCatalog(recipes)
+    start = time.perf_counter()
+    planner = PurchasePlanner(catalog)
+    print(f"compile: {time.perf_counter() - start:.2f} s for {SIZE:,} recipes")
+
+    stock = [Ingredient(name, rng.choice([5, 15, 100]), "2025-01-01") for name in names[:STOCKED]]
+    start = time.perf_counter()
+    makeable = suggester.get_makeable_cocktails(stock, catalog)
+    print(f"get_makeable_cocktails: {(time.perf_counter() - start) * 1000:.0f} ms ({len(makeable):,} makeable)")
+    for k in (1, 2):
+        start = time.perf_counter()
+        misses = planner.near_misses(stock, k=k)
+        print(f"near_misses k={k}: {(time.perf_counter() - start) * 1000:.0f} ms ({len(misses):,} recipes)")
+    for n in (1, 5, 10):
+        start = time.perf_counter()
+        picks = planner.best_bottles(stock, n)
+        unlocked = sum(len(recipes) for _, recipes in picks)
+        print(f"best_bottles n={n}: {(time.perf_counter() - start) * 1000:.0f} ms ({unlocked:,} unlocked)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Compare print-per-line recipe output with the buffered RecipeRenderer.
+
+Run with ``PYTHONPATH=. python benchmarks/bench_render.py``.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+from pymixology.recipes import catalog
+from pymixology.recipes.render import render_recipes
+
+REPEAT = 400
+
+
+def _print_lines(recipe: dict) -> None:
+    print(f"Recipe: {recipe.get('name', 'Unknown Cocktail')}")
+    print("Ingredients:")
+    for item in recipe.get("ingredients", []):
+        print(f"- {catalog._format_ingredient(catalog._normalize_ingredient(item))}")
+    print("Steps:")
+    for i, step in enumerate(recipe.get("steps", []), start=1):
+        print(f"{i}. {step}")
+
+
+def main() -> None:
+    path = os.path.join(os.path.dirname(catalog.__file__), "..", "data", "cocktails.json")
+    recipes = catalog.load_recipes(path) * REPEAT
+    with tempfile.TemporaryDirectory() as tmp:
+        target = os.path.join(tmp, "menu.txt")
+        with open(target, "w", encoding="utf-8", buffering=1) as f, redirect_stdout(f):
+            start = time.perf_counter()
+            for recipe in recipes:
+                _print_lines(recipe)
+            print_time = time.perf_counter() - start
+        with open(target, "w", encoding="utf-8", buffering=1) as f:
+            start = time.perf_counter()
+            render_recipes(recipes, f)
+            render_time = time.perf_counter() - start
+    print(f"print per line: {print_time:.3f} s for {len(recipes):,} recipes (line-buffered file)")
+    print(f"RecipeRenderer: {render_time:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
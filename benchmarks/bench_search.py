@@ -0,0 +1,43 @@
+"""Compare the linear search_cocktail scan with the n-gram NameIndex.
+
+Run with ``PYTHONPATH=. python benchmarks/bench_search.py``.
+"""
+
+from __future__ import annotations
+
+import random
+import string
+import time
+
+from pymixology.recipes import catalog
+
+SIZE = 200_000
+QUERIES = ["mar", "tini", "sour", "old fash", "zzq", "a"]
+
+
+def _name(rng: random.Random) -> str:
+    words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 8))) for _ in range(rng.randint(1, 3))]
+    return " ".join(words).title()
+
+
+def main() -> None:
+    rng = random.Random(533)
+    recipes = [{"name": _name(rng), "base": "Gin", "ingredients": []} for _ in range(SIZE)]
+    recipes[rng.randrange(SIZE)]["name"] = "Old Fashioned Sour"
+    start = time.perf_counter()
+    compiled = catalog.RecipeCatalog(recipes)
+    print(f"build: {time.perf_counter() - start:.2f} s for {SIZE:,} recipes")
+
+    for query in QUERIES:
+        start = time.perf_counter()
+        expected = catalog.search_cocktail(recipes, query, limit=20)
+        scan = time.perf_counter() - start
+        start = time.perf_counter()
+        found = catalog.search_cocktail(compiled, query, limit=20)
+        indexed = time.perf_counter() - start
+        assert found == expected
+        print(f"{query!r:>12}: scan {scan * 1e3:8.3f} ms, index {indexed * 1e3:8.3f} ms, {len(found)} hits")
+
+
+if __name__ == "__main__":
+    main()
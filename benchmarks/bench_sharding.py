@@ -0,0 +1,35 @@
+"""Compare group roll-ups over plain-list and Inventory shards.
+
+Run with ``PYTHONPATH=. python benchmarks/bench_sharding.py``. Plain lists are
+walked item by item on every report; Inventory shards answer from their
+running aggregates.
+"""
+
+from __future__ import annotations
+
+import time
+
+from pymixology.inventory.container import Inventory
+from pymixology.inventory.items import Ingredient
+from pymixology.inventory.sharding import ShardedInventory
+
+VENUES = 8
+ITEMS_PER_VENUE = 100_000
+
+
+def main() -> None:
+    shards = {
+        f"Venue {v}": [Ingredient(f"Item {i}", float(i % 50), "2030-01-01", value=1.0) for i in range(ITEMS_PER_VENUE)]
+        for v in range(VENUES)
+    }
+    for label, factory in (("plain lists", list), ("Inventory", Inventory)):
+        group = ShardedInventory({location: factory(items) for location, items in shards.items()})
+        start = time.perf_counter()
+        report = group.report(min_threshold=10.0, item_names=["Item 42"])
+        elapsed = time.perf_counter() - start
+        total = sum(partial["total_value"] for partial in report.values())
+        print(f"{label:>12}: {elapsed * 1e3:8.1f} ms for {VENUES * ITEMS_PER_VENUE:,} items (value {total:,.0f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Time "more like this" queries against a brute-force scan on a large catalog.
+
+Run with ``PYTHONPATH=. python benchmarks/bench_similarity.py``.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import tempfile
+import time
+
+from pymixology.recipes.catalog import RecipeCatalog
+from pymixology.recommendation.flavor import FLAVOR_VECTORS
+from pymixology.recommendation.similarity import SimilarityIndex
+
+SIZE = 100_000
+VOCAB = 400
+QUERIES = 50
+K = 10
+
+
+def main() -> None:
+    rng = random.Random(533)
+    names = [f"ingredient {i}" for i in range(VOCAB)]
+    abv_table = {name: rng.choice([0, 0, 0, 15, 40]) for name in names}
+    flavors = sorted(FLAVOR_VECTORS)
+    families = [(rng.sample(names, 6), rng.choice(flavors)) for _ in range(SIZE // 100)]
+    recipes = []
+    for i in range(SIZE):
+        core, flavor = rng.choice(families)
+        picks = sorted(set(rng.sample(core, rng.randint(2, 4))) | set(rng.sample(names, rng.randint(0, 2))))
+        recipes.append({
+            "name": f"recipe {i}",
+            "flavor": flavor if rng.random() < 0.8 else rng.choice(flavors),
+            "ingredients": [{"name": n, "amount": rng.choice([None, 10, 20, 30, 60]), "unit": "ml"} for n in picks],
+        })
+    catalog = RecipeCatalog(recipes)
+    start = time.perf_counter()
+    index = SimilarityIndex(catalog, abv_table=abv_table)
+    print(f"build: {time.perf_counter() - start:.2f} s for {SIZE:,} recipes")
+
+    queries = [f"recipe {rng.randrange(SIZE)}" for _ in range(QUERIES)]
+    start = time.perf_counter()
+    approx = [index.neighbors(name, K) for name in queries]
+    lsh = (time.perf_counter() - start) / QUERIES
+    candidates = sum(len(index.candidates(name, K)) for name in queries) / QUERIES
+    start = time.perf_counter()
+    exact = [index.neighbors(name, K, exact=True) for name in queries[:5]]
+    brute = (time.perf_counter() - start) / 5
+    # Recall of the exact top-k scores, so ties between equal-scoring recipes do not count as misses.
+    hits = sum(
+        sum(1 for a, e in zip(found, truth) if a[1] >= e[1] - 1e-9) for found, truth in zip(approx, exact)
+    )
+    print(f"neighbors: {lsh * 1000:.1f} ms/query ({candidates:,.0f} candidates) vs brute force {brute * 1000:.0f} ms")
+    print(f"recall@{K}: {hits / (5 * K):.0%} on the first 5 queries")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "index.pmxsim")
+        start = time.perf_counter()
+        index.save(path)
+        saved = time.perf_counter() - start
+        start = time.perf_counter()
+        SimilarityIndex.load(path)
+        print(f"save: {saved:.2f} s, load: {time.perf_counter() - start:.2f} s ({os.path.getsize(path) >> 20} MiB)")
+
+    start = time.perf_counter()
+    for i in range(1000):
+        index.add({"name": f"new {i}", "flavor": "sour", "ingredients": rng.sample(names, 4)})
+    print(f"add: {(time.perf_counter() - start) * 1000 / 1000:.2f} ms/recipe")
+
+
+if __name__ == "__main__":
+    main()
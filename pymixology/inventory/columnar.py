@@ -0,0 +1,309 @@
+"""Compact column-oriented ingredient storage for very large inventories."""
+
+from __future__ import annotations
+
+from array import array
+from itertools import compress, repeat
+from operator import eq, lt, mul
+from typing import Dict, Iterator, List, Optional, Union
+
+from .items import Ingredient, Mixer, Spirit
+from ..exceptions import IngredientError, InventoryError
+
+KIND_INGREDIENT = 0
+KIND_SPIRIT = 1
+KIND_MIXER = 2
+
+_KIND_LABELS = {KIND_INGREDIENT: "ingredient", KIND_SPIRIT: "spirit", KIND_MIXER: "mixer"}
+
+
+class IngredientView:
+    """Lightweight handle onto one row of a ColumnarStore."""
+
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store: "ColumnarStore", row: int) -> None:
+        self._store = store
+        self._row = row
+
+    @property
+    def name(self) -> str:
+        return self._store.names[self._row]
+
+    @property
+    def expiry_date(self) -> str:
+        return self._store.expiry_dates[self._row]
+
+    @property
+    def quantity(self) -> float:
+        return self._store.quantity[self._row]
+
+    @quantity.setter
+    def quantity(self, value: float) -> None:
+        self._store.quantity[self._row] = value
+
+    @property
+    def unit_value(self) -> float:
+        return self._store.unit_value[self._row]
+
+    def info(self) -> str:
+        """Return a short description string."""
+        value = self.current_value()
+        value_part = f", Value: {value:.2f}" if value else ""
+        return f"Name: {self.name}, Qty: {self.quantity}{value_part}"
+
+    def use(self, amount: Union[int, float]) -> bool:
+        """Reduce quantity when stock is available.
+
+        Raises:
+            IngredientError: If amount is invalid or insufficient stock.
+        """
+        quantity = self.quantity
+        if amount <= 0:
+            raise IngredientError("Amount to use must be positive.")
+        if amount > quantity:
+            raise IngredientError(f"Insufficient stock. Have {quantity}, need {amount}.")
+        self.quantity = quantity - amount
+        return True
+
+    def current_value(self) -> float:
+        """Return the current estimated value based on remaining quantity."""
+        return self.unit_value * self.quantity
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, IngredientView):
+            return self._store is other._store and self._row == other._row
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((id(self._store), self._row))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r}, {self.quantity!r})"
+
+
+class SpiritView(IngredientView):
+    """Row view exposing the Spirit interface."""
+
+    __slots__ = ()
+
+    @property
+    def abv(self) -> float:
+        return self._store.abv[self._row]
+
+    def get_abv(self) -> float:
+        return self.abv
+
+
+class MixerView(IngredientView):
+    """Row view exposing the Mixer interface."""
+
+    __slots__ = ()
+
+    @property
+    def is_carbonated(self) -> bool:
+        return bool(self._store.carbonated[self._row])
+
+    def is_fizzy(self) -> bool:
+        return self.is_carbonated
+
+
+_VIEW_TYPES = {KIND_INGREDIENT: IngredientView, KIND_SPIRIT: SpiritView, KIND_MIXER: MixerView}
+
+
+class ColumnarStore:
+    """Ingredient store keeping each attribute in its own column.
+
+    Numeric attributes live in typed ``array`` columns, so per-item memory is a
+    few machine words and aggregates run as C-level passes over the columns
+    instead of attribute lookups on individual objects. Rows are exposed as
+    ``__slots__`` views that behave like ``Ingredient``, ``Spirit`` or ``Mixer``.
+    The store is built for appends: removing a row shifts every later row
+    (O(n)), and views of those rows then point one item further on, like list
+    indexes.
+    """
+
+    def __init__(self) -> None:
+        self.names: List[str] = []
+        self.expiry_dates: List[str] = []
+        self.quantity = array("d")
+        self.unit_value = array("d")
+        self.abv = array("d")
+        self.carbonated = array("b")
+        self.kind = array("b")
+        self._rows: Dict[str, int] = {}
+
+    @classmethod
+    def from_items(cls, items) -> "ColumnarStore":
+        """Build a store from existing Ingredient objects."""
+        store = cls()
+        for item in items:
+            store.add(item)
+        return store
+
+    @classmethod
+    def from_columns(cls, names: List[str], quantity: array, unit_value: array) -> "ColumnarStore":
+        """Build a generic-ingredient store straight from prebuilt columns."""
+        store = cls()
+        size = len(names)
+        store.names = list(names)
+        store.expiry_dates = [""] * size
+        store.quantity = array("d", quantity)
+        store.unit_value = array("d", unit_value)
+        store.abv = array("d", bytes(8 * size))
+        store.carbonated = array("b", bytes(size))
+        store.kind = array("b", bytes(size))
+        for row in range(size - 1, -1, -1):
+            store._rows[names[row].lower().strip()] = row
+        return store
+
+    def _append(
+        self, kind: int, name: str, quantity: float, expiry_date: str,
+        unit_value: float, abv: float = 0.0, is_carbonated: bool = False,
+    ) -> IngredientView:
+        row = len(self.names)
+        self.names.append(name)
+        self.expiry_dates.append(expiry_date)
+        self.quantity.append(quantity)
+        self.unit_value.append(unit_value)
+        self.abv.append(abv)
+        self.carbonated.append(1 if is_carbonated else 0)
+        self.kind.append(kind)
+        self._rows.setdefault(name.lower().strip(), row)
+        return _VIEW_TYPES[kind](self, row)
+
+    def add(self, item: Ingredient) -> IngredientView:
+        """Copy an Ingredient object into the store and return its row view."""
+        if not isinstance(item, Ingredient):
+            raise TypeError("item must be an Ingredient.")
+        if isinstance(item, Spirit):
+            return self._append(KIND_SPIRIT, item.name, item.quantity, item.expiry_date, item.unit_value, abv=item.abv)
+        if isinstance(item, Mixer):
+            return self._append(
+                KIND_MIXER, item.name, item.quantity, item.expiry_date, item.unit_value,
+                is_carbonated=item.is_carbonated,
+            )
+        return self._append(KIND_INGREDIENT, item.name, item.quantity, item.expiry_date, item.unit_value)
+
+    def append(self, item: Ingredient) -> None:
+        """List-style alias for add, so manager.add_item works on a store."""
+        self.add(item)
+
+    def add_ingredient(self, name: str, quantity: float, expiry_date: str, value: float = 0.0) -> IngredientView:
+        """Append a generic ingredient row."""
+        return self._append(KIND_INGREDIENT, name, quantity, expiry_date, _unit_value(value, quantity))
+
+    def add_spirit(self, name: str, quantity: float, expiry_date: str, abv: float, value: float = 0.0) -> SpiritView:
+        """Append a spirit row."""
+        return self._append(KIND_SPIRIT, name, quantity, expiry_date, _unit_value(value, quantity), abv=abv)
+
+    def add_mixer(
+        self, name: str, quantity: float, expiry_date: str, is_carbonated: bool, value: float = 0.0,
+    ) -> MixerView:
+        """Append a mixer row."""
+        return self._append(
+            KIND_MIXER, name, quantity, expiry_date, _unit_value(value, quantity), is_carbonated=is_carbonated,
+        )
+
+    def _materialize(self, row: int) -> Ingredient:
+        """Copy one row back out into a standalone Ingredient object."""
+        kind, name, quantity, expiry = self.kind[row], self.names[row], self.quantity[row], self.expiry_dates[row]
+        if kind == KIND_SPIRIT:
+            item: Ingredient = Spirit(name, quantity, expiry, abv=self.abv[row])
+        elif kind == KIND_MIXER:
+            item = Mixer(name, quantity, expiry, is_carbonated=bool(self.carbonated[row]))
+        else:
+            item = Ingredient(name, quantity, expiry)
+        item.unit_value = self.unit_value[row]
+        return item
+
+    def _delete_row(self, row: int) -> Ingredient:
+        item = self._materialize(row)
+        for column in (
+            self.names, self.expiry_dates, self.quantity, self.unit_value, self.abv, self.carbonated, self.kind,
+        ):
+            del column[row]
+        for key, first in self._rows.items():
+            if first > row:
+                self._rows[key] = first - 1
+        key = item.name.lower().strip()
+        if self._rows.get(key) == row:
+            later = (r for r in range(row, len(self.names)) if self.names[r].lower().strip() == key)
+            next_row = next(later, None)
+            if next_row is None:
+                del self._rows[key]
+            else:
+                self._rows[key] = next_row
+        return item
+
+    def remove_name(self, item_name: str) -> Ingredient:
+        """Remove the first row matching the name and return it as an Ingredient.
+
+        Raises:
+            InventoryError: If the item is not found in the store.
+        """
+        row = self._rows.get(item_name.lower().strip())
+        if row is None:
+            raise InventoryError(f"Item '{item_name}' not found in inventory.")
+        return self._delete_row(row)
+
+    def get(self, item_name: str) -> Optional[IngredientView]:
+        """Return the first row matching the name, or None when missing."""
+        row = self._rows.get(item_name.lower().strip())
+        return None if row is None else self[row]
+
+    def check_stock(self, item_name: str) -> float:
+        """Return current quantity for an item, or 0 when missing."""
+        row = self._rows.get(item_name.lower().strip())
+        return self.quantity[row] if row is not None else 0.0
+
+    def total_value(self) -> float:
+        """Return the total estimated value of every row."""
+        return sum(map(mul, self.quantity, self.unit_value))
+
+    def get_shopping_list(self, min_threshold: float) -> List[str]:
+        """List names whose quantity falls below the threshold."""
+        return list(compress(self.names, map(lt, self.quantity, repeat(min_threshold))))
+
+    def value_by_category(self) -> Dict[str, float]:
+        """Return total value per category (ingredient, spirit, mixer)."""
+        return self._sum_by_kind(array("d", map(mul, self.quantity, self.unit_value)))
+
+    def quantity_by_category(self) -> Dict[str, float]:
+        """Return total quantity per category (ingredient, spirit, mixer)."""
+        return self._sum_by_kind(self.quantity)
+
+    def _sum_by_kind(self, values: array) -> Dict[str, float]:
+        return {
+            label: sum(compress(values, map(eq, self.kind, repeat(kind))))
+            for kind, label in _KIND_LABELS.items()
+        }
+
+    def __getitem__(self, row: int) -> IngredientView:
+        if row < 0:
+            row += len(self.names)
+        if not 0 <= row < len(self.names):
+            raise IndexError("ColumnarStore index out of range")
+        return _VIEW_TYPES[self.kind[row]](self, row)
+
+    def __delitem__(self, row: int) -> None:
+        if row < 0:
+            row += len(self.names)
+        if not 0 <= row < len(self.names):
+            raise IndexError("ColumnarStore index out of range")
+        self._delete_row(row)
+
+    def __iter__(self) -> Iterator[IngredientView]:
+        for row, kind in enumerate(self.kind):
+            yield _VIEW_TYPES[kind](self, row)
+
+    def __contains__(self, item_name: object) -> bool:
+        return isinstance(item_name, str) and item_name.lower().strip() in self._rows
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+def _unit_value(value: float, quantity: float) -> float:
+    """Mirror Ingredient's per-unit value calculation."""
+    return (float(value) / quantity) if quantity else 0.0
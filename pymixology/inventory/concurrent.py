@@ -0,0 +1,179 @@
+"""Thread-safe inventory for several terminals pouring at once."""
+
+from __future__ import annotations
+
+import threading
+from contextlib import ExitStack, contextmanager
+from typing import Iterable, Iterator, List, Optional, Union
+
+from .container import Inventory, _normalize_name
+from .items import Ingredient
+from ..exceptions import InventoryError
+
+DEFAULT_STRIPES = 64
+
+
+class ConcurrentInventory(Inventory):
+    """Inventory whose stock changes are guarded by striped locks.
+
+    Each normalized ingredient name maps to one of ``stripes`` locks, so
+    terminals pouring different ingredients rarely contend. Structural changes
+    (adding or removing items) and the running aggregates have their own
+    locks. Pours must go through ``use``, ``compare_and_decrement`` or
+    ``manager.consume_orders``; calling ``Ingredient.use`` directly bypasses
+    the locks.
+
+    Lock order is always stripes (ascending), then structure, then aggregates.
+    Change events (``add_listener``) are queued while a thread holds any of
+    these locks and delivered once its outermost operation has released them,
+    so listeners may call back into the inventory.
+    """
+
+    def __init__(self, items: Optional[Iterable[Ingredient]] = None, stripes: int = DEFAULT_STRIPES) -> None:
+        if stripes <= 0:
+            raise ValueError("stripes must be positive.")
+        self._stripes = [threading.Lock() for _ in range(stripes)]
+        self._structure_lock = threading.RLock()
+        self._aggregate_lock = threading.RLock()
+        self._events = threading.local()
+        super().__init__(items)
+
+    @contextmanager
+    def _deferred_events(self) -> Iterator[None]:
+        """Queue change events until the outermost operation of this thread ends."""
+        events = self._events
+        depth = getattr(events, "depth", 0)
+        if not depth:
+            events.names = []
+        events.depth = depth + 1
+        try:
+            yield
+        finally:
+            events.depth = depth
+            if not depth:
+                names, events.names = events.names, []
+                for name in names:
+                    super()._notify(name)
+
+    def _notify(self, item_name: str) -> None:
+        if getattr(self._events, "depth", 0):
+            self._events.names.append(item_name)
+        else:
+            super()._notify(item_name)
+
+    def _stripe_index(self, item_name: str) -> int:
+        return hash(_normalize_name(item_name)) % len(self._stripes)
+
+    @contextmanager
+    def locked(self, item_names: Iterable[str]) -> Iterator[None]:
+        """Hold the stripe locks of several ingredients at once."""
+        indexes = sorted({self._stripe_index(name) for name in item_names})
+        with self._deferred_events(), ExitStack() as stack:
+            for index in indexes:
+                stack.enter_context(self._stripes[index])
+            yield
+
+    def compare_and_decrement(
+        self, item_name: str, amount: Union[int, float], expected: Optional[float] = None,
+    ) -> bool:
+        """Atomically decrement stock if the precondition still holds.
+
+        Without ``expected`` the decrement happens only when at least amount is
+        in stock. With ``expected`` it also requires the current quantity to
+        equal that value. Returns False instead of raising when the check fails.
+        """
+        if amount <= 0:
+            raise ValueError("Amount to use must be positive.")
+        with self._deferred_events(), self._stripes[self._stripe_index(item_name)]:
+            item = self.get(item_name)
+            if item is None or item.quantity < amount:
+                return False
+            if expected is not None and item.quantity != expected:
+                return False
+            item.use(amount)
+            return True
+
+    def use(self, item_name: str, amount: Union[int, float]) -> bool:
+        """Pour amount of an ingredient under its stripe lock.
+
+        Raises:
+            InventoryError: If the item is not found in the inventory.
+            IngredientError: If amount is invalid or insufficient stock.
+        """
+        with self._deferred_events(), self._stripes[self._stripe_index(item_name)]:
+            item = self.get(item_name)
+            if item is None:
+                raise InventoryError(f"Item '{item_name}' not found in inventory.")
+            return item.use(amount)
+
+    def append(self, item: Ingredient) -> None:
+        with self._deferred_events(), self._structure_lock, self._aggregate_lock:
+            super().append(item)
+
+    def get(self, item_name: str) -> Optional[Ingredient]:
+        with self._structure_lock:
+            return super().get(item_name)
+
+    def remove_name(self, item_name: str) -> Ingredient:
+        with self._deferred_events(), self._stripes[self._stripe_index(item_name)]:
+            with self._structure_lock, self._aggregate_lock:
+                return super().remove_name(item_name)
+
+    def remove(self, item: Ingredient) -> None:
+        with self._deferred_events(), self._stripes[self._stripe_index(item.name)]:
+            with self._structure_lock, self._aggregate_lock:
+                super().remove(item)
+
+    def clear(self) -> None:
+        with self._deferred_events(), ExitStack() as stack:
+            for stripe in self._stripes:
+                stack.enter_context(stripe)
+            with self._structure_lock, self._aggregate_lock:
+                super().clear()
+
+    def _on_item_change(self, item: Ingredient, old_quantity: float) -> None:
+        with self._deferred_events(), self._aggregate_lock:
+            super()._on_item_change(item, old_quantity)
+
+    def _on_price_change(self, item: Ingredient, old_unit_value: float) -> None:
+        with self._aggregate_lock:
+            super()._on_price_change(item, old_unit_value)
+
+    def total_value(self) -> float:
+        with self._aggregate_lock:
+            return super().total_value()
+
+    def get_shopping_list(self, min_threshold: float) -> List[str]:
+        with self._structure_lock, self._aggregate_lock:
+            return super().get_shopping_list(min_threshold)
+
+    def __contains__(self, value: object) -> bool:
+        with self._structure_lock:
+            return super().__contains__(value)
+
+    def names(self) -> List[str]:
+        with self._structure_lock:
+            return super().names()
+
+    def __getitem__(self, position: Union[int, slice]) -> Union[Ingredient, List[Ingredient]]:
+        with self._structure_lock:
+            return super().__getitem__(position)
+
+    def __delitem__(self, position: int) -> None:
+        # Stripe locks come before the structure lock, so look the item up first and
+        # retry if another terminal moved it before the locks were taken.
+        while True:
+            item = self[position]
+            with self._deferred_events(), self._stripes[self._stripe_index(item.name)]:
+                with self._structure_lock, self._aggregate_lock:
+                    if super().__getitem__(position) is item:
+                        super().__delitem__(position)
+                        return
+
+    def __iter__(self) -> Iterator[Ingredient]:
+        with self._structure_lock:
+            return super().__iter__()
+
+    def __len__(self) -> int:
+        with self._structure_lock:
+            return super().__len__()
@@ -0,0 +1,231 @@
+"""Indexed inventory container with constant-time name lookups."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .items import Ingredient
+from ..exceptions import InventoryError
+
+
+def _normalize_name(name: str) -> str:
+    """Return the lookup key used for ingredient names."""
+    return name.lower().strip()
+
+
+class Inventory:
+    """List-like collection of ingredients backed by a normalized-name index.
+
+    Items keep their insertion order and duplicates are allowed, just like a
+    plain list. Lookups, removals and membership tests by name go through a
+    hash index instead of scanning every item. Every item lives in a slot
+    numbered in insertion order; an ascending list of live slots makes
+    ``inventory[i]`` O(1) and ``del inventory[i]`` remove exactly that
+    position.
+
+    The inventory also listens to quantity and price changes on its items and
+    keeps a running total value plus a quantity-ordered key list, so
+    ``total_value`` is O(1) and ``get_shopping_list`` is O(log n + k). The
+    total is kept with compensated summation and resets to exactly 0.0 once
+    the inventory is empty, so it does not drift with floating-point error.
+    Listeners added with ``add_listener`` hear about every stock change
+    (items added, removed or used) as ``callback(inventory, item_name)``.
+    """
+
+    def __init__(self, items: Optional[Iterable[Ingredient]] = None) -> None:
+        self._items: Dict[int, Ingredient] = {}
+        self._order: List[int] = []
+        self._index: Dict[str, Deque[int]] = {}
+        self._members: Dict[int, int] = {}
+        self._by_quantity: List[Tuple[float, int]] = []
+        self._total_value = 0.0
+        self._value_error = 0.0
+        self._next_slot = 0
+        self._listeners: List[Callable[["Inventory", str], None]] = []
+        if items is not None:
+            self.extend(items)
+
+    def append(self, item: Ingredient) -> None:
+        """Add an item at the end of the inventory."""
+        slot = self._next_slot
+        self._next_slot += 1
+        self._items[slot] = item
+        insort(self._order, slot)
+        self._index.setdefault(_normalize_name(item.name), deque()).append(slot)
+        self._add_value(item.current_value())
+        insort(self._by_quantity, (item.quantity, slot))
+        count = self._members.get(id(item), 0)
+        if not count:
+            item.add_listener(self._on_item_change)
+            item.add_price_listener(self._on_price_change)
+        self._members[id(item)] = count + 1
+        self._notify(item.name)
+
+    def add_listener(self, callback: Callable[["Inventory", str], None]) -> None:
+        """Call ``callback(inventory, item_name)`` after every stock change."""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[["Inventory", str], None]) -> None:
+        """Stop notifying a previously added listener."""
+        self._listeners.remove(callback)
+
+    def _notify(self, item_name: str) -> None:
+        for callback in list(self._listeners):
+            callback(self, item_name)
+
+    def _add_value(self, delta: float) -> None:
+        """Add delta to the running total (Neumaier compensated summation)."""
+        total = self._total_value + delta
+        if abs(self._total_value) >= abs(delta):
+            self._value_error += (self._total_value - total) + delta
+        else:
+            self._value_error += (delta - total) + self._total_value
+        self._total_value = total
+
+    def _detach(self, slot: int) -> Ingredient:
+        """Drop a slot from storage and aggregates; the name index is handled by callers."""
+        item = self._items.pop(slot)
+        del self._order[bisect_left(self._order, slot)]
+        if self._items:
+            self._add_value(-item.current_value())
+        else:
+            self._total_value = self._value_error = 0.0
+        self._discard_key(item.quantity, slot)
+        count = self._members[id(item)] - 1
+        if count:
+            self._members[id(item)] = count
+        else:
+            del self._members[id(item)]
+            item.remove_listener(self._on_item_change)
+            item.remove_price_listener(self._on_price_change)
+        self._notify(item.name)
+        return item
+
+    def _discard_key(self, quantity: float, slot: int) -> None:
+        pos = bisect_left(self._by_quantity, (quantity, slot))
+        if pos < len(self._by_quantity) and self._by_quantity[pos] == (quantity, slot):
+            del self._by_quantity[pos]
+
+    def _on_item_change(self, item: Ingredient, old_quantity: float) -> None:
+        for slot in self._index.get(_normalize_name(item.name), ()):
+            if self._items[slot] is item:
+                self._add_value(item.unit_value * (item.quantity - old_quantity))
+                self._discard_key(old_quantity, slot)
+                insort(self._by_quantity, (item.quantity, slot))
+        self._notify(item.name)
+
+    def _on_price_change(self, item: Ingredient, old_unit_value: float) -> None:
+        for slot in self._index.get(_normalize_name(item.name), ()):
+            if self._items[slot] is item:
+                self._add_value((item.unit_value - old_unit_value) * item.quantity)
+
+    def total_value(self) -> float:
+        """Return the running total estimated value of all items."""
+        return self._total_value + self._value_error
+
+    def get_shopping_list(self, min_threshold: float) -> List[str]:
+        """List names that fall below the threshold, in inventory order."""
+        cut = bisect_left(self._by_quantity, (min_threshold, -1))
+        slots = sorted(slot for _, slot in self._by_quantity[:cut])
+        return [self._items[slot].name for slot in slots]
+
+    def extend(self, items: Iterable[Ingredient]) -> None:
+        """Add several items in order."""
+        for item in items:
+            self.append(item)
+
+    def get(self, item_name: str) -> Optional[Ingredient]:
+        """Return the first item matching the name, or None when missing."""
+        slots = self._index.get(_normalize_name(item_name))
+        if not slots:
+            return None
+        return self._items[slots[0]]
+
+    def check_stock(self, item_name: str) -> float:
+        """Return current quantity for an item, or 0 when missing."""
+        item = self.get(item_name)
+        return item.quantity if item is not None else 0.0
+
+    def remove_name(self, item_name: str) -> Ingredient:
+        """Remove and return the first item matching the name.
+
+        Raises:
+            InventoryError: If the item is not found in the inventory.
+        """
+        key = _normalize_name(item_name)
+        slots = self._index.get(key)
+        if not slots:
+            raise InventoryError(f"Item '{item_name}' not found in inventory.")
+        slot = slots.popleft()
+        if not slots:
+            del self._index[key]
+        return self._detach(slot)
+
+    def remove(self, item: Ingredient) -> None:
+        """Remove a specific item object (list.remove semantics).
+
+        Raises:
+            ValueError: If the item is not in the inventory.
+        """
+        for slot in self._index.get(_normalize_name(item.name), ()):
+            if self._items[slot] is item or self._items[slot] == item:
+                self._remove_slot(slot)
+                return
+        raise ValueError("Inventory.remove(x): x not in inventory")
+
+    def _remove_slot(self, slot: int) -> Ingredient:
+        """Remove one slot from the name index, storage and aggregates."""
+        key = _normalize_name(self._items[slot].name)
+        slots = self._index[key]
+        slots.remove(slot)
+        if not slots:
+            del self._index[key]
+        return self._detach(slot)
+
+    def clear(self) -> None:
+        """Remove every item."""
+        for item in {id(item): item for item in self._items.values()}.values():
+            item.remove_listener(self._on_item_change)
+            item.remove_price_listener(self._on_price_change)
+        names = [self._items[slots[0]].name for slots in self._index.values()]
+        self._items.clear()
+        self._order.clear()
+        self._index.clear()
+        self._members.clear()
+        self._by_quantity.clear()
+        self._total_value = self._value_error = 0.0
+        for name in names:
+            self._notify(name)
+
+    def names(self) -> List[str]:
+        """Return the distinct normalized names currently stocked."""
+        return list(self._index)
+
+    def __contains__(self, value: object) -> bool:
+        if isinstance(value, str):
+            return _normalize_name(value) in self._index
+        if isinstance(value, Ingredient):
+            slots = self._index.get(_normalize_name(value.name), ())
+            return any(self._items[slot] is value or self._items[slot] == value for slot in slots)
+        return False
+
+    def __getitem__(self, position: Union[int, slice]) -> Union[Ingredient, List[Ingredient]]:
+        if isinstance(position, slice):
+            return [self._items[slot] for slot in self._order[position]]
+        return self._items[self._order[position]]
+
+    def __delitem__(self, position: Union[int, slice]) -> None:
+        slots = self._order[position]
+        for slot in slots if isinstance(position, slice) else (slots,):
+            self._remove_slot(slot)
+
+    def __iter__(self) -> Iterator[Ingredient]:
+        return iter(list(self._items.values()))
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        return f"Inventory({list(self._items.values())!r})"
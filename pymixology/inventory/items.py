@@ -2,19 +2,103 @@
 
 from __future__ import annotations
 
-from typing import Union
+from datetime import date
+from typing import Any, Callable, Dict, List, Optional, Union
 
+from .lots import DateLike, Lot, LotQueue, parse_expiry
 from ..exceptions import IngredientError
 
 
 class Ingredient:
-    """Generic ingredient with quantity and value tracking."""
+    """Generic ingredient with quantity and value tracking.
+
+    ``quantity`` is a property: every assignment, direct or through ``use``,
+    ``add_lot`` and ``expire_lots``, notifies the quantity listeners.
+    Guards added with ``add_guard`` run before every quantity or price change
+    and may raise to veto it. Listeners and guards are not part of the copy
+    or pickle state, so a copied item starts detached from any inventory.
+    """
 
     def __init__(self, name: str, quantity: float, expiry_date: str, value: float = 0.0) -> None:
         self.name = name
-        self.quantity = quantity
+        self._quantity = quantity
         self.expiry_date = expiry_date
         self.unit_value = (float(value) / quantity) if quantity else 0.0
+        self.lots: Optional[LotQueue] = None
+        self._undated_expiry: Optional[str] = None
+        self._listeners: List[Callable[["Ingredient", float], None]] = []
+        self._price_listeners: List[Callable[["Ingredient", float], None]] = []
+        self._guards: List[Callable[["Ingredient"], None]] = []
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_listeners"] = []
+        state["_price_listeners"] = []
+        state["_guards"] = []
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._listeners = []
+        self._price_listeners = []
+        self._guards = []
+
+    @property
+    def quantity(self) -> float:
+        return self._quantity
+
+    @quantity.setter
+    def quantity(self, value: float) -> None:
+        self._check_guards()
+        old_quantity = self._quantity
+        self._quantity = value
+        self._notify(old_quantity)
+
+    def add_listener(self, callback: Callable[["Ingredient", float], None]) -> None:
+        """Call ``callback(item, old_quantity)`` after every quantity change."""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[["Ingredient", float], None]) -> None:
+        """Stop notifying a previously added listener."""
+        self._listeners.remove(callback)
+
+    def add_guard(self, callback: Callable[["Ingredient"], None]) -> None:
+        """Call ``callback(item)`` before every quantity or price change; raising vetoes it."""
+        self._guards.append(callback)
+
+    def remove_guard(self, callback: Callable[["Ingredient"], None]) -> None:
+        """Stop checking a previously added guard."""
+        self._guards.remove(callback)
+
+    def _check_guards(self) -> None:
+        for callback in self._guards:
+            callback(self)
+
+    def _notify(self, old_quantity: float) -> None:
+        for callback in list(self._listeners):
+            callback(self, old_quantity)
+
+    def add_price_listener(self, callback: Callable[["Ingredient", float], None]) -> None:
+        """Call ``callback(item, old_unit_value)`` after every price change."""
+        self._price_listeners.append(callback)
+
+    def remove_price_listener(self, callback: Callable[["Ingredient", float], None]) -> None:
+        """Stop notifying a previously added price listener."""
+        self._price_listeners.remove(callback)
+
+    def set_unit_value(self, unit_value: float) -> None:
+        """Change the value of one unit of this ingredient and notify listeners.
+
+        Raises:
+            IngredientError: If unit_value is negative.
+        """
+        if unit_value < 0:
+            raise IngredientError("Unit value cannot be negative.")
+        self._check_guards()
+        old_unit_value = self.unit_value
+        self.unit_value = float(unit_value)
+        for callback in list(self._price_listeners):
+            callback(self, old_unit_value)
 
     def info(self) -> str:
         """Return a short description string."""
@@ -32,9 +116,64 @@ class Ingredient:
             raise IngredientError("Amount to use must be positive.")
         if amount > self.quantity:
             raise IngredientError(f"Insufficient stock. Have {self.quantity}, need {amount}.")
+        self._check_guards()
+        if self.lots is not None:
+            self.lots.drain(amount)
+            self._sync_expiry()
         self.quantity -= amount
         return True
 
+    def add_lot(self, quantity: float, expiry_date: DateLike) -> Lot:
+        """Receive a new lot with its own expiry date.
+
+        The first call turns the existing stock into a lot of its own, after
+        which ``use`` always drains the earliest-expiring lot first. Existing
+        stock whose expiry date does not parse (e.g. "N/A") becomes a lot
+        that expires last and keeps its original label.
+
+        Raises:
+            IngredientError: If quantity is not positive or the date is invalid.
+        """
+        if quantity <= 0:
+            raise IngredientError("Lot quantity must be positive.")
+        self._check_guards()
+        lot = self._ensure_lots().add(Lot(quantity, expiry_date))
+        self._sync_expiry()
+        self.quantity += quantity
+        return lot
+
+    def get_lots(self) -> List[Lot]:
+        """Return current lots, earliest expiry first."""
+        return list(self._ensure_lots())
+
+    def expire_lots(self, today: DateLike) -> float:
+        """Discard lots that expired before today and return the quantity lost."""
+        today = parse_expiry(today)
+        self._check_guards()
+        lost = self._ensure_lots().expire(today)
+        if lost:
+            self._sync_expiry()
+            self.quantity = max(self.quantity - lost, 0.0)
+        return lost
+
+    def _ensure_lots(self) -> LotQueue:
+        if self.lots is None:
+            self.lots = LotQueue()
+            if self.quantity > 0:
+                try:
+                    expiry = parse_expiry(self.expiry_date)
+                except IngredientError:
+                    self._undated_expiry = self.expiry_date
+                    expiry = date.max
+                self.lots.add(Lot(self.quantity, expiry))
+        return self.lots
+
+    def _sync_expiry(self) -> None:
+        head = self.lots.peek() if self.lots is not None else None
+        if head is not None:
+            undated = head.expiry == date.max and self._undated_expiry is not None
+            self.expiry_date = self._undated_expiry if undated else head.expiry.isoformat()
+
     def current_value(self) -> float:
         """Return the current estimated value based on remaining quantity."""
         return self.unit_value * self.quantity
@@ -0,0 +1,282 @@
+"""Durable inventory backed by an append-only journal and compacted snapshots."""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import Iterator, Optional, Tuple, Union
+
+from .columnar import KIND_INGREDIENT, KIND_MIXER, KIND_SPIRIT
+from .container import Inventory, _normalize_name
+from .items import Ingredient, Mixer, Spirit
+from ..exceptions import InventoryError
+
+OP_ADD = 1
+OP_REMOVE = 2
+OP_QUANTITY = 3
+OP_CLEAR = 4
+OP_PRICE = 5
+
+SNAPSHOT_NAME = "inventory.snap"
+JOURNAL_NAME = "inventory.journal"
+
+_SNAPSHOT_MAGIC = b"PMXS"
+_SNAPSHOT_VERSION = 1
+# magic, version, last journal sequence, next slot, item count
+_SNAPSHOT_HEADER = struct.Struct("<4sHQQQ")
+# crc32 of the rest, op, sequence, payload length
+_RECORD_HEADER = struct.Struct("<IBQI")
+# slot, kind, quantity, unit value, abv, carbonated, name length, expiry length
+_ITEM = struct.Struct("<QBdddBHH")
+_SLOT = struct.Struct("<Q")
+_SLOT_QUANTITY = struct.Struct("<Qd")
+_SLOT_PRICE = struct.Struct("<Qd")
+
+
+def _encode_item(slot: int, item: Ingredient) -> bytes:
+    name = item.name.encode("utf-8")
+    expiry = str(item.expiry_date).encode("utf-8")
+    if isinstance(item, Spirit):
+        kind, abv, carbonated = KIND_SPIRIT, float(item.abv), 0
+    elif isinstance(item, Mixer):
+        kind, abv, carbonated = KIND_MIXER, 0.0, 1 if item.is_carbonated else 0
+    else:
+        kind, abv, carbonated = KIND_INGREDIENT, 0.0, 0
+    header = _ITEM.pack(
+        slot, kind, float(item.quantity), float(item.unit_value), abv, carbonated, len(name), len(expiry),
+    )
+    return header + name + expiry
+
+
+def _decode_item(buffer, offset: int) -> Tuple[int, Ingredient, int]:
+    """Decode one item at offset; return ``(slot, item, next_offset)``."""
+    slot, kind, quantity, unit_value, abv, carbonated, name_len, expiry_len = _ITEM.unpack_from(buffer, offset)
+    offset += _ITEM.size
+    name = bytes(buffer[offset:offset + name_len]).decode("utf-8")
+    offset += name_len
+    expiry = bytes(buffer[offset:offset + expiry_len]).decode("utf-8")
+    offset += expiry_len
+    if kind == KIND_SPIRIT:
+        item: Ingredient = Spirit(name, quantity, expiry, abv=abv)
+    elif kind == KIND_MIXER:
+        item = Mixer(name, quantity, expiry, is_carbonated=bool(carbonated))
+    else:
+        item = Ingredient(name, quantity, expiry)
+    item.unit_value = unit_value
+    return slot, item, offset
+
+
+class JournaledInventory(Inventory):
+    """Inventory that persists every change to disk.
+
+    Each add, removal, quantity and price change is appended to a binary journal as
+    a checksummed record. ``snapshot`` writes the whole inventory to a compact
+    snapshot file and starts a fresh journal. Opening the inventory again
+    memory-maps the snapshot and replays only the journal records written after
+    it, so recovery cost follows the changes since the last snapshot. Lot
+    details are not persisted; each item is restored with its total quantity.
+
+    After ``close`` every change, including ``use`` on a stocked item, raises
+    InventoryError before anything is modified, so memory and disk agree.
+    """
+
+    def __init__(
+        self, directory: Union[str, Path], snapshot_every: Optional[int] = 10_000, fsync: bool = False,
+    ) -> None:
+        super().__init__()
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.snapshot_every = snapshot_every
+        self.fsync = fsync
+        self._seq = 0
+        self._records_since_snapshot = 0
+        self._replaying = True
+        self._journal = None
+        self._recover()
+        self._replaying = False
+        self._journal = open(self._journal_path, "ab")
+
+    @property
+    def _snapshot_path(self) -> Path:
+        return self.directory / SNAPSHOT_NAME
+
+    @property
+    def _journal_path(self) -> Path:
+        return self.directory / JOURNAL_NAME
+
+    # -- recovery -----------------------------------------------------------------
+
+    def _recover(self) -> None:
+        snapshot_seq = self._load_snapshot()
+        self._seq = snapshot_seq
+        valid_end = 0
+        for op, seq, payload, end in self._read_journal():
+            valid_end = end
+            if seq <= snapshot_seq:
+                continue
+            self._apply(op, payload)
+            self._seq = seq
+            self._records_since_snapshot += 1
+        if self._journal_path.exists() and self._journal_path.stat().st_size > valid_end:
+            # Drop a torn tail left by a crash mid-write.
+            with open(self._journal_path, "r+b") as f:
+                f.truncate(valid_end)
+
+    def _load_snapshot(self) -> int:
+        path = self._snapshot_path
+        if not path.exists() or path.stat().st_size == 0:
+            return 0
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            magic, version, seq, next_slot, count = _SNAPSHOT_HEADER.unpack_from(view, 0)
+            if magic != _SNAPSHOT_MAGIC or version != _SNAPSHOT_VERSION:
+                raise InventoryError(f"Unrecognized inventory snapshot: {path}")
+            offset = _SNAPSHOT_HEADER.size
+            for _ in range(count):
+                slot, item, offset = _decode_item(view, offset)
+                self._restore(slot, item)
+        self._next_slot = max(self._next_slot, next_slot)
+        return seq
+
+    def _read_journal(self) -> Iterator[Tuple[int, int, bytes, int]]:
+        path = self._journal_path
+        if not path.exists():
+            return
+        data = path.read_bytes()
+        offset = 0
+        while offset + _RECORD_HEADER.size <= len(data):
+            crc, op, seq, length = _RECORD_HEADER.unpack_from(data, offset)
+            start = offset + _RECORD_HEADER.size
+            end = start + length
+            if end > len(data):
+                break
+            payload = data[start:end]
+            if zlib.crc32(data[offset + 4:end]) != crc:
+                break
+            yield op, seq, payload, end
+            offset = end
+
+    def _restore(self, slot: int, item: Ingredient) -> None:
+        self._next_slot = slot
+        super().append(item)
+        self._guard(item)
+
+    def _guard(self, item: Ingredient) -> None:
+        if self._members[id(item)] == 1:
+            item.add_guard(self._check_open)
+
+    def _check_open(self, item: Optional[Ingredient] = None) -> None:
+        if self._journal is None and not self._replaying:
+            raise InventoryError(f"Inventory journal in {self.directory} is closed.")
+
+    def _apply(self, op: int, payload: bytes) -> None:
+        if op == OP_ADD:
+            slot, item, _ = _decode_item(payload, 0)
+            self._restore(slot, item)
+        elif op == OP_REMOVE:
+            (slot,) = _SLOT.unpack(payload)
+            self._remove_slot(slot)
+        elif op == OP_QUANTITY:
+            slot, quantity = _SLOT_QUANTITY.unpack(payload)
+            self._items[slot].quantity = quantity
+        elif op == OP_PRICE:
+            slot, unit_value = _SLOT_PRICE.unpack(payload)
+            item = self._items[slot]
+            old_unit_value = item.unit_value
+            item.unit_value = unit_value
+            self._on_price_change(item, old_unit_value)
+        elif op == OP_CLEAR:
+            self.clear()
+        else:
+            raise InventoryError(f"Unknown journal operation: {op}")
+
+    # -- journaling ---------------------------------------------------------------
+
+    def _write(self, op: int, payload: bytes) -> None:
+        if self._replaying:
+            return
+        self._seq += 1
+        body = struct.pack("<BQI", op, self._seq, len(payload)) + payload
+        self._journal.write(struct.pack("<I", zlib.crc32(body)) + body)
+        self._journal.flush()
+        if self.fsync:
+            os.fsync(self._journal.fileno())
+        self._records_since_snapshot += 1
+        if self.snapshot_every and self._records_since_snapshot >= self.snapshot_every:
+            self.snapshot()
+
+    def append(self, item: Ingredient) -> None:
+        self._check_open()
+        slot = self._next_slot
+        super().append(item)
+        self._guard(item)
+        self._write(OP_ADD, _encode_item(slot, item))
+
+    def remove_name(self, item_name: str) -> Ingredient:
+        self._check_open()
+        return super().remove_name(item_name)
+
+    def _remove_slot(self, slot: int) -> Ingredient:
+        self._check_open()
+        return super()._remove_slot(slot)
+
+    def _detach(self, slot: int) -> Ingredient:
+        item = super()._detach(slot)
+        if id(item) not in self._members:
+            item.remove_guard(self._check_open)
+        self._write(OP_REMOVE, _SLOT.pack(slot))
+        return item
+
+    def _on_item_change(self, item: Ingredient, old_quantity: float) -> None:
+        super()._on_item_change(item, old_quantity)
+        for slot in self._index.get(_normalize_name(item.name), ()):
+            if self._items[slot] is item:
+                self._write(OP_QUANTITY, _SLOT_QUANTITY.pack(slot, float(item.quantity)))
+
+    def _on_price_change(self, item: Ingredient, old_unit_value: float) -> None:
+        super()._on_price_change(item, old_unit_value)
+        for slot in self._index.get(_normalize_name(item.name), ()):
+            if self._items[slot] is item:
+                self._write(OP_PRICE, _SLOT_PRICE.pack(slot, float(item.unit_value)))
+
+    def clear(self) -> None:
+        self._check_open()
+        for item in {id(item): item for item in self._items.values()}.values():
+            item.remove_guard(self._check_open)
+        super().clear()
+        self._write(OP_CLEAR, b"")
+
+    # -- compaction ---------------------------------------------------------------
+
+    def snapshot(self) -> None:
+        """Write a compacted snapshot and start a fresh journal."""
+        tmp_path = self._snapshot_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(_SNAPSHOT_HEADER.pack(
+                _SNAPSHOT_MAGIC, _SNAPSHOT_VERSION, self._seq, self._next_slot, len(self._items),
+            ))
+            for slot, item in self._items.items():
+                f.write(_encode_item(slot, item))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._snapshot_path)
+        # Records up to self._seq are covered by the snapshot; a crash before the
+        # truncate below is harmless because replay skips them by sequence.
+        if self._journal is not None:
+            self._journal.close()
+        self._journal = open(self._journal_path, "wb")
+        self._records_since_snapshot = 0
+
+    def close(self) -> None:
+        """Flush and close the journal file."""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def __enter__(self) -> "JournaledInventory":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
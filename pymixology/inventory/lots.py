@@ -0,0 +1,199 @@
+"""Lot-level stock tracking ordered by expiry date."""
+
+from __future__ import annotations
+
+import heapq
+from datetime import date, datetime, timedelta
+from itertools import count
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple, Union
+
+from ..exceptions import IngredientError
+
+if TYPE_CHECKING:
+    from .items import Ingredient
+
+DateLike = Union[str, date, datetime]
+
+_lot_sequence = count()
+
+
+def parse_expiry(value: DateLike) -> date:
+    """Parse an expiry date given as an ISO string, date or datetime.
+
+    Raises:
+        IngredientError: If the value is not a valid date.
+    """
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(str(value).strip())
+    except ValueError as e:
+        raise IngredientError(f"Invalid expiry date: {value!r}") from e
+
+
+class Lot:
+    """A quantity of one ingredient sharing a single expiry date."""
+
+    __slots__ = ("quantity", "expiry", "seq")
+
+    def __init__(self, quantity: float, expiry: DateLike) -> None:
+        self.quantity = float(quantity)
+        self.expiry = parse_expiry(expiry)
+        self.seq = next(_lot_sequence)
+
+    def __repr__(self) -> str:
+        return f"Lot({self.quantity!r}, {self.expiry.isoformat()!r})"
+
+
+def _heap_prefix(heap: List[tuple], cutoff: date) -> Iterator[tuple]:
+    """Yield heap entries with an expiry on or before cutoff.
+
+    Walks only the part of the heap whose keys are within the cutoff, so the
+    cost is proportional to the number of matches rather than the heap size.
+    """
+    stack = [0]
+    size = len(heap)
+    while stack:
+        i = stack.pop()
+        if i < size and heap[i][0] <= cutoff:
+            yield heap[i]
+            stack.append(2 * i + 1)
+            stack.append(2 * i + 2)
+
+
+class LotQueue:
+    """Min-heap of lots for one ingredient, earliest expiry first."""
+
+    def __init__(self) -> None:
+        self._heap: List[Tuple[date, int, Lot]] = []
+
+    def add(self, lot: Lot) -> Lot:
+        """Push a lot onto the queue."""
+        heapq.heappush(self._heap, (lot.expiry, lot.seq, lot))
+        return lot
+
+    def peek(self) -> Optional[Lot]:
+        """Return the earliest-expiring lot without removing it."""
+        return self._heap[0][2] if self._heap else None
+
+    def drain(self, amount: float) -> List[Tuple[Lot, float]]:
+        """Take amount from the earliest-expiring lots first.
+
+        Returns the ``(lot, taken)`` pairs that were drawn from. Emptied lots
+        leave the queue.
+        """
+        taken: List[Tuple[Lot, float]] = []
+        remaining = amount
+        while remaining > 0 and self._heap:
+            lot = self._heap[0][2]
+            used = min(lot.quantity, remaining)
+            lot.quantity -= used
+            remaining -= used
+            taken.append((lot, used))
+            if lot.quantity <= 0:
+                lot.quantity = 0.0
+                heapq.heappop(self._heap)
+        return taken
+
+    def expire(self, today: date) -> float:
+        """Drop every lot expiring before today and return the quantity lost."""
+        lost = 0.0
+        while self._heap and self._heap[0][0] < today:
+            lot = heapq.heappop(self._heap)[2]
+            lost += lot.quantity
+            lot.quantity = 0.0
+        return lost
+
+    def expiring_by(self, cutoff: date) -> List[Lot]:
+        """Return lots expiring on or before cutoff, earliest first."""
+        return [lot for _, _, lot in sorted(_heap_prefix(self._heap, cutoff))]
+
+    def total(self) -> float:
+        """Return the summed quantity of all lots."""
+        return sum(lot.quantity for _, _, lot in self._heap)
+
+    def __iter__(self) -> Iterator[Lot]:
+        return (lot for _, _, lot in sorted(self._heap))
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+class ExpiryIndex:
+    """Inventory-wide priority index of lots across many ingredients.
+
+    Lots drained by ``Ingredient.use`` are dropped lazily the next time they
+    reach the front of the heap, so queries and sweeps cost O(k log n) in the
+    number of matching lots instead of a full scan.
+    """
+
+    def __init__(self, items: Optional[List["Ingredient"]] = None) -> None:
+        self._heap: List[Tuple[date, int, Lot, "Ingredient"]] = []
+        self._tracked: Dict[int, "Ingredient"] = {}
+        for item in items or ():
+            self.track(item)
+
+    def track(self, item: "Ingredient") -> None:
+        """Start indexing every current lot of an ingredient."""
+        self._tracked[id(item)] = item
+        for lot in item.get_lots():
+            heapq.heappush(self._heap, (lot.expiry, lot.seq, lot, item))
+
+    def untrack(self, item: "Ingredient") -> None:
+        """Stop reporting lots of an ingredient (entries are dropped lazily)."""
+        self._tracked.pop(id(item), None)
+
+    def add_lot(self, item: "Ingredient", quantity: float, expiry_date: DateLike) -> Lot:
+        """Receive a new lot into an ingredient and index it."""
+        if id(item) not in self._tracked:
+            self.track(item)
+        lot = item.add_lot(quantity, expiry_date)
+        heapq.heappush(self._heap, (lot.expiry, lot.seq, lot, item))
+        return lot
+
+    def _live(self, entry: tuple) -> bool:
+        return entry[2].quantity > 0 and self._tracked.get(id(entry[3])) is entry[3]
+
+    def _prune(self) -> None:
+        while self._heap and not self._live(self._heap[0]):
+            heapq.heappop(self._heap)
+
+    def next_to_expire(self) -> Optional[Tuple["Ingredient", Lot]]:
+        """Return the globally earliest-expiring ``(item, lot)`` pair."""
+        self._prune()
+        if not self._heap:
+            return None
+        _, _, lot, item = self._heap[0]
+        return item, lot
+
+    def expiring_within(self, days: int, today: Optional[DateLike] = None) -> List[Tuple["Ingredient", Lot]]:
+        """Return ``(item, lot)`` pairs expiring within days of today, earliest first."""
+        start = parse_expiry(today) if today is not None else date.today()
+        cutoff = start + timedelta(days=days)
+        self._prune()
+        entries = sorted(
+            (entry for entry in _heap_prefix(self._heap, cutoff) if self._live(entry)),
+            key=lambda entry: (entry[0], entry[1]),
+        )
+        return [(item, lot) for _, _, lot, item in entries]
+
+    def sweep(self, today: Optional[DateLike] = None) -> Dict[str, float]:
+        """Write off every lot that expired before today.
+
+        Returns the quantity discarded per ingredient name.
+        """
+        current = parse_expiry(today) if today is not None else date.today()
+        discarded: Dict[str, float] = {}
+        while self._heap and self._heap[0][0] < current:
+            _, _, lot, item = heapq.heappop(self._heap)
+            if not self._live((None, None, lot, item)):
+                continue
+            lost = item.expire_lots(current)
+            if lost:
+                discarded[item.name] = discarded.get(item.name, 0.0) + lost
+        return discarded
+
+    def __len__(self) -> int:
+        return len(self._heap)
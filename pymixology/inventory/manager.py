@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
-from typing import List
+from collections.abc import Mapping
+from contextlib import nullcontext
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
+from .columnar import ColumnarStore
+from .concurrent import ConcurrentInventory
+from .container import Inventory
 from .items import Ingredient
 from ..exceptions import InventoryError
 
@@ -22,6 +27,9 @@ def remove_item(inventory_list: List[Ingredient], item_name: str) -> bool:
     Raises:
         InventoryError: If the item is not found in the inventory.
     """
+    if isinstance(inventory_list, (Inventory, ColumnarStore)):
+        inventory_list.remove_name(item_name)
+        return True
     target = item_name.lower().strip()
     for idx, item in enumerate(inventory_list):
         if item.name.lower() == target:
@@ -32,6 +40,8 @@ def remove_item(inventory_list: List[Ingredient], item_name: str) -> bool:
 
 def check_stock(inventory_list: List[Ingredient], item_name: str) -> float:
     """Return current quantity for an item, or 0 when missing."""
+    if isinstance(inventory_list, (Inventory, ColumnarStore)):
+        return inventory_list.check_stock(item_name)
     target = item_name.lower().strip()
     for item in inventory_list:
         if item.name.lower() == target:
@@ -41,11 +51,87 @@ def check_stock(inventory_list: List[Ingredient], item_name: str) -> float:
 
 def get_shopping_list(inventory_list: List[Ingredient], min_threshold: float) -> List[str]:
     """List names that fall below the provided threshold."""
+    if isinstance(inventory_list, (Inventory, ColumnarStore)):
+        return inventory_list.get_shopping_list(min_threshold)
     return [item.name for item in inventory_list if item.quantity < min_threshold]
 
 
 def total_value(inventory_list: List[Ingredient]) -> float:
     """Return the total estimated value of all inventory items."""
+    if isinstance(inventory_list, (Inventory, ColumnarStore)):
+        return inventory_list.total_value()
     return sum(item.current_value() for item in inventory_list)
 
+
+def consume(inventory_list: List[Ingredient], recipe: Dict[str, Any], servings: int = 1) -> bool:
+    """Pour a recipe, decrementing every ingredient or none of them.
+
+    Raises:
+        InventoryError: If any ingredient is missing or short on stock.
+    """
+    return consume_orders(inventory_list, [(recipe, servings)])
+
+
+def consume_orders(
+    inventory_list: List[Ingredient],
+    orders: Iterable[Union[Dict[str, Any], Tuple[Dict[str, Any], int]]],
+) -> bool:
+    """Pour a batch of orders atomically.
+
+    Each order is a recipe mapping (one serving), such as a dict or a
+    ``ScaledRecipe`` view, or a ``(recipe, servings)`` pair.
+    Requirements are summed per ingredient and checked in a single pass before
+    any stock is touched. Ingredients without a numeric amount are not tracked.
+    On a ConcurrentInventory the stripe locks of every ingredient involved are
+    held for the whole check-and-apply.
+
+    Raises:
+        ValueError: If an order asks for a non-positive number of servings.
+        InventoryError: If any ingredient is missing or short on stock.
+    """
+    required: Dict[str, float] = {}
+    for order in orders:
+        recipe, servings = (order, 1) if isinstance(order, Mapping) else order
+        if servings <= 0:
+            raise ValueError("Servings must be positive.")
+        factor = servings / (recipe.get("servings", 1) or 1)
+        for ingredient in recipe.get("ingredients", []):
+            if not isinstance(ingredient, Mapping):
+                continue
+            amount = ingredient.get("amount")
+            if isinstance(amount, (int, float)) and amount > 0:
+                key = str(ingredient.get("name", "")).lower().strip()
+                required[key] = required.get(key, 0.0) + amount * factor
+
+    if isinstance(inventory_list, ConcurrentInventory):
+        guard = inventory_list.locked(required)
+    else:
+        guard = nullcontext()
+    find = _item_finder(inventory_list)
+    with guard:
+        plan = []
+        shortages = []
+        for key, amount in required.items():
+            item = find(key)
+            have = item.quantity if item is not None else 0.0
+            if amount > have:
+                shortages.append(f"{key} (have {have}, need {amount})")
+            else:
+                plan.append((item, amount))
+        if shortages:
+            raise InventoryError("Insufficient stock for: " + ", ".join(shortages))
+        for item, amount in plan:
+            item.use(amount)
+    return True
+
+
+def _item_finder(inventory_list: List[Ingredient]) -> Callable[[str], Optional[Ingredient]]:
+    """Return a name -> first matching item lookup for any inventory type."""
+    if isinstance(inventory_list, (Inventory, ColumnarStore)):
+        return inventory_list.get
+    lookup: Dict[str, Ingredient] = {}
+    for item in inventory_list:
+        lookup.setdefault(item.name.lower(), item)
+    return lookup.get
+
 # Day 2 Update: Error handling review
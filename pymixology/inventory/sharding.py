@@ -0,0 +1,113 @@
+"""Multi-venue inventory split into one shard per location."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from . import manager
+from .items import Ingredient
+from ..exceptions import InventoryError
+
+
+def _report(inventory_list: Any, min_threshold: Optional[float], item_names: Tuple[str, ...]) -> Dict[str, Any]:
+    """Compute one shard's partial roll-up with the manager functions."""
+    return {
+        "total_value": manager.total_value(inventory_list),
+        "shopping_list": (
+            manager.get_shopping_list(inventory_list, min_threshold) if min_threshold is not None else []
+        ),
+        "stock": {name: manager.check_stock(inventory_list, name) for name in item_names},
+    }
+
+
+class ShardedInventory:
+    """Inventories for many venues, keyed by location.
+
+    Each shard is any inventory the manager functions accept (a plain list,
+    ``Inventory``, ``ColumnarStore`` ...). Group-wide roll-ups compute one
+    partial report per shard and merge them, in this process: an
+    ``Inventory`` shard answers from its running aggregates, so shipping it
+    to worker processes would cost far more than the report itself. Keep
+    large venues in ``Inventory`` or ``ColumnarStore`` shards for fast
+    roll-ups.
+    """
+
+    def __init__(self, shards: Optional[Dict[str, Any]] = None) -> None:
+        self._shards: Dict[str, Any] = dict(shards or {})
+
+    def add_location(self, location: str, inventory_list: Optional[Any] = None) -> Any:
+        """Register a venue and return its inventory.
+
+        Raises:
+            InventoryError: If the location already exists.
+        """
+        if location in self._shards:
+            raise InventoryError(f"Location '{location}' already exists.")
+        self._shards[location] = inventory_list if inventory_list is not None else []
+        return self._shards[location]
+
+    def shard(self, location: str) -> Any:
+        """Return the inventory of one venue.
+
+        Raises:
+            InventoryError: If the location is unknown.
+        """
+        try:
+            return self._shards[location]
+        except KeyError:
+            raise InventoryError(f"Unknown location '{location}'.") from None
+
+    def locations(self) -> List[str]:
+        """Return every registered location."""
+        return list(self._shards)
+
+    def add_item(self, location: str, item_object: Ingredient) -> bool:
+        """Add an item to one venue."""
+        return manager.add_item(self.shard(location), item_object)
+
+    def remove_item(self, location: str, item_name: str) -> bool:
+        """Remove an item from one venue."""
+        return manager.remove_item(self.shard(location), item_name)
+
+    def check_stock(self, location: str, item_name: str) -> float:
+        """Return one venue's quantity of an item."""
+        return manager.check_stock(self.shard(location), item_name)
+
+    def report(
+        self, min_threshold: Optional[float] = None, item_names: Iterable[str] = (),
+    ) -> Dict[str, Dict[str, Any]]:
+        """Return each venue's partial roll-up."""
+        names = tuple(item_names)
+        return {location: _report(shard, min_threshold, names) for location, shard in self._shards.items()}
+
+    def total_value(self) -> float:
+        """Return the group-wide estimated value."""
+        return sum(partial["total_value"] for partial in self.report().values())
+
+    def value_by_location(self) -> Dict[str, float]:
+        """Return the estimated value of each venue."""
+        return {location: partial["total_value"] for location, partial in self.report().items()}
+
+    def get_shopping_list(self, min_threshold: float) -> Dict[str, List[str]]:
+        """Return the low-stock names of each venue."""
+        return {
+            location: partial["shopping_list"]
+            for location, partial in self.report(min_threshold=min_threshold).items()
+        }
+
+    def combined_shopping_list(self, min_threshold: float) -> List[str]:
+        """Return the distinct low-stock names across every venue."""
+        combined: Dict[str, str] = {}
+        for names in self.get_shopping_list(min_threshold).values():
+            for name in names:
+                combined.setdefault(name.lower().strip(), name)
+        return list(combined.values())
+
+    def where_in_stock(self, item_name: str, min_quantity: float = 0.0) -> Dict[str, float]:
+        """Return venues holding more than min_quantity of an item."""
+        partials = self.report(item_names=[item_name])
+        stock = {location: partial["stock"][item_name] for location, partial in partials.items()}
+        return {location: quantity for location, quantity in stock.items() if quantity > min_quantity}
+
+    def __len__(self) -> int:
+        return len(self._shards)
@@ -0,0 +1,135 @@
+"""Opt-in binary cache of compiled recipe catalogs."""
+
+from __future__ import annotations
+
+import hashlib
+import marshal
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+from .catalog import RecipeCatalog, iter_recipes
+from .units import DEFAULT_REGISTRY
+
+CACHE_SUFFIX = ".pmxcache"
+
+_MAGIC = b"PMXC"
+_VERSION = 4
+# magic, format version, marshal version, source mtime (ns), source size, sha256 of source
+_HEADER = struct.Struct("<4sHHqq32s")
+_NO_DIGEST = bytes(32)
+
+
+def cache_path(filepath: Union[str, Path], unit: Optional[str] = None) -> Path:
+    """Return where the cache for a recipe file lives (next to the source).
+
+    Catalogs normalized to a unit get their own cache file per unit.
+    """
+    path = Path(filepath)
+    tag = f".{unit}" if unit else ""
+    return path.with_name(path.name + tag + CACHE_SUFFIX)
+
+
+def _source_digest(path: Path) -> bytes:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.digest()
+
+
+def _fingerprint(path: Path, validate: str) -> Tuple[int, int, bytes]:
+    stat = path.stat()
+    digest = _source_digest(path) if validate == "hash" else _NO_DIGEST
+    return stat.st_mtime_ns, stat.st_size, digest
+
+
+def read_cache(
+    filepath: Union[str, Path], validate: str = "mtime", unit: Optional[str] = None,
+) -> Optional[RecipeCatalog]:
+    """Return the cached catalog, or None when missing, stale or unreadable.
+
+    ``validate="mtime"`` trusts the source's modification time and size;
+    ``validate="hash"`` compares a SHA-256 of the source contents instead.
+    """
+    source = Path(filepath)
+    target = cache_path(source, unit)
+    try:
+        with target.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            magic, version, marshal_version, mtime_ns, size, digest = _HEADER.unpack_from(view, 0)
+            if magic != _MAGIC or version != _VERSION or marshal_version != marshal.version:
+                return None
+            stat = source.stat()
+            if validate == "hash":
+                if size != stat.st_size or digest != _source_digest(source):
+                    return None
+            elif (mtime_ns, size) != (stat.st_mtime_ns, stat.st_size):
+                return None
+            with memoryview(view) as payload:
+                state = marshal.loads(payload[_HEADER.size:])
+    except (OSError, ValueError, EOFError, TypeError, struct.error):
+        return None
+    return RecipeCatalog.from_state(state)
+
+
+def write_cache(
+    filepath: Union[str, Path],
+    catalog: RecipeCatalog,
+    validate: str = "mtime",
+    unit: Optional[str] = None,
+    fingerprint: Optional[Tuple[int, int, bytes]] = None,
+) -> bool:
+    """Write the compiled catalog next to its source; return False if that fails.
+
+    Pass the source ``fingerprint`` taken before the catalog was parsed, so a
+    source edited during the parse leaves a cache that reads as stale; by
+    default the source is fingerprinted now.
+    """
+    source = Path(filepath)
+    target = cache_path(source, unit)
+    tmp = target.with_name(target.name + ".tmp")
+    try:
+        mtime_ns, size, digest = fingerprint if fingerprint is not None else _fingerprint(source, validate)
+        with tmp.open("wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, marshal.version, mtime_ns, size, digest))
+            marshal.dump(catalog.to_state(), f)
+        os.replace(tmp, target)
+    except (OSError, ValueError):
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        return False
+    return True
+
+
+def load_cached_catalog(
+    filepath: Union[str, Path], validate: str = "mtime", unit: Optional[str] = None,
+) -> RecipeCatalog:
+    """Load a compiled catalog, from the cache when it is still valid.
+
+    On a miss the source is parsed with ``iter_recipes`` and the cache is
+    refreshed; a cache that cannot be written is silently skipped.
+
+    Raises:
+        DataLoadError: If the source cannot be read or parsed.
+        RecipeError: If unit is not a known unit.
+    """
+    if validate not in ("mtime", "hash"):
+        raise ValueError("validate must be 'mtime' or 'hash'.")
+    if unit is not None:
+        unit = DEFAULT_REGISTRY.canonical(unit)
+    catalog = read_cache(filepath, validate, unit)
+    if catalog is not None:
+        return catalog
+    # Fingerprint before parsing: if the source changes meanwhile, the cache is stale on the next read.
+    try:
+        fingerprint = _fingerprint(Path(filepath), validate)
+    except OSError:
+        fingerprint = None
+    catalog = RecipeCatalog(iter_recipes(filepath, unit=unit))
+    if fingerprint is not None:
+        write_cache(filepath, catalog, validate, unit, fingerprint)
+    return catalog
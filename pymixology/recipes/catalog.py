@@ -3,37 +3,468 @@
 from __future__ import annotations
 
 import json
+import operator
+import re
+import sys
+from array import array
+from collections.abc import Sequence
 from pathlib import Path
-from typing import Iterable, List, Dict, Any
+from typing import Iterable, Iterator, List, Dict, Any, Optional, TextIO, Tuple, Union
 
+from .search import NameIndex
+from .units import DEFAULT_REGISTRY
+from .vocab import EncodedRecipes, IngredientVocabulary, _normalize_key
 from ..exceptions import DataLoadError
 
+_CHUNK_SIZE = 1 << 16
+_JSON_LINES_SUFFIXES = {".jsonl", ".ndjson"}
+_JSON_VALUE_STARTS = set('{"-0123456789tfn')
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Longest token a chunk edge can cut short of a decode error: "-Infinity" or a
+# \uXXXX surrogate pair.
+_DECODE_TAIL = 16
 
-def load_recipes(filepath: str) -> List[Dict[str, Any]]:
-    """Load recipe data from a JSON file into a list of dicts.
+
+# Kinds of a stored ingredient entry: how to rebuild its "amount", or that
+# the entry is kept verbatim because it is not a plain name/amount/unit dict.
+_AMOUNT_NONE = 0
+_AMOUNT_INT = 1
+_AMOUNT_FLOAT = 2
+_VERBATIM = 3
+_ENTRY_KEYS = {"name", "amount", "unit"}
+_MAX_EXACT_INT = 1 << 53
+
+
+class _IngredientColumns:
+    """Per-entry label, unit and amount-kind columns beside EncodedRecipes.
+
+    Entry ``k`` matches entry ``k`` of ``EncodedRecipes.ids``/``amounts``.
+    Labels (the name as written) and units are interned in small tables, so
+    a plain ``{"name", "amount", "unit"}`` dict costs a few bytes; anything
+    else is kept as-is in a sparse ``verbatim`` map.
+    """
+
+    def __init__(self) -> None:
+        self.labels: List[str] = []
+        self.units: List[Optional[str]] = [None]
+        self._label_ids: Dict[str, int] = {}
+        self._unit_ids: Dict[Optional[str], int] = {None: 0}
+        self.label_ids = array("i")
+        self.unit_ids = array("i")
+        self.kinds = array("b")
+        self.verbatim: Dict[int, Any] = {}
+
+    def _intern(self, table: List[Any], ids: Dict[Any, int], value: Any) -> int:
+        index = ids.get(value)
+        if index is None:
+            index = ids[value] = len(table)
+            table.append(sys.intern(value) if isinstance(value, str) else value)
+        return index
+
+    def add(self, item: Any) -> None:
+        kind = _VERBATIM
+        if type(item) is dict and item.keys() == _ENTRY_KEYS:
+            name, amount, unit = item["name"], item["amount"], item["unit"]
+            if type(name) is str and (unit is None or type(unit) is str):
+                if amount is None:
+                    kind = _AMOUNT_NONE
+                elif type(amount) is int and abs(amount) <= _MAX_EXACT_INT:
+                    kind = _AMOUNT_INT
+                elif type(amount) is float:
+                    kind = _AMOUNT_FLOAT
+        if kind == _VERBATIM:
+            self.verbatim[len(self.kinds)] = item
+            self.label_ids.append(0)
+            self.unit_ids.append(0)
+        else:
+            self.label_ids.append(self._intern(self.labels, self._label_ids, name))
+            self.unit_ids.append(self._intern(self.units, self._unit_ids, unit))
+        self.kinds.append(kind)
+
+    def decode(self, start: int, end: int, amounts: array) -> List[Any]:
+        """Rebuild the ingredient entries ``start:end``."""
+        labels, units, verbatim = self.labels, self.units, self.verbatim
+        return [
+            verbatim[k] if kind == _VERBATIM else {
+                "name": labels[label],
+                "amount": amount if kind == _AMOUNT_FLOAT else int(amount) if kind == _AMOUNT_INT else None,
+                "unit": units[unit],
+            }
+            for k, label, unit, kind, amount in zip(
+                range(start, end), self.label_ids[start:end], self.unit_ids[start:end],
+                self.kinds[start:end], amounts[start:end],
+            )
+        ]
+
+    def to_state(self) -> Dict[str, Any]:
+        """Return the columns as built-in containers and raw bytes (for caching)."""
+        return {
+            "labels": self.labels,
+            "units": self.units,
+            "label_ids": self.label_ids.tobytes(),
+            "unit_ids": self.unit_ids.tobytes(),
+            "kinds": self.kinds.tobytes(),
+            "verbatim": self.verbatim,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "_IngredientColumns":
+        """Rebuild the columns from ``to_state`` output."""
+        columns = cls()
+        columns.labels = [sys.intern(label) for label in state["labels"]]
+        columns.units = state["units"]
+        columns._label_ids = {label: i for i, label in enumerate(columns.labels)}
+        columns._unit_ids = {unit: i for i, unit in enumerate(columns.units)}
+        columns.label_ids.frombytes(state["label_ids"])
+        columns.unit_ids.frombytes(state["unit_ids"])
+        columns.kinds.frombytes(state["kinds"])
+        columns.verbatim = state["verbatim"]
+        return columns
+
+
+class RecipeCatalog(Sequence):
+    """Read-mostly list of recipes with lookup indexes built once.
+
+    Iterates, indexes and compares like the list returned by
+    ``load_recipes``. Alongside it keeps a name index, a base-spirit hash
+    index, an ingredient-to-recipes inverted index and an n-gram NameIndex
+    for substring and prefix search, so queries cost close to the number of
+    results. Use ``add`` to grow the catalog.
+
+    Ingredients are encoded against an IngredientVocabulary (shared when one
+    is passed in) as compact id/amount rows in ``encoded``, and the inverted
+    index is keyed by ingredient id. Those rows, with per-entry label and
+    unit columns, are the only copy of the ingredient lists: each access
+    (indexing, iteration, search results) returns a fresh recipe dict with
+    its ``ingredients`` rebuilt, so changes to a returned dict are not kept.
+    Use ``field`` to read a top-level field without rebuilding anything.
+    """
+
+    def __init__(
+        self, recipes: Iterable[Dict[str, Any]] = (), vocab: Optional[IngredientVocabulary] = None,
+    ) -> None:
+        self._recipes: List[Dict[str, Any]] = []
+        self._columnar = array("b")
+        self._names: List[str] = []
+        self._by_name: Dict[str, List[int]] = {}
+        self._by_base: Dict[str, List[int]] = {}
+        self._by_ingredient: Dict[int, List[int]] = {}
+        self.vocab = vocab if vocab is not None else IngredientVocabulary()
+        self.encoded = EncodedRecipes(self.vocab)
+        self._columns = _IngredientColumns()
+        for recipe in recipes:
+            self._index_recipe(recipe)
+        self._name_index = NameIndex(self._names)
+
+    def _index_recipe(self, recipe: Dict[str, Any]) -> int:
+        pos = len(self._recipes)
+        name = _normalize_key(recipe.get("name", ""))
+        ingredients = recipe.get("ingredients", [])
+        stored = dict(recipe)
+        columnar = type(ingredients) is list and "ingredients" in recipe
+        if columnar:
+            # Keep the key (and so the field order); the list lives in the columns.
+            stored["ingredients"] = None
+            for item in ingredients:
+                self._columns.add(item)
+        else:
+            for _ in ingredients:
+                self._columns.add(None)
+        self._recipes.append(stored)
+        self._columnar.append(columnar)
+        self._names.append(name)
+        self._by_name.setdefault(name, []).append(pos)
+        self._by_base.setdefault(_normalize_key(recipe.get("base", "")), []).append(pos)
+        row = self.encoded.add(_normalize_ingredient(item) for item in ingredients)
+        ids, _ = self.encoded.row(row)
+        for ingredient_id in set(ids):
+            self._by_ingredient.setdefault(ingredient_id, []).append(pos)
+        return pos
+
+    def _recipe(self, pos: int) -> Dict[str, Any]:
+        recipe = dict(self._recipes[pos])
+        if self._columnar[pos]:
+            indptr = self.encoded.indptr
+            recipe["ingredients"] = self._columns.decode(indptr[pos], indptr[pos + 1], self.encoded.amounts)
+        return recipe
+
+    def add(self, recipe: Dict[str, Any]) -> None:
+        """Append a recipe and update every index."""
+        pos = self._index_recipe(recipe)
+        self._name_index.add(self._names[pos])
+
+    def field(self, position: int, key: str, default: Any = None) -> Any:
+        """Return one top-level field of a recipe without rebuilding its ingredients."""
+        if key == "ingredients":
+            return self[position].get(key, default)
+        return self._recipes[position].get(key, default)
+
+    def _select(self, positions: Iterable[int]) -> List[Dict[str, Any]]:
+        return [self._recipe(pos) for pos in positions]
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Find recipes whose normalized name contains the query."""
+        return self._select(self._name_index.substring(_normalize_key(query), limit))
+
+    def find_prefix(self, prefix: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Find recipes whose normalized name starts with prefix, in name order."""
+        return self._select(self._name_index.prefix(_normalize_key(prefix), limit))
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """Return the first recipe with exactly this name (case-insensitive)."""
+        pos = self.position(name)
+        return self._recipe(pos) if pos is not None else None
+
+    def position(self, name: str) -> Optional[int]:
+        """Return the position of the first recipe with this name, or None."""
+        positions = self._by_name.get(_normalize_key(name))
+        return positions[0] if positions else None
+
+    def filter_by_base(self, base_spirit: str) -> List[Dict[str, Any]]:
+        """Return recipes with the given base spirit."""
+        return self._select(self._by_base.get(_normalize_key(base_spirit), ()))
+
+    def with_ingredient(self, ingredient_name: str) -> List[Dict[str, Any]]:
+        """Return recipes that list the given ingredient."""
+        return self._select(self.positions_with(self.vocab.lookup(ingredient_name)))
+
+    def positions_with(self, ingredient_id: Optional[int]) -> List[int]:
+        """Return the positions of recipes using an ingredient id, ascending."""
+        return self._by_ingredient.get(ingredient_id, []) if ingredient_id is not None else []
+
+    def to_state(self) -> Dict[str, Any]:
+        """Return recipes and indexes as plain built-in containers (for caching)."""
+        return {
+            "recipes": self._recipes,
+            "columnar": self._columnar.tobytes(),
+            "names": self._names,
+            "by_name": self._by_name,
+            "by_base": self._by_base,
+            "by_ingredient": self._by_ingredient,
+            "name_index": self._name_index.to_state(),
+            "vocab": self.vocab.to_state(),
+            "encoded": self.encoded.to_state(),
+            "columns": self._columns.to_state(),
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "RecipeCatalog":
+        """Rebuild a catalog from ``to_state`` output without re-indexing."""
+        catalog = cls()
+        catalog._recipes = state["recipes"]
+        catalog._columnar.frombytes(state["columnar"])
+        catalog._names = state["names"]
+        catalog._by_name = state["by_name"]
+        catalog._by_base = state["by_base"]
+        catalog._by_ingredient = state["by_ingredient"]
+        catalog._name_index = NameIndex.from_state(state["name_index"])
+        catalog.vocab = IngredientVocabulary.from_state(state["vocab"])
+        catalog.encoded = EncodedRecipes.from_state(catalog.vocab, state["encoded"])
+        catalog._columns = _IngredientColumns.from_state(state["columns"])
+        return catalog
+
+    def __getitem__(self, position: Union[int, slice]) -> Any:
+        if isinstance(position, slice):
+            return self._select(range(len(self._recipes))[position])
+        return self._recipe(range(len(self._recipes))[position])
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return map(self._recipe, range(len(self._recipes)))
+
+    def __len__(self) -> int:
+        return len(self._recipes)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (RecipeCatalog, list)):
+            return len(self) == len(other) and all(map(operator.eq, self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"RecipeCatalog({len(self._recipes)} recipes)"
+
+
+def load_recipes(
+    filepath: str, compiled: bool = False, cache: Union[bool, str] = False, unit: Optional[str] = None,
+) -> Union[List[Dict[str, Any]], RecipeCatalog]:
+    """Load recipe data from a JSON (or JSON Lines) file into a list of dicts.
+
+    With ``compiled=True`` the recipes are returned as an indexed
+    RecipeCatalog instead of a plain list. ``cache=True`` (or ``"hash"``)
+    implies ``compiled`` and keeps a binary cache of the catalog next to the
+    source file, validated by modification time (or content hash), so warm
+    loads skip JSON parsing and normalization entirely. Passing ``unit``
+    (e.g. ``"ml"``) converts every convertible ingredient amount to that unit
+    while loading.
     
     Raises:
         DataLoadError: If the file cannot be read or parsed.
+        RecipeError: If unit is not a known unit.
+        ValueError: If the JSON document is not a list.
     """
+    if cache:
+        from .cache import load_cached_catalog
+
+        return load_cached_catalog(filepath, validate="hash" if cache == "hash" else "mtime", unit=unit)
+    recipes = iter_recipes(filepath, unit=unit)
+    return RecipeCatalog(recipes) if compiled else list(recipes)
+
+
+def iter_recipes(
+    filepath: str, chunk_size: int = _CHUNK_SIZE, unit: Optional[str] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Yield normalized recipes one at a time without loading the whole file.
+
+    JSON arrays are decoded incrementally, one record at a time, from
+    fixed-size chunks. Files ending in ``.jsonl`` or ``.ndjson`` are read as
+    JSON Lines, one recipe object per line. Memory stays bounded by the
+    largest single record. With ``unit`` set, amounts in known units are
+    converted to it (see ``UnitRegistry.normalize_recipe``).
+
+    Raises:
+        DataLoadError: If the file cannot be read, a record cannot be parsed or
+            a record is not an object. The message names the record index and
+            its character offset (or line for JSON Lines).
+        RecipeError: If unit is not a known unit.
+        ValueError: If the JSON document is not a list.
+    """
+    registry = DEFAULT_REGISTRY
+    if unit is not None:
+        unit = registry.canonical(unit)
     path = Path(filepath)
     try:
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        f = path.open("r", encoding="utf-8")
     except FileNotFoundError as e:
         raise DataLoadError(f"Recipe file not found: {filepath}") from e
-    except json.JSONDecodeError as e:
-        raise DataLoadError(f"Failed to parse recipe file: {e}") from e
+    with f:
+        if path.suffix.lower() in _JSON_LINES_SUFFIXES:
+            records = _iter_json_lines(f)
+        else:
+            records = iter(_JsonArrayReader(f, chunk_size))
+        for index, location, record in records:
+            if not isinstance(record, dict):
+                raise DataLoadError(f"Recipe record {index} at {location} is not an object.")
+            recipe = _normalize_recipe(record)
+            yield recipe if unit is None else registry.normalize_recipe(recipe, unit)
+
+
+class _JsonArrayReader:
+    """Incrementally decode the elements of a top-level JSON array."""
+
+    def __init__(self, f: TextIO, chunk_size: int) -> None:
+        self._file = f
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._base = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Read another chunk, dropping the consumed prefix of the buffer."""
+        if self._eof:
+            return False
+        chunk = self._file.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._base += self._pos
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character ('' at end of file)."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
 
-    if not isinstance(data, list):
-        raise ValueError("Recipe data must be a list of dicts.")
-    return [_normalize_recipe(recipe) for recipe in data]
+    def _offset(self) -> str:
+        return f"offset {self._base + self._pos}"
 
+    def _decode(self, index: int) -> Tuple[str, Any]:
+        self._peek()
+        while True:
+            try:
+                record, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as e:
+                # Only a value cut off by the end of the buffer is worth another chunk;
+                # anything else is malformed and fails without reading further.
+                truncated = e.msg.startswith("Unterminated string") or len(self._buffer) - e.pos <= _DECODE_TAIL
+                if truncated and self._fill():
+                    continue
+                raise DataLoadError(
+                    f"Failed to parse recipe file: record {index} at {self._offset()}: {e.msg}"
+                ) from e
+            # A value ending near the buffer edge (e.g. "1." of "1.25") may continue.
+            if len(self._buffer) - end <= _DECODE_TAIL and self._fill():
+                continue
+            location = self._offset()
+            self._pos = end
+            return location, record
 
-def search_cocktail(recipe_db: Iterable[Dict[str, Any]], name: str) -> List[Dict[str, Any]]:
-    """Find cocktails whose names contain the given query (case-insensitive)."""
+    def _expect_end(self) -> None:
+        """Step past the closing ']' and reject anything but whitespace after it."""
+        self._pos += 1
+        if self._peek():
+            raise DataLoadError(f"Failed to parse recipe file: extra data after the array at {self._offset()}")
+
+    def __iter__(self) -> Iterator[Tuple[int, str, Any]]:
+        first = self._peek()
+        if first != "[":
+            if first and first in _JSON_VALUE_STARTS:
+                raise ValueError("Recipe data must be a list of dicts.")
+            raise DataLoadError(f"Failed to parse recipe file: expected '[' at {self._offset()}")
+        self._pos += 1
+        if self._peek() == "]":
+            self._expect_end()
+            return
+        index = 0
+        while True:
+            location, record = self._decode(index)
+            yield index, location, record
+            index += 1
+            separator = self._peek()
+            if separator == "]":
+                self._expect_end()
+                return
+            if separator != ",":
+                raise DataLoadError(
+                    f"Failed to parse recipe file: expected ',' or ']' after record {index - 1} at {self._offset()}"
+                )
+            self._pos += 1
+
+
+def _iter_json_lines(f: TextIO) -> Iterator[Tuple[int, str, Any]]:
+    """Decode one JSON value per non-blank line."""
+    index = 0
+    for line_number, line in enumerate(f, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise DataLoadError(f"Failed to parse recipe file: record {index} on line {line_number}: {e.msg}") from e
+        yield index, f"line {line_number}", record
+        index += 1
+
+
+def search_cocktail(
+    recipe_db: Iterable[Dict[str, Any]], name: str, limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Find cocktails whose names contain the given query (case-insensitive).
+
+    Returns at most ``limit`` matches when a limit is given.
+    """
+    if isinstance(recipe_db, RecipeCatalog):
+        return recipe_db.search(name, limit)
     query = name.lower().strip()
     results: List[Dict[str, Any]] = []
     for recipe in recipe_db:
+        if limit is not None and len(results) >= limit:
+            break
         cocktail_name = str(recipe.get("name", "")).lower()
         if query in cocktail_name:
             results.append(recipe)
@@ -42,34 +473,28 @@ def search_cocktail(recipe_db: Iterable[Dict[str, Any]], name: str) -> List[Dict
 
 def filter_by_base(recipe_db: Iterable[Dict[str, Any]], base_spirit: str) -> List[Dict[str, Any]]:
     """Filter cocktails by base spirit (case-insensitive exact match)."""
+    if isinstance(recipe_db, RecipeCatalog):
+        return recipe_db.filter_by_base(base_spirit)
     target = base_spirit.lower().strip()
     return [recipe for recipe in recipe_db if str(recipe.get("base", "")).lower() == target]
 
 
 def display_recipe(cocktail_dict: Dict[str, Any]) -> None:
     """Print a formatted recipe summary."""
-    name = cocktail_dict.get("name", "Unknown Cocktail")
-    ingredients = [_normalize_ingredient(item) for item in cocktail_dict.get("ingredients", [])]
-    steps = cocktail_dict.get("steps", [])
+    from .render import render_recipes
 
-    print(f"Recipe: {name}")
-    print("Ingredients:")
-    for item in ingredients:
-        print(f"- {_format_ingredient(item)}")
-    print("Steps:")
-    for i, step in enumerate(steps, start=1):
-        print(f"{i}. {step}")
+    render_recipes([cocktail_dict], sys.stdout)
 
 
 def _normalize_ingredient(ingredient: Any) -> Dict[str, Any]:
     """Ensure an ingredient entry is a consistently shaped dict."""
     if isinstance(ingredient, dict):
         return {
-            "name": str(ingredient.get("name", "")),
+            "name": sys.intern(str(ingredient.get("name", ""))),
             "amount": ingredient.get("amount"),
             "unit": ingredient.get("unit"),
         }
-    return {"name": str(ingredient), "amount": None, "unit": None}
+    return {"name": sys.intern(str(ingredient)), "amount": None, "unit": None}
 
 
 def _normalize_recipe(recipe: Dict[str, Any]) -> Dict[str, Any]:
@@ -0,0 +1,200 @@
+"""Live cost-per-drink and margin tracking priced from inventory items."""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .catalog import RecipeCatalog, _normalize_ingredient
+from .units import DEFAULT_REGISTRY, UnitRegistry
+from ..exceptions import InventoryError, RecipeError
+from ..inventory.items import Ingredient
+from ..inventory.manager import _item_finder
+
+
+class MenuCosting:
+    """Cached cost per drink for every recipe of a catalog.
+
+    Recipe ingredients are joined to inventory items by name and priced at the
+    item's ``unit_value``. Amounts in known units are converted to ``unit``
+    first (the unit inventory quantities are counted in); amounts in other
+    units (leaves, wedges ...) are taken as inventory units as they are, and
+    non-numeric amounts cost nothing.
+
+    Costs are computed once and kept in an array. The engine listens to price
+    changes of the joined items (``Ingredient.set_unit_value``) and, through
+    an ingredient-to-recipes dependency index, recomputes only the recipes
+    that use the changed ingredient. Call ``refresh`` after adding or removing
+    inventory items so they are joined again. ``recomputed`` counts the
+    per-recipe cost computations done so far.
+    """
+
+    def __init__(
+        self,
+        catalog: Iterable[Dict[str, Any]],
+        inventory: Any,
+        sale_prices: Optional[Dict[str, float]] = None,
+        unit: str = "ml",
+        registry: Optional[UnitRegistry] = None,
+    ) -> None:
+        self.catalog = catalog if isinstance(catalog, RecipeCatalog) else RecipeCatalog(catalog)
+        self._inventory = inventory
+        self._registry = registry if registry is not None else DEFAULT_REGISTRY
+        self._unit = self._registry.canonical(unit)
+        self._rows: List[List[Tuple[int, float]]] = [self._encode(recipe) for recipe in self.catalog]
+        self._items: Dict[int, Ingredient] = {}
+        self._ids: Dict[int, int] = {}
+        self._unit_values: Dict[int, float] = {}
+        self._costs = array("d", [0.0]) * len(self._rows)
+        self._unpriced = array("l", [0]) * len(self._rows)
+        self._sale_prices: Dict[int, float] = {}
+        self.recomputed = 0
+        for name, price in (sale_prices or {}).items():
+            self.set_sale_price(name, price)
+        find = _item_finder(inventory)
+        for ingredient_id in range(len(self.catalog.vocab)):
+            self._join(ingredient_id, find(self.catalog.vocab.name(ingredient_id)))
+        for pos in range(len(self._rows)):
+            self._recompute(pos)
+
+    def _encode(self, recipe: Dict[str, Any]) -> List[Tuple[int, float]]:
+        row = []
+        for item in recipe.get("ingredients", []):
+            item = _normalize_ingredient(item)
+            amount = item.get("amount")
+            if not isinstance(amount, (int, float)):
+                continue
+            unit = item.get("unit")
+            if self._registry.knows(unit):
+                amount = amount * self._registry.factor(unit, self._unit)
+            row.append((self.catalog.vocab.id_for(item["name"]), float(amount)))
+        return row
+
+    def _join(self, ingredient_id: int, item: Optional[Ingredient]) -> None:
+        """Point an ingredient id at an inventory item (or at nothing)."""
+        old = self._items.pop(ingredient_id, None)
+        if old is not None:
+            del self._ids[id(old)]
+            old.remove_price_listener(self._on_price_change)
+        self._unit_values.pop(ingredient_id, None)
+        if item is None:
+            return
+        self._unit_values[ingredient_id] = item.unit_value
+        if hasattr(item, "add_price_listener"):
+            self._items[ingredient_id] = item
+            self._ids[id(item)] = ingredient_id
+            item.add_price_listener(self._on_price_change)
+
+    def _recompute(self, pos: int) -> None:
+        cost = 0.0
+        unpriced = 0
+        unit_values = self._unit_values
+        for ingredient_id, amount in self._rows[pos]:
+            unit_value = unit_values.get(ingredient_id)
+            if unit_value is None:
+                unpriced += 1
+            else:
+                cost += amount * unit_value
+        self._costs[pos] = cost
+        self._unpriced[pos] = unpriced
+        self.recomputed += 1
+
+    def _recompute_dependents(self, ingredient_id: int) -> int:
+        positions = self.catalog.positions_with(ingredient_id)
+        for pos in positions:
+            self._recompute(pos)
+        return len(positions)
+
+    def _on_price_change(self, item: Ingredient, old_unit_value: float) -> None:
+        ingredient_id = self._ids.get(id(item))
+        if ingredient_id is None:
+            return
+        self._unit_values[ingredient_id] = item.unit_value
+        self._recompute_dependents(ingredient_id)
+
+    def _position(self, recipe_name: str) -> int:
+        pos = self.catalog.position(recipe_name)
+        if pos is None:
+            raise RecipeError(f"Recipe '{recipe_name}' is not on the menu.")
+        return pos
+
+    def set_price(self, ingredient_name: str, unit_value: float) -> int:
+        """Change an inventory ingredient's unit value; return recipes recomputed.
+
+        Raises:
+            InventoryError: If no joined inventory item has this name.
+        """
+        ingredient_id = self.catalog.vocab.lookup(ingredient_name)
+        item = self._items.get(ingredient_id) if ingredient_id is not None else None
+        if item is None:
+            raise InventoryError(f"Item '{ingredient_name}' not found in inventory.")
+        before = self.recomputed
+        item.set_unit_value(unit_value)
+        return self.recomputed - before
+
+    def refresh(self, ingredient_name: str) -> int:
+        """Re-join one ingredient to the inventory; return recipes recomputed."""
+        ingredient_id = self.catalog.vocab.lookup(ingredient_name)
+        if ingredient_id is None:
+            return 0
+        self._join(ingredient_id, _item_finder(self._inventory)(ingredient_name))
+        return self._recompute_dependents(ingredient_id)
+
+    def set_sale_price(self, recipe_name: str, price: float) -> None:
+        """Set the menu price of a recipe.
+
+        Raises:
+            RecipeError: If the recipe is unknown or the price is negative.
+        """
+        if price < 0:
+            raise RecipeError("Sale price cannot be negative.")
+        self._sale_prices[self._position(recipe_name)] = float(price)
+
+    def cost(self, recipe_name: str) -> float:
+        """Return the cached cost of one drink.
+
+        Raises:
+            RecipeError: If the recipe is unknown.
+        """
+        return self._costs[self._position(recipe_name)]
+
+    def costs(self) -> Dict[str, Any]:
+        """Return the cost of every drink keyed by recipe name."""
+        return {self.catalog.field(pos, "name"): cost for pos, cost in enumerate(self._costs)}
+
+    def margin_report(self) -> List[Dict[str, Any]]:
+        """Return cost, price and margin rows for every recipe in menu order.
+
+        ``price``, ``margin`` and ``margin_pct`` are None for recipes without a
+        sale price (``margin_pct`` also for free drinks); ``complete`` is False
+        when an ingredient could not be priced from the inventory.
+        """
+        report = []
+        for pos, cost in enumerate(self._costs):
+            price = self._sale_prices.get(pos)
+            margin = margin_pct = None
+            if price is not None:
+                margin = price - cost
+                margin_pct = margin / price * 100 if price > 0 else None
+            report.append({
+                "name": self.catalog.field(pos, "name"),
+                "cost": cost,
+                "price": price,
+                "margin": margin,
+                "margin_pct": margin_pct,
+                "complete": not self._unpriced[pos],
+            })
+        return report
+
+    def close(self) -> None:
+        """Stop listening to inventory price changes."""
+        for item in self._items.values():
+            item.remove_price_listener(self._on_price_change)
+        self._items.clear()
+        self._ids.clear()
+
+    def __enter__(self) -> "MenuCosting":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,159 @@
+"""Parallel ingestion of many recipe files with duplicate removal."""
+
+from __future__ import annotations
+
+import glob
+import hashlib
+import json
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .catalog import RecipeCatalog, _JSON_LINES_SUFFIXES, iter_recipes
+from .units import DEFAULT_REGISTRY
+from .vocab import _normalize_key
+from ..exceptions import DataLoadError
+
+RECIPE_SUFFIXES = {".json"} | _JSON_LINES_SUFFIXES
+_GLOB_CHARS = "*?["
+
+Loaded = Tuple[Optional[List[Tuple[str, Dict[str, Any]]]], Optional[DataLoadError]]
+
+
+def _amount_key(amount: Any) -> Any:
+    return float(amount) if isinstance(amount, (int, float)) else amount
+
+
+def recipe_digest(recipe: Dict[str, Any]) -> str:
+    """Return a content hash of a normalized recipe's name and ingredients.
+
+    Names are compared case-insensitively and ingredient order is ignored, so
+    the same drink from two suppliers hashes the same.
+    """
+    ingredients = sorted(
+        (
+            _normalize_key(item.get("name", "")),
+            repr(_amount_key(item.get("amount"))),
+            _normalize_key(item.get("unit") or ""),
+        )
+        for item in recipe.get("ingredients", [])
+    )
+    payload = json.dumps([_normalize_key(recipe.get("name", "")), ingredients], separators=(",", ":"))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def expand_sources(sources: Union[str, Path, Iterable[Union[str, Path]]]) -> List[str]:
+    """Resolve files, directories and glob patterns into recipe file paths.
+
+    Directories contribute their ``.json``, ``.jsonl`` and ``.ndjson`` files.
+    Paths are returned once each, sorted within every source.
+    """
+    if isinstance(sources, (str, Path)):
+        sources = [sources]
+    paths: Dict[str, None] = {}
+    for source in sources:
+        source = str(source)
+        if os.path.isdir(source):
+            matches = [
+                os.path.join(source, name) for name in os.listdir(source)
+                if Path(name).suffix.lower() in RECIPE_SUFFIXES
+            ]
+        elif any(char in source for char in _GLOB_CHARS):
+            matches = glob.glob(source)
+        else:
+            matches = [source]
+        for match in sorted(matches):
+            paths.setdefault(match, None)
+    return list(paths)
+
+
+def _load_file(path: str, unit: Optional[str]) -> Loaded:
+    """Worker entry point: parse one file into (digest, recipe) pairs or an error."""
+    try:
+        recipes = [(recipe_digest(recipe), recipe) for recipe in iter_recipes(path, unit=unit)]
+    except (DataLoadError, OSError, ValueError) as e:
+        return None, DataLoadError(f"{path}: {e}")
+    return recipes, None
+
+
+def _file_size(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+class IngestResult:
+    """Merged recipes from several files plus what went wrong on the way.
+
+    ``errors`` maps each file that could not be loaded to its DataLoadError;
+    ``duplicates`` counts recipes dropped because an identical one (by
+    ``recipe_digest``) was already loaded.
+    """
+
+    def __init__(
+        self,
+        recipes: Union[List[Dict[str, Any]], RecipeCatalog],
+        files: List[str],
+        errors: Dict[str, DataLoadError],
+        duplicates: int,
+    ) -> None:
+        self.recipes = recipes
+        self.files = files
+        self.errors = errors
+        self.duplicates = duplicates
+
+    def __repr__(self) -> str:
+        return (
+            f"IngestResult({len(self.recipes)} recipes from {len(self.files)} files, "
+            f"{len(self.errors)} errors, {self.duplicates} duplicates)"
+        )
+
+
+def load_recipe_files(
+    sources: Union[str, Path, Iterable[Union[str, Path]]],
+    compiled: bool = False,
+    unit: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    parallel_threshold: int = 8 << 20,
+    executor: Optional[Executor] = None,
+) -> IngestResult:
+    """Load every recipe file matched by sources into one deduplicated list.
+
+    Files are parsed and normalized with ``iter_recipes``, in a process pool
+    once they total at least ``parallel_threshold`` bytes (or in ``executor``
+    when one is given). Results are merged in file order and the first copy
+    of each duplicate recipe wins. A file that fails to load is reported in
+    ``IngestResult.errors`` and the rest of the batch carries on.
+
+    Raises:
+        RecipeError: If unit is not a known unit.
+    """
+    if unit is not None:
+        unit = DEFAULT_REGISTRY.canonical(unit)
+    paths = expand_sources(sources)
+    count = len(paths)
+    if executor is not None:
+        loaded = list(executor.map(_load_file, paths, [unit] * count))
+    elif count < 2 or max_workers == 1 or sum(map(_file_size, paths)) < parallel_threshold:
+        loaded = [_load_file(path, unit) for path in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            loaded = list(pool.map(_load_file, paths, [unit] * count))
+
+    recipes: List[Dict[str, Any]] = []
+    seen = set()
+    errors: Dict[str, DataLoadError] = {}
+    duplicates = 0
+    for path, (pairs, error) in zip(paths, loaded):
+        if error is not None:
+            errors[path] = error
+            continue
+        for digest, recipe in pairs:
+            if digest in seen:
+                duplicates += 1
+            else:
+                seen.add(digest)
+                recipes.append(recipe)
+    return IngestResult(RecipeCatalog(recipes) if compiled else recipes, paths, errors, duplicates)
@@ -0,0 +1,134 @@
+"""Buffered rendering of many recipes as plain text, Markdown or HTML."""
+
+from __future__ import annotations
+
+import html
+import sys
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, TextIO
+
+from .catalog import _format_ingredient, _normalize_ingredient
+
+FORMATS = ("text", "markdown", "html")
+DEFAULT_BUFFER_SIZE = 1 << 16
+
+
+@lru_cache(maxsize=8192)
+def _ingredient_line(name: str, amount: Any, unit: Any) -> str:
+    return _format_ingredient({"name": name, "amount": amount, "unit": unit})
+
+
+def _ingredient_lines(recipe: Dict[str, Any]) -> List[str]:
+    lines = []
+    for item in recipe.get("ingredients", []):
+        item = _normalize_ingredient(item)
+        try:
+            lines.append(_ingredient_line(item["name"], item["amount"], item["unit"]))
+        except TypeError:
+            lines.append(_format_ingredient(item))
+    return lines
+
+
+def _render_text(recipe: Dict[str, Any]) -> List[str]:
+    parts = [f"Recipe: {recipe.get('name', 'Unknown Cocktail')}\n", "Ingredients:\n"]
+    parts.extend(f"- {line}\n" for line in _ingredient_lines(recipe))
+    parts.append("Steps:\n")
+    parts.extend(f"{i}. {step}\n" for i, step in enumerate(recipe.get("steps", []), start=1))
+    return parts
+
+
+def _render_markdown(recipe: Dict[str, Any]) -> List[str]:
+    parts = [f"## {recipe.get('name', 'Unknown Cocktail')}\n\n", "**Ingredients**\n\n"]
+    parts.extend(f"- {line}\n" for line in _ingredient_lines(recipe))
+    steps = recipe.get("steps", [])
+    if steps:
+        parts.append("\n**Steps**\n\n")
+        parts.extend(f"{i}. {step}\n" for i, step in enumerate(steps, start=1))
+    parts.append("\n")
+    return parts
+
+
+def _render_html(recipe: Dict[str, Any]) -> List[str]:
+    escape = html.escape
+    parts = [
+        '<article class="recipe">\n',
+        f"<h2>{escape(str(recipe.get('name', 'Unknown Cocktail')))}</h2>\n",
+        "<h3>Ingredients</h3>\n<ul>\n",
+    ]
+    parts.extend(f"<li>{escape(line)}</li>\n" for line in _ingredient_lines(recipe))
+    parts.append("</ul>\n")
+    steps = recipe.get("steps", [])
+    if steps:
+        parts.append("<h3>Steps</h3>\n<ol>\n")
+        parts.extend(f"<li>{escape(str(step))}</li>\n" for step in steps)
+        parts.append("</ol>\n")
+    parts.append("</article>\n")
+    return parts
+
+
+_RENDERERS: Dict[str, Callable[[Dict[str, Any]], List[str]]] = {
+    "text": _render_text,
+    "markdown": _render_markdown,
+    "html": _render_html,
+}
+
+
+class RecipeRenderer:
+    """Write recipes to a text stream through one in-memory buffer.
+
+    Rendered pieces are collected until about ``buffer_size`` characters are
+    pending and then handed to the stream in a single ``write`` call, so a
+    large export costs a handful of writes instead of one per line, while
+    memory stays bounded by the buffer. Formatted ingredient strings are
+    cached and reused across recipes. ``stream`` defaults to ``sys.stdout``
+    at construction time.
+    """
+
+    def __init__(
+        self, stream: Optional[TextIO] = None, fmt: str = "text", buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> None:
+        if fmt not in _RENDERERS:
+            raise ValueError(f"fmt must be one of {', '.join(FORMATS)}.")
+        self.stream = stream if stream is not None else sys.stdout
+        self.fmt = fmt
+        self._render = _RENDERERS[fmt]
+        self._buffer_size = buffer_size
+        self._parts: List[str] = []
+        self._pending = 0
+
+    def write(self, recipe: Dict[str, Any]) -> None:
+        """Render one recipe into the buffer, flushing when it is full."""
+        parts = self._render(recipe)
+        self._parts.extend(parts)
+        self._pending += sum(map(len, parts))
+        if self._pending >= self._buffer_size:
+            self.flush()
+
+    def write_many(self, recipes: Iterable[Dict[str, Any]]) -> int:
+        """Render recipes in order and return how many were written."""
+        count = 0
+        for recipe in recipes:
+            self.write(recipe)
+            count += 1
+        return count
+
+    def flush(self) -> None:
+        """Hand the buffered output to the stream."""
+        if self._parts:
+            self.stream.write("".join(self._parts))
+            self._parts.clear()
+            self._pending = 0
+
+    def __enter__(self) -> "RecipeRenderer":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.flush()
+
+
+def render_recipes(
+    recipes: Iterable[Dict[str, Any]], stream: Optional[TextIO] = None, fmt: str = "text",
+) -> int:
+    """Render recipes to a stream (stdout by default); return how many were written."""
+    with RecipeRenderer(stream, fmt) as renderer:
+        return renderer.write_many(recipes)
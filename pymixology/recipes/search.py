@@ -0,0 +1,118 @@
+"""N-gram name index for fast substring and prefix search."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+GRAM_SIZE = 3
+
+
+def _grams(text: str, size: int) -> set:
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def _contains(postings: array, pos: int) -> bool:
+    at = bisect_left(postings, pos)
+    return at < len(postings) and postings[at] == pos
+
+
+class NameIndex:
+    """Index of normalized names answering substring and prefix queries.
+
+    Every name is split into all of its 1-, 2- and 3-character grams, each
+    with a sorted posting array of name positions. A substring query intersects
+    the posting lists of its grams, starting from the rarest one. Candidates
+    are verified only when the query is longer than a gram. Prefix queries use
+    a sorted key list. Names must already be normalized (lower-cased and
+    stripped).
+
+    Posting lists are 32-bit ``array("i")`` columns rather than lists of
+    ints, which halves their footprint on large catalogs.
+    """
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        self._names: List[str] = []
+        self._postings: Dict[str, array] = {}
+        for name in names:
+            self._index_name(name)
+        order = sorted(range(len(self._names)), key=self._names.__getitem__)
+        self._sorted_keys = [self._names[pos] for pos in order]
+        self._sorted_positions = order
+
+    def _index_name(self, name: str) -> int:
+        pos = len(self._names)
+        self._names.append(name)
+        for size in range(1, GRAM_SIZE + 1):
+            for gram in _grams(name, size):
+                postings = self._postings.get(gram)
+                if postings is None:
+                    postings = self._postings[gram] = array("i")
+                postings.append(pos)
+        return pos
+
+    def add(self, name: str) -> int:
+        """Index one more name and return its position."""
+        pos = self._index_name(name)
+        at = bisect_right(self._sorted_keys, name)
+        self._sorted_keys.insert(at, name)
+        self._sorted_positions.insert(at, pos)
+        return pos
+
+    def _substring_positions(self, query: str) -> Iterator[int]:
+        if not query:
+            yield from range(len(self._names))
+            return
+        size = min(len(query), GRAM_SIZE)
+        lists = []
+        for gram in _grams(query, size):
+            postings = self._postings.get(gram)
+            if not postings:
+                return
+            lists.append(postings)
+        lists.sort(key=len)
+        rarest, others = lists[0], lists[1:]
+        verify = len(query) > GRAM_SIZE
+        for pos in rarest:
+            if all(_contains(postings, pos) for postings in others):
+                if not verify or query in self._names[pos]:
+                    yield pos
+
+    def substring(self, query: str, limit: Optional[int] = None) -> List[int]:
+        """Return positions of names containing query, in insertion order."""
+        return list(islice(self._substring_positions(query), limit))
+
+    def prefix(self, query: str, limit: Optional[int] = None) -> List[int]:
+        """Return positions of names starting with query, in name order."""
+        start = bisect_left(self._sorted_keys, query)
+        end = start
+        stop = len(self._sorted_keys) if limit is None else min(len(self._sorted_keys), start + limit)
+        while end < stop and self._sorted_keys[end].startswith(query):
+            end += 1
+        return self._sorted_positions[start:end]
+
+    def to_state(self) -> Dict[str, Any]:
+        """Return the index as plain built-in containers (for caching)."""
+        return {
+            "names": self._names,
+            "postings": {gram: postings.tobytes() for gram, postings in self._postings.items()},
+            "sorted_keys": self._sorted_keys,
+            "sorted_positions": self._sorted_positions,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "NameIndex":
+        """Rebuild an index from ``to_state`` output without re-indexing."""
+        index = cls()
+        index._names = state["names"]
+        for gram, raw in state["postings"].items():
+            postings = index._postings[gram] = array("i")
+            postings.frombytes(raw)
+        index._sorted_keys = state["sorted_keys"]
+        index._sorted_positions = state["sorted_positions"]
+        return index
+
+    def __len__(self) -> int:
+        return len(self._names)
@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import copy
-from typing import Dict, List, Any
+import math
+from array import array
+from bisect import bisect_right
+from itertools import compress, repeat
+from operator import le, mul, truediv
+from collections.abc import Mapping
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Sequence, Tuple, Union
 
 from ..exceptions import RecipeError
-
-_OZ_TO_ML = 29.5735
+from .units import DEFAULT_REGISTRY
 
 
 def calculate_abv(ingredients: List[Dict[str, float]]) -> float:
@@ -36,40 +41,203 @@ def estimate_cost(ingredients: List[Dict[str, float]]) -> float:
     return cost
 
 
+def build_menu_matrix(
+    menu: Iterable[List[Dict[str, float]]], fields: Sequence[str],
+) -> Tuple[array, Dict[str, array]]:
+    """Pack a menu of ingredient-dict lists into a CSR matrix.
+
+    Returns ``(indptr, columns)`` where drink ``i`` owns entries
+    ``indptr[i]:indptr[i + 1]`` of every column in ``columns``. Missing fields
+    are stored as 0.
+    """
+    indptr = array("l", [0])
+    columns = {field: array("d") for field in fields}
+    count = 0
+    for ingredients in menu:
+        for item in ingredients:
+            for field in fields:
+                columns[field].append(item.get(field, 0))
+        count += len(ingredients)
+        indptr.append(count)
+    return indptr, columns
+
+
+def _segment_sum(values: array) -> float:
+    try:
+        return math.fsum(values)
+    except (ValueError, OverflowError):
+        # fsum refuses inf - inf and intermediate overflow; plain sum gives nan/inf.
+        return sum(values)
+
+
+def _row_sums(indptr: Sequence[int], values: Iterable[float]) -> array:
+    """Sum every CSR row segment on its own, so a NaN or inf stays in its row."""
+    flat = array("d", values)
+    return array("d", [_segment_sum(flat[start:end]) for start, end in zip(indptr, indptr[1:])])
+
+
+def _ratio_or_zero(numerator: float, denominator: float) -> float:
+    return numerator / denominator if denominator > 0 else 0.0
+
+
+def calculate_abv_batch(indptr: Sequence[int], vols: Sequence[float], abvs: Sequence[float]) -> array:
+    """Estimate the ABV of every drink in a CSR menu at once.
+
+    Same volume-weighted average as calculate_abv, with 0.0 for drinks whose
+    total volume is not positive.
+    """
+    alcohol = _row_sums(indptr, map(mul, vols, abvs))
+    volume = _row_sums(indptr, vols)
+    return array("d", map(_ratio_or_zero, alcohol, volume))
+
+
+def estimate_cost_batch(
+    indptr: Sequence[int],
+    used_vols: Sequence[float],
+    prices: Sequence[float],
+    bottle_vols: Sequence[float],
+) -> Tuple[array, List[int]]:
+    """Estimate the cost of every drink in a CSR menu at once.
+
+    Returns ``(costs, bad_rows)``. Drinks with any non-positive bottle volume
+    get a NaN cost and their row index is listed in ``bad_rows`` instead of
+    raising on the first one.
+    """
+    bad_items: List[int] = []
+    if len(bottle_vols) and min(bottle_vols) <= 0:
+        bad_items = list(compress(range(len(bottle_vols)), map(le, bottle_vols, repeat(0))))
+        safe_vols = array("d", bottle_vols)
+        for i in bad_items:
+            safe_vols[i] = 1.0
+    else:
+        safe_vols = bottle_vols
+    costs = _row_sums(indptr, map(mul, map(truediv, prices, safe_vols), used_vols))
+    bad_rows = sorted({bisect_right(indptr, i) - 1 for i in bad_items})
+    for row in bad_rows:
+        costs[row] = math.nan
+    return costs, bad_rows
+
+
 def unit_converter(amount: float, from_unit: str, to_unit: str) -> float:
-    """Convert volumes between ml and oz.
-    
+    """Convert volumes between units known to the default UnitRegistry.
+
+    Amounts in the same unit (compared case-insensitively) are returned
+    unchanged, even for units the registry does not know.
+
     Raises:
         RecipeError: If unit is not supported.
     """
-    f_unit = from_unit.lower()
-    t_unit = to_unit.lower()
-    if f_unit == t_unit:
+    if from_unit.lower() == to_unit.lower():
         return amount
-    if f_unit == "oz" and t_unit == "ml":
-        return amount * _OZ_TO_ML
-    if f_unit == "ml" and t_unit == "oz":
-        return amount / _OZ_TO_ML
-    raise RecipeError(f"Unsupported unit conversion: {from_unit} to {to_unit}")
+    return DEFAULT_REGISTRY.convert(amount, from_unit, to_unit)
 
 
 def scale_recipe(cocktail_dict: Dict[str, Any], servings: int) -> Dict[str, Any]:
     """Return a new recipe with ingredient amounts scaled to the target servings."""
-    if servings <= 0:
-        raise ValueError("Servings must be positive.")
+    factor = _scale_factor(cocktail_dict, servings)
     new_recipe = copy.deepcopy(cocktail_dict)
-    current_servings = cocktail_dict.get("servings", 1) or 1
-    factor = servings / current_servings
-    scaled_ingredients = []
-    for ingredient in new_recipe.get("ingredients", []):
-        if isinstance(ingredient, dict) and "amount" in ingredient:
-            scaled_item = ingredient.copy()
-            amount = scaled_item.get("amount")
-            if isinstance(amount, (int, float)):
-                scaled_item["amount"] = amount * factor
-            scaled_ingredients.append(scaled_item)
-        else:
-            scaled_ingredients.append(ingredient)
-    new_recipe["ingredients"] = scaled_ingredients
+    new_recipe["ingredients"] = [_scale_ingredient(item, factor) for item in new_recipe.get("ingredients", [])]
     new_recipe["servings"] = servings
     return new_recipe
+
+
+def _scale_factor(cocktail_dict: Dict[str, Any], servings: float) -> float:
+    if servings <= 0:
+        raise ValueError("Servings must be positive.")
+    return servings / (cocktail_dict.get("servings", 1) or 1)
+
+
+def _scale_ingredient(ingredient: Any, factor: float) -> Any:
+    if isinstance(ingredient, dict) and "amount" in ingredient:
+        amount = ingredient.get("amount")
+        if isinstance(amount, (int, float)):
+            scaled_item = dict(ingredient)
+            scaled_item["amount"] = amount * factor
+            return scaled_item
+    return ingredient
+
+
+class ScaledRecipe(Mapping):
+    """Read-only view of a recipe scaled to a number of servings.
+
+    Nothing is copied up front: every key except ``servings`` and
+    ``ingredients`` is read straight from the base recipe, and scaled
+    ingredient amounts are computed when they are accessed.
+    """
+
+    __slots__ = ("base", "servings", "factor")
+
+    def __init__(self, cocktail_dict: Dict[str, Any], servings: int) -> None:
+        self.factor = _scale_factor(cocktail_dict, servings)
+        self.base = cocktail_dict
+        self.servings = servings
+
+    def amount(self, index: int) -> Any:
+        """Return the scaled amount of one ingredient (None when it has none)."""
+        ingredient = self.base.get("ingredients", [])[index]
+        amount = ingredient.get("amount") if isinstance(ingredient, dict) else None
+        return amount * self.factor if isinstance(amount, (int, float)) else amount
+
+    def iter_ingredients(self) -> Iterator[Any]:
+        """Yield scaled ingredient entries one at a time."""
+        for ingredient in self.base.get("ingredients", []):
+            yield _scale_ingredient(ingredient, self.factor)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Materialize the view as a plain dict (like scale_recipe, without deep copies)."""
+        return dict(self.items())
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "servings":
+            return self.servings
+        if key == "ingredients":
+            return list(self.iter_ingredients())
+        return self.base[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.base
+        if "servings" not in self.base:
+            yield "servings"
+
+    def __len__(self) -> int:
+        return len(self.base) + (0 if "servings" in self.base else 1)
+
+    def __repr__(self) -> str:
+        return f"ScaledRecipe({self.base.get('name', 'Unknown Cocktail')!r}, servings={self.servings})"
+
+
+def scale_recipe_view(cocktail_dict: Dict[str, Any], servings: int) -> ScaledRecipe:
+    """Return a lazily scaled, copy-free view of a recipe."""
+    return ScaledRecipe(cocktail_dict, servings)
+
+
+def scale_recipes_batch(
+    recipes: Sequence[Dict[str, Any]], servings: Union[int, Sequence[int]],
+) -> Dict[Tuple[str, Optional[str]], float]:
+    """Total the ingredient amounts needed to make many recipes at once.
+
+    ``servings`` is either one count for every recipe or one count per recipe.
+    Returns the summed scaled amount per ``(ingredient name, unit)``; names are
+    matched case-insensitively and reported as first seen. Ingredients without
+    a numeric amount are skipped.
+    """
+    if isinstance(servings, (int, float)):
+        servings = [servings] * len(recipes)
+    if len(servings) != len(recipes):
+        raise ValueError("Need one servings count per recipe.")
+    totals: Dict[Tuple[str, Optional[str]], float] = {}
+    labels: Dict[Tuple[str, Optional[str]], Tuple[str, Optional[str]]] = {}
+    for recipe, count in zip(recipes, servings):
+        factor = _scale_factor(recipe, count)
+        for ingredient in recipe.get("ingredients", []):
+            if not isinstance(ingredient, dict):
+                continue
+            amount = ingredient.get("amount")
+            if not isinstance(amount, (int, float)):
+                continue
+            name = str(ingredient.get("name", ""))
+            unit = ingredient.get("unit")
+            key = (name.lower().strip(), unit)
+            label = labels.setdefault(key, (name, unit))
+            totals[label] = totals.get(label, 0.0) + amount * factor
+    return totals
@@ -0,0 +1,153 @@
+"""Unit registry with precomputed conversion factors."""
+
+from __future__ import annotations
+
+from array import array
+from operator import mul
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..exceptions import RecipeError
+
+OZ_TO_ML = 29.5735
+
+# Volume of one unit in millilitres, with accepted spellings.
+_DEFAULT_UNITS: List[Tuple[str, float, Tuple[str, ...]]] = [
+    ("ml", 1.0, ("milliliter", "milliliters", "millilitre", "millilitres")),
+    ("cl", 10.0, ("centiliter", "centiliters", "centilitre", "centilitres")),
+    ("l", 1000.0, ("liter", "liters", "litre", "litres")),
+    ("oz", OZ_TO_ML, ("fl oz", "ounce", "ounces")),
+    ("shot", 1.5 * OZ_TO_ML, ("shots", "jigger", "jiggers")),
+    ("dash", OZ_TO_ML / 32, ("dashes",)),
+    ("barspoon", 5.0, ("barspoons", "bar spoon", "bar spoons")),
+    ("tsp", 4.92892, ("teaspoon", "teaspoons")),
+    ("tbsp", 14.7868, ("tablespoon", "tablespoons")),
+    ("cup", 236.588, ("cups",)),
+]
+
+
+class UnitRegistry:
+    """Known volume units and the factor between every pair of them.
+
+    Each unit is stored as its size in a common base (millilitres). Factors
+    for ``(from, to)`` spellings are computed once and memoized in a pair
+    table, so repeated conversions are a single dict lookup.
+    """
+
+    def __init__(self, units: Iterable[Tuple[str, float, Iterable[str]]] = _DEFAULT_UNITS) -> None:
+        self._sizes: Dict[str, float] = {}
+        self._aliases: Dict[str, str] = {}
+        self._pairs: Dict[Tuple[str, str], float] = {}
+        for name, size, aliases in units:
+            self.register(name, size, aliases)
+
+    def register(self, name: str, size: float, aliases: Iterable[str] = ()) -> None:
+        """Add a unit measuring ``size`` millilitres, plus alternative spellings.
+
+        Raises:
+            RecipeError: If size is not positive.
+        """
+        if size <= 0:
+            raise RecipeError(f"Unit size must be positive: {name}")
+        key = name.lower().strip()
+        self._sizes[key] = float(size)
+        self._aliases[key] = key
+        for alias in aliases:
+            self._aliases[alias.lower().strip()] = key
+        self._pairs.clear()
+
+    def canonical(self, unit: str) -> str:
+        """Return the canonical name of a unit spelling.
+
+        Raises:
+            RecipeError: If the unit is unknown.
+        """
+        try:
+            return self._aliases[str(unit).lower().strip()]
+        except KeyError:
+            raise RecipeError(f"Unsupported unit: {unit}") from None
+
+    def knows(self, unit: Any) -> bool:
+        """Return True when the unit spelling is registered."""
+        return isinstance(unit, str) and unit.lower().strip() in self._aliases
+
+    def compile(self) -> Dict[Tuple[str, str], float]:
+        """Precompute the factor for every pair of canonical units."""
+        for source, source_size in self._sizes.items():
+            for target, target_size in self._sizes.items():
+                self._pairs[(source, target)] = source_size / target_size
+        return self._pairs
+
+    def factor(self, from_unit: str, to_unit: str) -> float:
+        """Return the multiplier converting from_unit amounts into to_unit.
+
+        Raises:
+            RecipeError: If either unit is unknown.
+        """
+        try:
+            return self._pairs[(from_unit, to_unit)]
+        except KeyError:
+            pass
+        try:
+            value = self._sizes[self.canonical(from_unit)] / self._sizes[self.canonical(to_unit)]
+        except RecipeError:
+            raise RecipeError(f"Unsupported unit conversion: {from_unit} to {to_unit}") from None
+        self._pairs[(from_unit, to_unit)] = value
+        return value
+
+    def convert(self, amount: float, from_unit: str, to_unit: str) -> float:
+        """Convert one amount between units."""
+        return amount * self.factor(from_unit, to_unit)
+
+    def convert_many(self, amounts: Sequence[float], from_units: Sequence[str], to_unit: str) -> array:
+        """Convert amounts given in mixed units into one target unit.
+
+        Raises:
+            RecipeError: If any unit is unknown.
+        """
+        if len(amounts) != len(from_units):
+            raise ValueError("Need one unit per amount.")
+        factors = {unit: self.factor(unit, to_unit) for unit in set(from_units)}
+        return array("d", map(mul, amounts, map(factors.__getitem__, from_units)))
+
+    def normalize_recipe(self, recipe: Dict[str, Any], unit: str = "ml") -> Dict[str, Any]:
+        """Return a recipe whose convertible ingredient amounts are in one unit.
+
+        Ingredients with unknown units (leaves, wedges ...) or non-numeric
+        amounts are kept unchanged.
+        """
+        target = self.canonical(unit)
+        converted = dict(recipe)
+        converted["ingredients"] = [
+            self._normalize_ingredient(item, target) for item in recipe.get("ingredients", [])
+        ]
+        return converted
+
+    def _normalize_ingredient(self, item: Any, target: str) -> Any:
+        if not isinstance(item, dict):
+            return item
+        amount = item.get("amount")
+        source = item.get("unit")
+        if not isinstance(amount, (int, float)) or not self.knows(source):
+            return item
+        converted = dict(item)
+        converted["amount"] = amount * self.factor(source, target)
+        converted["unit"] = target
+        return converted
+
+    def normalize_catalog(self, recipes: Iterable[Dict[str, Any]], unit: str = "ml") -> List[Dict[str, Any]]:
+        """Normalize every recipe of a catalog to one unit."""
+        return [self.normalize_recipe(recipe, unit) for recipe in recipes]
+
+
+DEFAULT_REGISTRY = UnitRegistry()
+DEFAULT_REGISTRY.compile()
+
+
+def default_registry() -> UnitRegistry:
+    """Return the registry used by unit_converter and load-time normalization."""
+    return DEFAULT_REGISTRY
+
+
+def canonical_unit(unit: Optional[str]) -> Optional[str]:
+    """Return the canonical spelling of a known unit, or the input unchanged."""
+    return DEFAULT_REGISTRY.canonical(unit) if DEFAULT_REGISTRY.knows(unit) else unit
@@ -0,0 +1,116 @@
+"""Shared ingredient vocabulary and integer-encoded recipe storage."""
+
+from __future__ import annotations
+
+import math
+import sys
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+def _normalize_key(name: Any) -> str:
+    """Return the case-insensitive lookup key for a name-like field."""
+    return str(name).lower().strip()
+
+
+class IngredientVocabulary:
+    """Maps each canonical ingredient name to a small integer id.
+
+    Names are normalized (lower-cased and stripped) once, when first seen;
+    afterwards every ingredient comparison can be done on ids. One vocabulary
+    can be shared by several catalogs and engines so their ids agree.
+    """
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        for name in names:
+            self.id_for(name)
+
+    def id_for(self, name: str) -> int:
+        """Return the id of an ingredient name, assigning a new one if needed."""
+        key = _normalize_key(name)
+        ingredient_id = self._ids.get(key)
+        if ingredient_id is None:
+            ingredient_id = len(self._names)
+            key = sys.intern(key)
+            self._ids[key] = ingredient_id
+            self._names.append(key)
+        return ingredient_id
+
+    def lookup(self, name: str) -> Optional[int]:
+        """Return the id of a known ingredient name, or None."""
+        return self._ids.get(_normalize_key(name))
+
+    def name(self, ingredient_id: int) -> str:
+        """Return the canonical (normalized) name for an id."""
+        return self._names[ingredient_id]
+
+    def to_state(self) -> List[str]:
+        """Return the id-ordered names (for caching)."""
+        return list(self._names)
+
+    @classmethod
+    def from_state(cls, names: List[str]) -> "IngredientVocabulary":
+        """Rebuild a vocabulary from ``to_state`` output."""
+        vocab = cls()
+        vocab._names = [sys.intern(name) for name in names]
+        vocab._ids = {name: i for i, name in enumerate(vocab._names)}
+        return vocab
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and _normalize_key(name) in self._ids
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+class EncodedRecipes:
+    """Recipes stored as compressed rows of ingredient ids and amounts.
+
+    Row ``i`` spans ``ids[indptr[i]:indptr[i + 1]]`` and the matching
+    ``amounts`` slice; ingredients without a numeric amount store NaN.
+    """
+
+    def __init__(self, vocab: IngredientVocabulary) -> None:
+        self.vocab = vocab
+        self.indptr = array("l", [0])
+        self.ids = array("l")
+        self.amounts = array("d")
+
+    def add(self, ingredients: Iterable[Dict[str, Any]]) -> int:
+        """Encode one recipe's normalized ingredient dicts and return its row."""
+        for item in ingredients:
+            self.ids.append(self.vocab.id_for(item.get("name", "")))
+            amount = item.get("amount")
+            self.amounts.append(float(amount) if isinstance(amount, (int, float)) else math.nan)
+        self.indptr.append(len(self.ids))
+        return len(self.indptr) - 2
+
+    def row(self, index: int) -> Tuple[array, array]:
+        """Return ``(ids, amounts)`` for one recipe."""
+        start, end = self.indptr[index], self.indptr[index + 1]
+        return self.ids[start:end], self.amounts[start:end]
+
+    def rows(self) -> Iterable[Tuple[array, array]]:
+        """Yield ``(ids, amounts)`` for every recipe in order."""
+        ids, amounts, indptr = self.ids, self.amounts, self.indptr
+        for i in range(len(indptr) - 1):
+            yield ids[indptr[i]:indptr[i + 1]], amounts[indptr[i]:indptr[i + 1]]
+
+    def to_state(self) -> Dict[str, bytes]:
+        """Return the columns as raw bytes (for caching)."""
+        return {"indptr": self.indptr.tobytes(), "ids": self.ids.tobytes(), "amounts": self.amounts.tobytes()}
+
+    @classmethod
+    def from_state(cls, vocab: IngredientVocabulary, state: Dict[str, bytes]) -> "EncodedRecipes":
+        """Rebuild encoded rows from ``to_state`` output."""
+        encoded = cls(vocab)
+        encoded.indptr = array("l")
+        encoded.indptr.frombytes(state["indptr"])
+        encoded.ids.frombytes(state["ids"])
+        encoded.amounts.frombytes(state["amounts"])
+        return encoded
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
@@ -0,0 +1,118 @@
+"""Makeable set kept up to date from inventory change events."""
+
+from __future__ import annotations
+
+import math
+import sys
+from array import array
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, List, Set, Union
+
+from pymixology.inventory.container import Inventory
+from pymixology.recipes.catalog import RecipeCatalog
+
+# Level of an ingredient that is not stocked, and the requirement recorded for
+# ingredients that only need to be present.
+_MISSING = -math.inf
+_PRESENT = -sys.float_info.max
+
+
+class AvailabilityTracker:
+    """Which catalog recipes the inventory can make right now, kept live.
+
+    Every ingredient id keeps its recipe requirements sorted by amount
+    (``_thresholds``) alongside the recipe positions (``_positions``): this is
+    the ingredient-to-recipe reverse index. The tracker subscribes to the
+    inventory's change events; when the stock of one ingredient moves from an
+    old to a new level, only the requirements between the two levels flip,
+    found with two bisects. Each recipe counts its unmet requirements and the
+    makeable set holds the recipes whose count is zero, so ``is_makeable``
+    and ``count`` are O(1). ``updates`` counts the requirement flips so far.
+
+    As with ``get_makeable_cocktails``, the first inventory item of a name
+    decides its stock and recipes without ingredients are never makeable.
+    """
+
+    def __init__(self, catalog: Union[RecipeCatalog, Iterable[Dict[str, Any]]], inventory: Inventory) -> None:
+        self.catalog = catalog if isinstance(catalog, RecipeCatalog) else RecipeCatalog(catalog)
+        self.vocab = self.catalog.vocab
+        self.inventory = inventory
+        needs: List[List[tuple]] = [[] for _ in range(len(self.vocab))]
+        self._unmet = array("l")
+        for pos, (ids, amounts) in enumerate(self.catalog.encoded.rows()):
+            self._unmet.append(len(ids) if ids else 1)
+            for ingredient_id, amount in zip(ids, amounts):
+                needs[ingredient_id].append((amount if amount > 0 else _PRESENT, pos))
+        self._thresholds: List[array] = []
+        self._positions: List[array] = []
+        for requirements in needs:
+            requirements.sort()
+            self._thresholds.append(array("d", [amount for amount, _ in requirements]))
+            self._positions.append(array("l", [pos for _, pos in requirements]))
+        self._levels: Dict[int, float] = {}
+        self._makeable: Set[int] = set()
+        self.updates = 0
+        for ingredient_id in range(len(self.vocab)):
+            self._refresh(ingredient_id)
+        inventory.add_listener(self._on_stock_change)
+        self._listening = True
+
+    def _level(self, ingredient_id: int) -> float:
+        item = self.inventory.get(self.vocab.name(ingredient_id))
+        return float(item.quantity) if item is not None else _MISSING
+
+    def _refresh(self, ingredient_id: int) -> None:
+        old = self._levels.get(ingredient_id, _MISSING)
+        new = self._level(ingredient_id)
+        if new == old:
+            return
+        if new == _MISSING:
+            del self._levels[ingredient_id]
+        else:
+            self._levels[ingredient_id] = new
+        thresholds = self._thresholds[ingredient_id]
+        low, high = sorted((old, new))
+        start, end = bisect_right(thresholds, low), bisect_right(thresholds, high)
+        step = -1 if new > old else 1
+        unmet, makeable = self._unmet, self._makeable
+        for pos in self._positions[ingredient_id][start:end]:
+            unmet[pos] += step
+            if unmet[pos] == 0:
+                makeable.add(pos)
+            elif step > 0 and unmet[pos] == 1:
+                makeable.discard(pos)
+            self.updates += 1
+
+    def _on_stock_change(self, inventory: Inventory, item_name: str) -> None:
+        ingredient_id = self.vocab.lookup(item_name)
+        if ingredient_id is not None:
+            self._refresh(ingredient_id)
+
+    def is_makeable(self, recipe_name: str) -> bool:
+        """Return True when the named recipe can be made now."""
+        pos = self.catalog.position(recipe_name)
+        return pos is not None and pos in self._makeable
+
+    def count(self) -> int:
+        """Return how many recipes can be made now."""
+        return len(self._makeable)
+
+    def positions(self) -> Set[int]:
+        """Return the live set of makeable catalog positions (do not modify)."""
+        return self._makeable
+
+    def makeable(self) -> List[str]:
+        """Return the names of makeable recipes, in catalog order."""
+        return [self.catalog.field(pos, "name", "") for pos in sorted(self._makeable)]
+
+    def close(self) -> None:
+        """Stop listening to the inventory."""
+        if self._listening:
+            self.inventory.remove_listener(self._on_stock_change)
+            self._listening = False
+
+    def __enter__(self) -> "AvailabilityTracker":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
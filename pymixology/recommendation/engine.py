@@ -0,0 +1,126 @@
+"""Precompiled bitset engine answering "what can I make right now"."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple, Union
+
+from pymixology.inventory.items import Ingredient
+from pymixology.recipes.catalog import RecipeCatalog
+
+Stock = Union[Mapping[str, float], Iterable[Ingredient]]
+
+
+def mask_from_positions(positions: Iterable[int], size: int) -> int:
+    """Build a bitset with the given bit positions set, in one pass."""
+    buffer = bytearray((size + 7) >> 3)
+    for pos in positions:
+        buffer[pos >> 3] |= 1 << (pos & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def iter_bits(mask: int) -> Iterable[int]:
+    """Yield the positions of the set bits of mask, ascending."""
+    bits = bin(mask)[:1:-1]
+    pos = bits.find("1")
+    while pos != -1:
+        yield pos
+        pos = bits.find("1", pos + 1)
+
+
+class MakeableEngine:
+    """Catalog compiled into per-ingredient recipe bitsets.
+
+    Bit ``i`` of every mask stands for recipe ``i`` of the catalog. For each
+    ingredient id the engine keeps the mask of recipes using it, plus the
+    distinct amounts recipes require of it, sorted in an array, with
+    suffix-OR masks: ``_blocked[j][k]`` holds the recipes needing more than
+    ``_thresholds[j][k - 1]`` of ingredient ``j``. A query is one bisect and
+    one OR per stocked ingredient, an OR of the users of every unstocked
+    ingredient, and a final AND-NOT:
+
+        makeable = nonempty & ~(users of unstocked | under-stocked)
+
+    The unstocked part only depends on which ingredients are in stock, so the
+    last one is memoized. The engine is a snapshot of the catalog; build a
+    new one after ``RecipeCatalog.add``.
+    """
+
+    def __init__(self, catalog: Union[RecipeCatalog, Iterable[Dict[str, Any]]]) -> None:
+        self.catalog = catalog if isinstance(catalog, RecipeCatalog) else RecipeCatalog(catalog)
+        self.vocab = self.catalog.vocab
+        size = len(self.catalog)
+        users: List[List[int]] = [[] for _ in range(len(self.vocab))]
+        needs: List[Dict[float, List[int]]] = [{} for _ in range(len(self.vocab))]
+        nonempty = []
+        for pos, (ids, amounts) in enumerate(self.catalog.encoded.rows()):
+            if ids:
+                nonempty.append(pos)
+            for ingredient_id, amount in zip(ids, amounts):
+                users[ingredient_id].append(pos)
+                # NaN amounts (no numeric requirement) fail this test.
+                if amount > 0:
+                    needs[ingredient_id].setdefault(amount, []).append(pos)
+        self._nonempty = mask_from_positions(nonempty, size)
+        self._users = [mask_from_positions(positions, size) for positions in users]
+        self._thresholds: List[array] = []
+        self._blocked: List[List[int]] = []
+        for by_amount in needs:
+            amounts = sorted(by_amount)
+            blocked = [0] * (len(amounts) + 1)
+            for k in range(len(amounts) - 1, -1, -1):
+                blocked[k] = blocked[k + 1] | mask_from_positions(by_amount[amounts[k]], size)
+            self._thresholds.append(array("d", amounts))
+            self._blocked.append(blocked)
+        self._missing_cache: Optional[Tuple[FrozenSet[int], int]] = None
+
+    def stock_levels(self, stock: Stock) -> Dict[int, float]:
+        """Map ingredient ids to quantity from a name mapping or inventory items.
+
+        Names missing from the catalog's vocabulary are ignored; the first
+        item of a repeated name wins, like the manager lookups.
+        """
+        items = stock.items() if isinstance(stock, Mapping) else ((item.name, item.quantity) for item in stock)
+        levels: Dict[int, float] = {}
+        for name, quantity in items:
+            ingredient_id = self.vocab.lookup(name)
+            if ingredient_id is not None and ingredient_id not in levels:
+                levels[ingredient_id] = quantity
+        return levels
+
+    def _missing_mask(self, stocked: FrozenSet[int]) -> int:
+        cached = self._missing_cache
+        if cached is not None and cached[0] == stocked:
+            return cached[1]
+        missing = 0
+        for ingredient_id, users in enumerate(self._users):
+            if ingredient_id not in stocked:
+                missing |= users
+        self._missing_cache = (stocked, missing)
+        return missing
+
+    def blocked_mask(self, levels: Dict[int, float]) -> int:
+        """Return the recipes that cannot be made at the given stock levels."""
+        blocked = self._missing_mask(frozenset(levels))
+        for ingredient_id, quantity in levels.items():
+            thresholds = self._thresholds[ingredient_id]
+            at = bisect_right(thresholds, quantity)
+            if at < len(thresholds):
+                blocked |= self._blocked[ingredient_id][at]
+        return blocked
+
+    def makeable_mask(self, stock: Stock) -> int:
+        """Return the bitset of recipes makeable from stock."""
+        return self._nonempty & ~self.blocked_mask(self.stock_levels(stock))
+
+    def makeable(self, stock: Stock) -> List[str]:
+        """Return the names of makeable recipes, in catalog order."""
+        catalog = self.catalog
+        return [catalog.field(pos, "name", "") for pos in iter_bits(self.makeable_mask(stock))]
+
+    def __len__(self) -> int:
+        return len(self.catalog)
+
+    def __repr__(self) -> str:
+        return f"MakeableEngine({len(self.catalog)} recipes, {len(self.vocab)} ingredients)"
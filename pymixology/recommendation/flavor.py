@@ -0,0 +1,127 @@
+"""Numeric flavor vectors for recipes and top-k scoring against user profiles."""
+
+from __future__ import annotations
+
+import heapq
+from array import array
+from itertools import repeat
+from operator import add, mul
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple
+
+from ..exceptions import RecommendationError
+
+# Same axes and 0-10 scale as preference.set_flavor_profile.
+FLAVOR_AXES = ("sweet", "sour", "bitter", "strong")
+
+# Categorical ``flavor`` labels used in the recipe data, as (sweet, sour, bitter, strong).
+FLAVOR_VECTORS: Dict[str, Tuple[float, float, float, float]] = {
+    "sweet": (9.0, 0.0, 0.0, 0.0),
+    "sour": (0.0, 9.0, 0.0, 0.0),
+    "bitter": (0.0, 0.0, 9.0, 0.0),
+    "strong": (0.0, 0.0, 0.0, 9.0),
+    "citrus": (2.0, 8.0, 1.0, 0.0),
+    "refreshing": (4.0, 4.0, 0.0, 1.0),
+    "tropical": (7.0, 3.0, 0.0, 2.0),
+    "spicy": (2.0, 0.0, 3.0, 5.0),
+    "berry": (6.0, 4.0, 0.0, 0.0),
+    "herbal": (2.0, 1.0, 5.0, 1.0),
+    "creamy": (7.0, 0.0, 0.0, 3.0),
+    "coffee": (3.0, 0.0, 6.0, 4.0),
+    "floral": (5.0, 1.0, 2.0, 0.0),
+}
+
+_ZERO = (0.0, 0.0, 0.0, 0.0)
+
+
+def flavor_vector(recipe: Dict[str, Any]) -> Tuple[float, ...]:
+    """Return a recipe's (sweet, sour, bitter, strong) vector.
+
+    An explicit ``flavor_vector`` (a mapping by axis or a 4-item sequence)
+    wins; otherwise the categorical ``flavor`` label is looked up in
+    FLAVOR_VECTORS, and unknown labels map to zeros.
+
+    Raises:
+        RecommendationError: If flavor_vector has the wrong length.
+    """
+    explicit = recipe.get("flavor_vector")
+    if isinstance(explicit, Mapping):
+        return tuple(float(explicit.get(axis, 0.0)) for axis in FLAVOR_AXES)
+    if explicit is not None:
+        if len(explicit) != len(FLAVOR_AXES):
+            raise RecommendationError(f"flavor_vector needs {len(FLAVOR_AXES)} values.")
+        return tuple(float(value) for value in explicit)
+    return FLAVOR_VECTORS.get(str(recipe.get("flavor", "")).lower().strip(), _ZERO)
+
+
+def profile_vector(user_profile: Mapping[str, float]) -> Tuple[float, ...]:
+    """Return a user profile as a vector over FLAVOR_AXES (missing axes are 0).
+
+    Raises:
+        RecommendationError: If profile contains invalid values.
+    """
+    for key, val in user_profile.items():
+        if val < 0:
+            raise RecommendationError(f"Invalid profile value for {key}: {val}")
+    return tuple(float(user_profile.get(axis, 0)) for axis in FLAVOR_AXES)
+
+
+class FlavorMatrix:
+    """Flavor vectors of many recipes stored as one column-major matrix.
+
+    Each flavor axis is one ``array('d')`` column with a row per recipe.
+    Scoring a profile is a matrix-vector product (one multiply pass per
+    column) and the best k rows are picked with ``heapq.nlargest`` instead of
+    sorting every score. Only recipes scoring above zero are recommended, as
+    in ``recommend_by_flavor``.
+    """
+
+    def __init__(self, recipes: Iterable[Dict[str, Any]] = ()) -> None:
+        self.names: List[str] = []
+        self.columns: List[array] = [array("d") for _ in FLAVOR_AXES]
+        for recipe in recipes:
+            self.add(recipe)
+
+    def add(self, recipe: Dict[str, Any]) -> int:
+        """Append one recipe's vector and return its row."""
+        for column, value in zip(self.columns, flavor_vector(recipe)):
+            column.append(value)
+        self.names.append(recipe.get("name", ""))
+        return len(self.names) - 1
+
+    def scores(self, user_profile: Mapping[str, float]) -> array:
+        """Return the dot product of every recipe vector with the profile."""
+        weights = profile_vector(user_profile)
+        result = array("d", [0.0]) * len(self.names)
+        for column, weight in zip(self.columns, weights):
+            if weight:
+                result = array("d", map(add, result, map(mul, column, repeat(weight))))
+        return result
+
+    def _top(self, scores: Sequence[float], k: int) -> List[Tuple[str, float]]:
+        # nlargest is stable, so equal scores keep catalog order.
+        best = heapq.nlargest(k, (row for row in range(len(scores)) if scores[row] > 0), key=scores.__getitem__)
+        return [(self.names[row], scores[row]) for row in best]
+
+    def top_k(self, user_profile: Mapping[str, float], k: int = 5) -> List[Tuple[str, float]]:
+        """Return the k best ``(name, score)`` recipes for one profile.
+
+        Raises:
+            RecommendationError: If profile contains invalid values.
+        """
+        return self._top(self.scores(user_profile), k)
+
+    def scores_batch(self, user_profiles: Sequence[Mapping[str, float]]) -> List[array]:
+        """Return one score row per profile (the profiles x recipes product).
+
+        Raises:
+            RecommendationError: If any profile contains invalid values.
+        """
+        return [self.scores(profile) for profile in user_profiles]
+
+    def top_k_batch(self, user_profiles: Sequence[Mapping[str, float]], k: int = 5) -> List[List[Tuple[str, float]]]:
+        """Return the k best ``(name, score)`` recipes for each of several profiles."""
+        return [self._top(scores, k) for scores in self.scores_batch(user_profiles)]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
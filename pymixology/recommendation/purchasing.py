@@ -0,0 +1,203 @@
+"""Near-miss recipes and which bottles to buy next."""
+
+from __future__ import annotations
+
+import heapq
+import math
+import sys
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from itertools import chain
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from pymixology.inventory import manager
+from pymixology.inventory.manager import _item_finder
+from pymixology.recipes.catalog import RecipeCatalog
+from ..exceptions import RecommendationError
+
+# Requirement recorded for ingredients that only need to be present.
+_PRESENT = -sys.float_info.max
+
+
+class PurchasePlanner:
+    """Counting index over a catalog for purchasing questions.
+
+    Each ingredient id keeps the recipes using it sorted by the amount they
+    need (the largest, when a recipe lists it twice). Given stock levels, the
+    recipes an ingredient fails are a suffix of that list, found with one
+    bisect, so counting every recipe's missing ingredients is one pass over
+    the unmet requirements only.
+
+    "Missing" follows ``get_makeable_cocktails``: an ingredient is missing
+    when it is not stocked or is below the amount the recipe needs. With
+    ``min_threshold``, names on ``manager.get_shopping_list`` are treated as
+    missing too.
+    """
+
+    def __init__(self, catalog: Union[RecipeCatalog, Iterable[Dict[str, Any]]]) -> None:
+        self.catalog = catalog if isinstance(catalog, RecipeCatalog) else RecipeCatalog(catalog)
+        self.vocab = self.catalog.vocab
+        needs: List[Dict[int, float]] = [{} for _ in range(len(self.vocab))]
+        self._display: Dict[int, str] = {}
+        self._sizes = array("l")
+        for pos, (ids, amounts) in enumerate(self.catalog.encoded.rows()):
+            for ingredient_id, amount in zip(ids, amounts):
+                required = amount if amount > 0 else _PRESENT
+                by_recipe = needs[ingredient_id]
+                by_recipe[pos] = max(by_recipe.get(pos, _PRESENT), required)
+            self._sizes.append(len(set(ids)))
+        for recipe in self.catalog:
+            for item in recipe.get("ingredients", []):
+                name = item.get("name", "") if isinstance(item, dict) else str(item)
+                self._display.setdefault(self.vocab.lookup(name), name)
+        self._thresholds: List[array] = []
+        self._positions: List[array] = []
+        for by_recipe in needs:
+            requirements = sorted((amount, pos) for pos, amount in by_recipe.items())
+            self._thresholds.append(array("d", [amount for amount, _ in requirements]))
+            self._positions.append(array("l", [pos for _, pos in requirements]))
+
+    def _levels(self, inventory_list: Any, min_threshold: Optional[float]) -> List[float]:
+        find = _item_finder(inventory_list)
+        restock: Set[int] = set()
+        if min_threshold is not None:
+            for name in manager.get_shopping_list(inventory_list, min_threshold):
+                ingredient_id = self.vocab.lookup(name)
+                if ingredient_id is not None:
+                    restock.add(ingredient_id)
+        levels = []
+        for ingredient_id in range(len(self.vocab)):
+            item = find(self.vocab.name(ingredient_id))
+            missing = item is None or ingredient_id in restock
+            levels.append(-math.inf if missing else float(item.quantity))
+        return levels
+
+    def _unmet(self, levels: List[float]) -> Iterator[Tuple[int, array]]:
+        """Yield each ingredient id with the positions of recipes it fails."""
+        for ingredient_id, level in enumerate(levels):
+            thresholds = self._thresholds[ingredient_id]
+            start = bisect_right(thresholds, level)
+            if start < len(thresholds):
+                yield ingredient_id, self._positions[ingredient_id][start:]
+
+    def missing_counts(self, inventory_list: Any, min_threshold: Optional[float] = None) -> array:
+        """Return, for every recipe, how many of its ingredients are missing."""
+        counts = array("l", [0]) * len(self.catalog)
+        unmet = self._unmet(self._levels(inventory_list, min_threshold))
+        for pos, count in Counter(chain.from_iterable(positions for _, positions in unmet)).items():
+            counts[pos] = count
+        return counts
+
+    def _missing_sets(self, levels: List[float], max_missing: int) -> Dict[int, List[int]]:
+        """Return missing ingredient ids of recipes missing at most max_missing."""
+        unmet = list(self._unmet(levels))
+        counts = Counter(chain.from_iterable(positions for _, positions in unmet))
+        missing: Dict[int, List[int]] = {
+            pos: [] for pos in range(len(self.catalog)) if self._sizes[pos] and counts.get(pos, 0) <= max_missing
+        }
+        for ingredient_id, positions in unmet:
+            for pos in filter(missing.__contains__, positions):
+                missing[pos].append(ingredient_id)
+        return missing
+
+    def near_misses(
+        self, inventory_list: Any, k: int = 1, min_threshold: Optional[float] = None,
+    ) -> List[Tuple[str, List[str]]]:
+        """Return ``(recipe, missing ingredients)`` for recipes missing at most k.
+
+        Results are ordered by how many ingredients are missing, then by
+        catalog order; makeable recipes come first with nothing missing.
+
+        Raises:
+            RecommendationError: If k is negative.
+        """
+        if k < 0:
+            raise RecommendationError("k must not be negative.")
+        missing = self._missing_sets(self._levels(inventory_list, min_threshold), k)
+        order = sorted(missing, key=lambda pos: len(missing[pos]))
+        return [(self.catalog.field(pos, "name", ""), self._names(missing[pos])) for pos in order]
+
+    def _names(self, ingredient_ids: Iterable[int]) -> List[str]:
+        return [self._display.get(ingredient_id, self.vocab.name(ingredient_id)) for ingredient_id in ingredient_ids]
+
+    def best_bottles(
+        self, inventory_list: Any, n: int, min_threshold: Optional[float] = None,
+    ) -> List[Tuple[str, List[str]]]:
+        """Pick up to n bottles that unlock the most new recipes, greedily.
+
+        Only recipes missing at most the remaining budget can still be
+        completed. Each step buys the bottle completing the most of them,
+        breaking ties by progress (the sum of ``1 / still missing`` over the
+        recipes it appears in). Scores are evaluated lazily from a heap: when
+        a bottle is bought, the ingredients sharing a recipe with it are
+        re-scored through the ingredient-to-recipe index (their scores can
+        only rise), while scores that fall as the budget shrinks are only
+        recomputed when popped. Returns ``(bottle, recipes it unlocked)`` per
+        pick; stops early when no bottle helps.
+
+        Raises:
+            RecommendationError: If n is negative.
+        """
+        if n < 0:
+            raise RecommendationError("n must not be negative.")
+        missing = {
+            pos: set(ids) for pos, ids in self._missing_sets(self._levels(inventory_list, min_threshold), n).items()
+            if ids
+        }
+        by_ingredient: Dict[int, List[int]] = {}
+        for pos, ids in missing.items():
+            for ingredient_id in ids:
+                by_ingredient.setdefault(ingredient_id, []).append(pos)
+        # counts[j][s]: recipes still missing s ingredients, j among them.
+        counts: Dict[int, List[int]] = {ingredient_id: [0] * (n + 1) for ingredient_id in by_ingredient}
+        for size in range(1, n + 1):
+            bucket = (ids for ids in missing.values() if len(ids) == size)
+            for ingredient_id, count in Counter(chain.from_iterable(bucket)).items():
+                counts[ingredient_id][size] = count
+
+        budget = n
+
+        def score(ingredient_id: int) -> Tuple[int, float]:
+            by_size = counts[ingredient_id]
+            return by_size[1], sum(by_size[size] / size for size in range(1, budget + 1))
+
+        heap = []
+        for ingredient_id in counts:
+            completes, progress = score(ingredient_id)
+            heap.append((-completes, -progress, ingredient_id))
+        heapq.heapify(heap)
+
+        picks: List[Tuple[str, List[str]]] = []
+        while budget and heap:
+            neg_completes, neg_progress, ingredient_id = heapq.heappop(heap)
+            if ingredient_id not in counts:
+                continue
+            current = score(ingredient_id)
+            if current == (0, 0):
+                continue
+            if current != (-neg_completes, -neg_progress):
+                heapq.heappush(heap, (-current[0], -current[1], ingredient_id))
+                continue
+            budget -= 1
+            touched: Set[int] = set()
+            unlocked = []
+            for pos in sorted(by_ingredient.pop(ingredient_id)):
+                ids = missing[pos]
+                size = len(ids)
+                ids.discard(ingredient_id)
+                if not ids:
+                    del missing[pos]
+                    unlocked.append(self.catalog.field(pos, "name", ""))
+                    continue
+                for other in ids:
+                    by_size = counts[other]
+                    by_size[size] -= 1
+                    by_size[size - 1] += 1
+                touched.update(ids)
+            del counts[ingredient_id]
+            for other in touched:
+                completes, progress = score(other)
+                heapq.heappush(heap, (-completes, -progress, other))
+            picks.append((self._names([ingredient_id])[0], unlocked))
+        return picks
@@ -0,0 +1,315 @@
+"""Nearest-neighbour index for "more like this" recipe suggestions."""
+
+from __future__ import annotations
+
+import heapq
+import marshal
+import math
+import os
+import random
+import struct
+from array import array
+from itertools import repeat
+from operator import lshift, mul, or_
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from pymixology.recipes.catalog import RecipeCatalog
+from pymixology.recipes.tools import calculate_abv
+from pymixology.recipes.units import DEFAULT_REGISTRY
+from pymixology.recipes.vocab import _normalize_key
+from .flavor import FLAVOR_AXES, flavor_vector
+from ..exceptions import DataLoadError, RecommendationError
+
+# Feature layout: flavor axes, then the two ABV components, then one feature
+# per ingredient id.
+_ABV_FEATURE = len(FLAVOR_AXES)
+_INGREDIENT_BASE = _ABV_FEATURE + 2
+
+# Width of one MinHash value.
+_HASH_BITS = 31
+
+_MAGIC = b"PMXI"
+_VERSION = 3
+# magic, format version, marshal version
+_HEADER = struct.Struct("<4sHH")
+
+Query = Union[str, Dict[str, Any]]
+
+
+def recipe_abv(recipe: Dict[str, Any], abv_table: Optional[Mapping[str, float]] = None) -> float:
+    """Estimate a recipe's ABV with ``calculate_abv``.
+
+    A numeric ``abv`` on the recipe wins. Otherwise each ingredient with a
+    numeric amount contributes its volume at its own ``abv`` or, failing
+    that, the one in abv_table (keyed by normalized ingredient name); unknown
+    ingredients count as 0% ABV. Volumes are converted to ml with the default
+    UnitRegistry (amounts without a unit are taken as ml); ingredients in
+    units it does not know, such as leaves or pieces, are left out.
+    """
+    if isinstance(recipe.get("abv"), (int, float)):
+        return float(recipe["abv"])
+    table = abv_table or {}
+    parts = []
+    for item in recipe.get("ingredients", []):
+        if not isinstance(item, dict):
+            continue
+        unit = item.get("unit")
+        if unit is not None and not DEFAULT_REGISTRY.knows(unit):
+            continue
+        amount = item.get("amount")
+        volume = amount if isinstance(amount, (int, float)) and amount > 0 else 0
+        if unit is not None and volume:
+            volume *= DEFAULT_REGISTRY.factor(unit, "ml")
+        abv = item.get("abv")
+        if not isinstance(abv, (int, float)):
+            abv = table.get(_normalize_key(item.get("name", "")), 0.0)
+        parts.append({"vol": volume, "abv": abv})
+    return calculate_abv(parts)
+
+
+class SimilarityIndex:
+    """Locality-sensitive hashing index answering "recipes like this one".
+
+    Every recipe becomes a sparse vector of three unit-length blocks, each
+    scaled by the square root of its weight: the set of ingredients (one
+    feature per ingredient id), the flavor vector from ``flavor_vector``, and
+    the ABV as an angle (``abv / 100 * pi / 2``), so the cosine of two
+    recipes is the weighted sum of their per-block cosines.
+
+    Candidates come from MinHash banding over ingredient sets: each of
+    ``bands`` hash tables is keyed by ``rows`` minimum hashes of a recipe's
+    ingredient ids, so recipes sharing many ingredients collide in some band
+    with high probability while unrelated ones rarely do. A query scores only
+    those candidates by their exact cosine, widening to every recipe sharing
+    an ingredient, then to a full scan, when they are fewer than k. Hash
+    values are drawn per ingredient id from ``seed``, so new ingredients can
+    arrive with new recipes.
+    """
+
+    def __init__(
+        self,
+        catalog: Union[RecipeCatalog, Iterable[Dict[str, Any]]] = (),
+        abv_table: Optional[Mapping[str, float]] = None,
+        weights: Tuple[float, float, float] = (0.6, 0.25, 0.15),
+        bands: int = 32,
+        rows: int = 2,
+        seed: int = 533,
+    ) -> None:
+        if bands < 1 or rows < 1:
+            raise ValueError("bands and rows must be positive.")
+        if len(weights) != 3 or min(weights) < 0 or not sum(weights):
+            raise ValueError("weights must be three non-negative numbers, not all zero.")
+        self.catalog = catalog if isinstance(catalog, RecipeCatalog) else RecipeCatalog(catalog)
+        self.abv_table = {_normalize_key(name): float(abv) for name, abv in (abv_table or {}).items()}
+        self.weights = tuple(float(weight) for weight in weights)
+        self.bands = bands
+        self.rows = rows
+        self.seed = seed
+        self._scales = tuple(math.sqrt(weight) for weight in self.weights)
+        self._hashes: List[array] = []
+        self.indptr = array("l", [0])
+        self.features = array("l")
+        self.values = array("d")
+        self.norms = array("d")
+        self._buckets: List[Dict[int, List[int]]] = [{} for _ in range(bands)]
+        self.refresh()
+
+    def _hash(self, ingredient_id: int) -> array:
+        while len(self._hashes) <= ingredient_id:
+            rng = random.Random(self.seed * 1_000_003 + len(self._hashes))
+            self._hashes.append(array("l", [rng.getrandbits(_HASH_BITS) for _ in range(self.bands * self.rows)]))
+        return self._hashes[ingredient_id]
+
+    def _vector(self, recipe: Dict[str, Any], ingredient_ids: Iterable[int]) -> Dict[int, float]:
+        ing_scale, flavor_scale, abv_scale = self._scales
+        vector: Dict[int, float] = {}
+        if flavor_scale:
+            flavor = flavor_vector(recipe)
+            norm = math.sqrt(sum(value * value for value in flavor))
+            if norm:
+                for axis, value in enumerate(flavor):
+                    if value:
+                        vector[axis] = flavor_scale * value / norm
+        if abv_scale:
+            angle = min(max(recipe_abv(recipe, self.abv_table), 0.0), 100.0) / 100.0 * math.pi / 2
+            vector[_ABV_FEATURE] = abv_scale * math.cos(angle)
+            vector[_ABV_FEATURE + 1] = abv_scale * math.sin(angle)
+        ids = set(ingredient_ids)
+        if ing_scale and ids:
+            value = ing_scale / math.sqrt(len(ids))
+            for ingredient_id in ids:
+                vector[_INGREDIENT_BASE + ingredient_id] = value
+        return vector
+
+    def _keys(self, ingredient_ids: Iterable[int]) -> List[int]:
+        """Return one bucket key per band for an ingredient set (none when empty)."""
+        hashes = [self._hash(ingredient_id) for ingredient_id in set(ingredient_ids)]
+        if not hashes:
+            return []
+        signature = array("l", map(min, *hashes)) if len(hashes) > 1 else hashes[0]
+        # Band b is signature[b * rows:(b + 1) * rows], packed into one int; strided
+        # slices fold every band at once.
+        keys = list(signature[::self.rows])
+        for row in range(1, self.rows):
+            keys = list(map(or_, map(lshift, keys, repeat(_HASH_BITS)), signature[row::self.rows]))
+        return keys
+
+    def refresh(self) -> int:
+        """Index recipes appended to the catalog since the last call; return how many."""
+        start = len(self)
+        for pos in range(start, len(self.catalog)):
+            ids, _ = self.catalog.encoded.row(pos)
+            vector = self._vector(self.catalog[pos], ids)
+            for feature in sorted(vector):
+                self.features.append(feature)
+                self.values.append(vector[feature])
+            self.indptr.append(len(self.features))
+            self.norms.append(math.sqrt(sum(value * value for value in vector.values())))
+            for buckets, key in zip(self._buckets, self._keys(ids)):
+                buckets.setdefault(key, []).append(pos)
+        return len(self.catalog) - start
+
+    def add(self, recipe: Dict[str, Any]) -> int:
+        """Append a recipe to the catalog, index it and return its position."""
+        self.catalog.add(recipe)
+        self.refresh()
+        return len(self.catalog) - 1
+
+    def _query(self, query: Query) -> Tuple[Dict[int, float], List[int], Optional[int]]:
+        """Return a query's vector, ingredient ids and own position (None for a dict)."""
+        if isinstance(query, str):
+            pos = self.catalog.position(query)
+            if pos is None or pos >= len(self):
+                raise RecommendationError(f"Recipe '{query}' is not in the index.")
+            start, end = self.indptr[pos], self.indptr[pos + 1]
+            ids, _ = self.catalog.encoded.row(pos)
+            return dict(zip(self.features[start:end], self.values[start:end])), list(ids), pos
+        vocab = self.catalog.vocab
+        ids = []
+        for item in query.get("ingredients", []):
+            ingredient_id = vocab.lookup(item.get("name", "") if isinstance(item, dict) else str(item))
+            if ingredient_id is not None:
+                ids.append(ingredient_id)
+        return self._vector(query, ids), ids, None
+
+    def _score(self, vector: Dict[int, float], norm: float, pos: int) -> float:
+        start, end = self.indptr[pos], self.indptr[pos + 1]
+        dot = sum(map(mul, self.values[start:end], map(vector.get, self.features[start:end], repeat(0.0))))
+        other = self.norms[pos]
+        return dot / (norm * other) if norm and other else 0.0
+
+    def candidates(self, query: Query, k: int = 5) -> List[int]:
+        """Return the positions a query would score, ascending (unranked).
+
+        Raises:
+            RecommendationError: If a named recipe is not indexed.
+        """
+        _, ids, skip = self._query(query)
+        return self._candidates(ids, skip, k)
+
+    def _candidates(self, ingredient_ids: List[int], skip: Optional[int], k: int) -> List[int]:
+        found = set()
+        for buckets, key in zip(self._buckets, self._keys(ingredient_ids)):
+            found.update(buckets.get(key, ()))
+        found.discard(skip)
+        if len(found) < k:
+            size = len(self)
+            for ingredient_id in set(ingredient_ids):
+                found.update(pos for pos in self.catalog.positions_with(ingredient_id) if pos < size)
+            found.discard(skip)
+        if len(found) < k:
+            found = set(range(len(self)))
+            found.discard(skip)
+        return sorted(found)
+
+    def neighbors(self, query: Query, k: int = 5, exact: bool = False) -> List[Tuple[str, float]]:
+        """Return up to k ``(name, cosine)`` recipes most like the query, best first.
+
+        The query is a recipe name in the index (which is left out of the
+        results) or a recipe dict. ``exact=True`` scores every recipe instead
+        of the LSH candidates. Equal scores keep catalog order.
+
+        Raises:
+            RecommendationError: If k is negative or a named recipe is not indexed.
+        """
+        if k < 0:
+            raise RecommendationError("k must not be negative.")
+        vector, ids, skip = self._query(query)
+        if exact:
+            positions: Iterable[int] = (pos for pos in range(len(self)) if pos != skip)
+        else:
+            positions = self._candidates(ids, skip, k)
+        norm = math.sqrt(sum(value * value for value in vector.values()))
+        scored = [(self._score(vector, norm, pos), pos) for pos in positions]
+        best = heapq.nlargest(k, scored, key=lambda pair: pair[0])
+        return [(self.catalog.field(pos, "name", ""), score) for score, pos in best]
+
+    def to_state(self) -> Dict[str, Any]:
+        """Return the index and its catalog as plain built-in containers."""
+        return {
+            "catalog": self.catalog.to_state(),
+            "abv_table": self.abv_table,
+            "weights": self.weights,
+            "bands": self.bands,
+            "rows": self.rows,
+            "seed": self.seed,
+            "indptr": self.indptr.tobytes(),
+            "features": self.features.tobytes(),
+            "values": self.values.tobytes(),
+            "norms": self.norms.tobytes(),
+            "buckets": self._buckets,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "SimilarityIndex":
+        """Rebuild an index from ``to_state`` output without re-hashing."""
+        index = cls(weights=state["weights"], bands=state["bands"], rows=state["rows"], seed=state["seed"])
+        index.catalog = RecipeCatalog.from_state(state["catalog"])
+        index.abv_table = state["abv_table"]
+        index.indptr = array("l")
+        index.indptr.frombytes(state["indptr"])
+        index.features.frombytes(state["features"])
+        index.values.frombytes(state["values"])
+        index.norms.frombytes(state["norms"])
+        index._buckets = state["buckets"]
+        return index
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the index to path, replacing any existing file atomically."""
+        target = Path(path)
+        tmp = target.with_name(target.name + ".tmp")
+        try:
+            with tmp.open("wb") as f:
+                f.write(_HEADER.pack(_MAGIC, _VERSION, marshal.version))
+                marshal.dump(self.to_state(), f)
+            os.replace(tmp, target)
+        except (OSError, ValueError):
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+            raise
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "SimilarityIndex":
+        """Read an index written by ``save``.
+
+        Raises:
+            DataLoadError: If the file is missing, corrupt or from another format version.
+        """
+        try:
+            with Path(path).open("rb") as f:
+                data = f.read()
+            magic, version, marshal_version = _HEADER.unpack_from(data, 0)
+            if magic != _MAGIC or version != _VERSION or marshal_version != marshal.version:
+                raise DataLoadError(f"{path} is not a similarity index of this version.")
+            return cls.from_state(marshal.loads(data[_HEADER.size:]))
+        except (OSError, ValueError, EOFError, TypeError, KeyError, struct.error) as e:
+            raise DataLoadError(f"Could not load similarity index from {path}: {e}") from e
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+
+    def __repr__(self) -> str:
+        return f"SimilarityIndex({len(self)} recipes, {self.bands} bands of {self.rows})"
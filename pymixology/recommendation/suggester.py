@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+import heapq
 import random
-from typing import Iterable, List, Dict, Any
+from bisect import bisect_left
+from itertools import accumulate, repeat
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Tuple
 
 from pymixology.inventory.items import Ingredient
+from pymixology.recipes.catalog import RecipeCatalog
+from pymixology.recipes.vocab import _normalize_key
+from .engine import MakeableEngine
+from .flavor import FlavorMatrix
 from ..exceptions import RecommendationError
 
 
@@ -34,8 +41,20 @@ def _has_required_amount(required: Dict[str, Any], inventory_item: Ingredient) -
 
 
 def get_makeable_cocktails(inventory_list: List[Ingredient], recipe_db: Iterable[Dict[str, Any]]) -> List[str]:
-    """Return cocktail names that can be made with current inventory."""
-    inventory_lookup = {item.name.lower(): item for item in inventory_list}
+    """Return cocktail names that can be made with current inventory.
+
+    ``recipe_db`` may also be a precompiled MakeableEngine, which answers with
+    a few bitset operations instead of walking every recipe. Whatever the
+    form of ``recipe_db``, the first inventory item of a repeated name decides
+    its stock, like the manager lookups.
+    """
+    if isinstance(recipe_db, MakeableEngine):
+        return recipe_db.makeable(inventory_list)
+    if isinstance(recipe_db, RecipeCatalog):
+        return _makeable_encoded(inventory_list, recipe_db)
+    inventory_lookup: Dict[str, Ingredient] = {}
+    for item in inventory_list:
+        inventory_lookup.setdefault(item.name.lower(), item)
     ready: List[str] = []
     for recipe in recipe_db:
         normalized_ingredients = [_normalize_ingredient(item) for item in recipe.get("ingredients", [])]
@@ -53,8 +72,35 @@ def get_makeable_cocktails(inventory_list: List[Ingredient], recipe_db: Iterable
     return ready
 
 
+def _makeable_encoded(inventory_list: List[Ingredient], catalog: RecipeCatalog) -> List[str]:
+    """Integer-id version of get_makeable_cocktails for compiled catalogs."""
+    vocab = catalog.vocab
+    stock: Dict[int, float] = {}
+    for item in inventory_list:
+        ingredient_id = vocab.lookup(item.name)
+        if ingredient_id is not None and ingredient_id not in stock:
+            stock[ingredient_id] = item.quantity
+    ready: List[str] = []
+    for pos, (ids, amounts) in enumerate(catalog.encoded.rows()):
+        if not ids:
+            continue
+        for ingredient_id, amount in zip(ids, amounts):
+            have = stock.get(ingredient_id)
+            # NaN amounts (no numeric requirement) only need the item present.
+            if have is None or (amount > 0 and have < amount):
+                break
+        else:
+            ready.append(catalog.field(pos, "name", ""))
+    return ready
+
+
 def find_cocktails_with_ingredients(target_ingredients: List[str], recipe_db: Iterable[Dict[str, Any]]) -> List[str]:
     """Recommend cocktails that include any of the target ingredients."""
+    if isinstance(recipe_db, RecipeCatalog):
+        positions = set()
+        for name in target_ingredients:
+            positions.update(recipe_db.positions_with(recipe_db.vocab.lookup(name)))
+        return [recipe_db.field(pos, "name", "") for pos in sorted(positions)]
     targets = {item.lower() for item in target_ingredients}
     matches = []
     for recipe in recipe_db:
@@ -64,12 +110,129 @@ def find_cocktails_with_ingredients(target_ingredients: List[str], recipe_db: It
     return matches
 
 
-def recommend_by_flavor(user_profile: Dict[str, int], recipe_db: Iterable[Dict[str, Any]]) -> List[str]:
+def rank_cocktails_by_ingredients(
+    target_ingredients: List[str],
+    recipe_db: Iterable[Dict[str, Any]],
+    k: int = 10,
+    weights: Optional[Dict[str, float]] = None,
+    mode: str = "overlap",
+) -> List[Tuple[str, float]]:
+    """Return the k best ``(name, score)`` matches for the target ingredients.
+
+    ``mode="overlap"`` scores a recipe by how many targets it uses;
+    ``mode="coverage"`` by the share of the total target weight it covers
+    (weights default to 1). Ties keep catalog order. Given a RecipeCatalog,
+    only the posting lists of the targets are read, and lists too light to
+    lift a recipe into the current top k are only probed, never scanned
+    (MaxScore pruning); a plain list is scored in one pass.
+
+    Raises:
+        RecommendationError: If k or a weight is negative, or mode is unknown.
+    """
+    if mode not in ("overlap", "coverage"):
+        raise RecommendationError(f"Unknown ranking mode: {mode}")
+    if k < 0:
+        raise RecommendationError("k must not be negative.")
+    lookup = {_normalize_key(name): weight for name, weight in (weights or {}).items()}
+    targets = {_normalize_key(name): lookup.get(_normalize_key(name), 1.0) for name in target_ingredients}
+    if mode == "overlap":
+        targets = dict.fromkeys(targets, 1.0)
+    for name, weight in targets.items():
+        if weight < 0:
+            raise RecommendationError(f"Invalid weight for {name}: {weight}")
+    total = sum(targets.values())
+    scale = total if mode == "coverage" and total > 0 else 1.0
+    if not isinstance(recipe_db, RecipeCatalog):
+        return [(recipe.get("name", ""), score / scale) for score, recipe in _top_k_scan(targets, recipe_db, k)]
+    postings = []
+    for name, weight in targets.items():
+        ingredient_id = recipe_db.vocab.lookup(name)
+        if ingredient_id is not None and weight > 0:
+            postings.append((weight, recipe_db.positions_with(ingredient_id)))
+    return [(recipe_db.field(pos, "name", ""), score / scale) for score, pos in _top_k_postings(postings, k)]
+
+
+def _top_k_scan(
+    targets: Dict[str, float], recipe_db: Iterable[Dict[str, Any]], k: int,
+) -> List[Tuple[float, Dict[str, Any]]]:
+    """Score every recipe of a plain list once and keep the k best ``(score, recipe)``."""
+    weight_of = targets.get
+
+    def scored() -> Iterator[Tuple[float, Dict[str, Any]]]:
+        for recipe in recipe_db:
+            keys = {
+                str(item.get("name", "") if isinstance(item, dict) else item).lower().strip()
+                for item in recipe.get("ingredients", [])
+            }
+            score = sum(map(weight_of, keys, repeat(0.0)))
+            if score > 0:
+                yield score, recipe
+
+    # nlargest is stable, so equal scores keep catalog order.
+    return heapq.nlargest(k, scored(), key=lambda pair: pair[0]) if k else []
+
+
+def _top_k_postings(postings: List[Tuple[float, List[int]]], k: int) -> List[Tuple[float, int]]:
+    """Merge ascending posting lists into the k best ``(score, position)`` pairs.
+
+    Document-at-a-time merge with MaxScore pruning: lists are ordered by
+    weight and the lightest ones whose combined weight cannot beat the k-th
+    best score so far stop producing candidates; they are only checked with a
+    bisect for candidates found in the heavier lists.
+    """
+    if k == 0 or not postings:
+        return []
+    postings = sorted(postings, key=lambda term: term[0])
+    weights = [weight for weight, _ in postings]
+    lists = [positions for _, positions in postings]
+    bounds = list(accumulate(weights))
+    cursors = [0] * len(lists)
+    heap: List[Tuple[float, int]] = []  # (score, -position): worst result on top
+    essential = 0
+    while True:
+        pos = min(
+            (lists[i][cursors[i]] for i in range(essential, len(lists)) if cursors[i] < len(lists[i])),
+            default=None,
+        )
+        if pos is None:
+            break
+        score = 0.0
+        for i in range(essential, len(lists)):
+            if cursors[i] < len(lists[i]) and lists[i][cursors[i]] == pos:
+                score += weights[i]
+                cursors[i] += 1
+        for i in range(essential):
+            cursors[i] = bisect_left(lists[i], pos, cursors[i])
+            if cursors[i] < len(lists[i]) and lists[i][cursors[i]] == pos:
+                score += weights[i]
+        if len(heap) < k:
+            heapq.heappush(heap, (score, -pos))
+        elif score > heap[0][0]:
+            heapq.heapreplace(heap, (score, -pos))
+        else:
+            continue
+        if len(heap) == k:
+            threshold = heap[0][0]
+            # Later positions must score strictly higher than the threshold.
+            while essential < len(lists) and bounds[essential] <= threshold:
+                essential += 1
+    return sorted(((score, -neg_pos) for score, neg_pos in heap), key=lambda item: (-item[0], item[1]))
+
+
+def recommend_by_flavor(
+    user_profile: Dict[str, int], recipe_db: Iterable[Dict[str, Any]], k: Optional[int] = None,
+) -> List[str]:
     """Match recipes against user flavor preferences.
+
+    ``recipe_db`` may also be a FlavorMatrix, which scores the numeric flavor
+    vectors with one matrix-vector product and keeps only the best k
+    (default: every positive match).
     
     Raises:
         RecommendationError: If profile contains invalid values.
     """
+    if isinstance(recipe_db, FlavorMatrix):
+        return [name for name, _ in recipe_db.top_k(user_profile, len(recipe_db) if k is None else k)]
     scored = []
     for key, val in user_profile.items():
         if val < 0:
@@ -81,7 +244,7 @@ def recommend_by_flavor(user_profile: Dict[str, int], recipe_db: Iterable[Dict[s
         if score > 0:
             scored.append((score, recipe.get("name", "")))
     scored.sort(reverse=True, key=lambda item: item[0])
-    return [name for _, name in scored]
+    return [name for _, name in scored[:k]]
 
 
 def surprise_me(recipe_db: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
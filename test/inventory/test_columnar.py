@@ -0,0 +1,89 @@
+import unittest
+from pymixology.inventory.items import Ingredient, Spirit, Mixer
+from pymixology.inventory.columnar import ColumnarStore, SpiritView, MixerView
+from pymixology.inventory import manager
+from pymixology.exceptions import IngredientError, InventoryError
+
+class TestColumnarStore(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.threshold = 20.0
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def setUp(self):
+        self.store = ColumnarStore.from_items([
+            Ingredient("Lemon", 10.0, "2024-01-01", value=5.0),
+            Spirit("Gin", 700.0, "2025-01-01", abv=40.0, value=30.0),
+        ])
+        self.soda = self.store.add_mixer("Soda", 330.0, "2024-06-01", is_carbonated=True, value=2.0)
+
+    def tearDown(self):
+        self.store = None
+
+    def test_views(self):
+        gin = self.store.get("gin")
+        self.assertIsInstance(gin, SpiritView)
+        self.assertEqual(gin.get_abv(), 40.0)
+        self.assertIsInstance(self.soda, MixerView)
+        self.assertTrue(self.soda.is_fizzy())
+        self.assertEqual(self.soda.unit_value, 2.0 / 330.0)
+        self.assertFalse(hasattr(gin, "__dict__"))
+        self.assertEqual(self.store[-1], self.soda)
+        self.assertEqual([view.name for view in self.store], ["Lemon", "Gin", "Soda"])
+        with self.assertRaises(IndexError):
+            self.store[3]
+
+        self.assertTrue(gin.use(350.0))
+        self.assertEqual(self.store.check_stock("Gin"), 350.0)
+        self.assertAlmostEqual(gin.current_value(), 15.0)
+        self.assertIn("Qty: 350.0", gin.info())
+        with self.assertRaises(IngredientError):
+            gin.use(1000.0)
+        with self.assertRaises(IngredientError):
+            gin.use(0)
+        self.assertIsNone(self.store.get("Rum"))
+
+    def test_aggregates(self):
+        self.assertAlmostEqual(self.store.total_value(), 37.0)
+        self.assertEqual(self.store.get_shopping_list(self.threshold), ["Lemon"])
+        values = self.store.value_by_category()
+        self.assertAlmostEqual(values["ingredient"], 5.0)
+        self.assertAlmostEqual(values["spirit"], 30.0)
+        self.assertAlmostEqual(values["mixer"], 2.0)
+        self.assertEqual(self.store.quantity_by_category()["spirit"], 700.0)
+
+        self.store.add_ingredient("Sugar", 5.0, "2026-01-01")
+        self.store.add_spirit("Rum", 0.0, "2026-01-01", abv=37.5, value=10.0)
+        self.assertEqual(self.store.get("Rum").unit_value, 0.0)
+
+    def test_manager_functions(self):
+        manager.add_item(self.store, Spirit("Rum", 10.0, "2026-01-01", abv=40.0, value=1.0))
+        self.assertIn("rum", self.store)
+        self.assertEqual(len(self.store), 4)
+        self.assertAlmostEqual(manager.total_value(self.store), 38.0)
+        self.assertEqual(manager.get_shopping_list(self.store, self.threshold), ["Lemon", "Rum"])
+        self.assertEqual(manager.check_stock(self.store, "SODA"), 330.0)
+        with self.assertRaises(TypeError):
+            self.store.add("Not an Ingredient")
+
+    def test_remove(self):
+        self.store.add_ingredient("Lemon", 3.0, "2024-02-01", value=1.0)
+        self.assertTrue(manager.remove_item(self.store, "gin"))
+        self.assertNotIn("gin", self.store)
+        self.assertEqual([view.name for view in self.store], ["Lemon", "Soda", "Lemon"])
+        self.assertEqual(self.store.check_stock("soda"), 330.0)
+        self.assertAlmostEqual(manager.total_value(self.store), 8.0)
+        lemon = self.store.remove_name("LEMON")
+        self.assertIsInstance(lemon, Ingredient)
+        self.assertEqual((lemon.quantity, lemon.unit_value), (10.0, 0.5))
+        self.assertEqual(self.store.check_stock("lemon"), 3.0)
+        del self.store[0]
+        self.assertEqual([view.name for view in self.store], ["Lemon"])
+        with self.assertRaises(InventoryError):
+            manager.remove_item(self.store, "Gin")
+        with self.assertRaises(IndexError):
+            del self.store[1]
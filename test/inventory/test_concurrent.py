@@ -0,0 +1,113 @@
+import copy
+import pickle
+import threading
+import unittest
+from pymixology.inventory.items import Ingredient, Spirit
+from pymixology.inventory.concurrent import ConcurrentInventory
+from pymixology.inventory import manager
+from pymixology.exceptions import IngredientError, InventoryError
+
+class TestConcurrentInventory(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.threads = 8
+        cls.pours_per_thread = 200
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def setUp(self):
+        self.gin = Spirit("Gin", 1000.0, "2030-01-01", abv=40.0, value=100.0)
+        self.lime = Ingredient("Lime", 50.0, "2025-01-01", value=5.0)
+        self.inventory = ConcurrentInventory([self.gin, self.lime], stripes=4)
+
+    def tearDown(self):
+        self.inventory.clear()
+
+    def test_compare_and_decrement(self):
+        self.assertTrue(self.inventory.compare_and_decrement("gin", 100.0))
+        self.assertEqual(self.gin.quantity, 900.0)
+        self.assertFalse(self.inventory.compare_and_decrement("gin", 1000.0))
+        self.assertFalse(self.inventory.compare_and_decrement("gin", 10.0, expected=1000.0))
+        self.assertTrue(self.inventory.compare_and_decrement("gin", 10.0, expected=900.0))
+        self.assertFalse(self.inventory.compare_and_decrement("rum", 10.0))
+        with self.assertRaises(ValueError):
+            self.inventory.compare_and_decrement("gin", 0)
+
+        self.assertTrue(self.inventory.use("Lime", 10.0))
+        with self.assertRaises(IngredientError):
+            self.inventory.use("Lime", 100.0)
+        with self.assertRaises(InventoryError):
+            self.inventory.use("Rum", 1.0)
+        with self.assertRaises(ValueError):
+            ConcurrentInventory(stripes=0)
+
+    def test_copy_items(self):
+        for clone in (copy.deepcopy(self.gin), pickle.loads(pickle.dumps(self.gin))):
+            self.assertEqual((clone.name, clone.quantity, clone.abv), ("Gin", 1000.0, 40.0))
+            clone.use(100.0)
+            self.assertEqual(self.gin.quantity, 1000.0)
+            self.assertAlmostEqual(self.inventory.total_value(), 105.0)
+
+    def test_structure_reads(self):
+        errors = []
+
+        def writer():
+            for i in range(300):
+                self.inventory.append(Ingredient(f"Garnish {i}", 1.0, "2025-01-01"))
+                del self.inventory[-1]
+
+        def reader():
+            try:
+                for _ in range(300):
+                    self.inventory[0]
+                    self.inventory[-1]
+                    len(self.inventory)
+                    self.inventory.names()
+            except RuntimeError as e:
+                errors.append(e)
+
+        workers = [threading.Thread(target=target) for target in (writer, writer, reader, reader)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(list(self.inventory), [self.gin, self.lime])
+        self.assertEqual(self.inventory.names(), ["gin", "lime"])
+        del self.inventory[0]
+        self.assertEqual(len(self.inventory), 1)
+
+    def test_no_oversell_under_contention(self):
+        sour = {"name": "Gimlet", "ingredients": [{"name": "Gin", "amount": 1}, {"name": "Lime", "amount": 0.1}]}
+        poured = []
+
+        def terminal():
+            count = 0
+            for _ in range(self.pours_per_thread):
+                if self.inventory.compare_and_decrement("Gin", 0.5):
+                    count += 1
+                try:
+                    manager.consume(self.inventory, sour)
+                    count += 2
+                except InventoryError:
+                    pass
+            poured.append(count)
+
+        workers = [threading.Thread(target=terminal) for _ in range(self.threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        self.assertGreaterEqual(self.gin.quantity, 0.0)
+        self.assertGreaterEqual(self.lime.quantity, -1e-9)
+        self.assertAlmostEqual(self.gin.quantity, 1000.0 - sum(poured) * 0.5)
+        self.assertAlmostEqual(self.inventory.total_value(), self.gin.current_value() + self.lime.current_value())
+        self.assertIn(self.gin, self.inventory)
+        self.assertIs(self.inventory.remove_name("gin"), self.gin)
+        self.inventory.remove(self.lime)
+        self.assertEqual(self.inventory.get_shopping_list(100.0), [])
+        self.assertEqual(list(self.inventory), [])
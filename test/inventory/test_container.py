@@ -0,0 +1,120 @@
+import unittest
+from pymixology.inventory.items import Ingredient, Spirit, Mixer
+from pymixology.inventory.container import Inventory
+from pymixology.inventory import manager
+from pymixology.exceptions import InventoryError
+
+class TestInventory(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.threshold = 20.0
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def setUp(self):
+        self.lemon = Ingredient("Lemon", 10.0, "2024-01-01", value=5.0)
+        self.gin = Spirit("Gin", 700.0, "2025-01-01", abv=40.0, value=30.0)
+        self.soda = Mixer("Soda", 330.0, "2024-06-01", is_carbonated=True, value=2.0)
+        self.inventory = Inventory([self.lemon, self.gin])
+
+    def tearDown(self):
+        self.inventory.clear()
+
+    def test_list_semantics(self):
+        self.assertEqual(len(self.inventory), 2)
+        self.assertIs(self.inventory[0], self.lemon)
+        self.assertEqual(list(self.inventory), [self.lemon, self.gin])
+        self.assertIn(self.gin, self.inventory)
+        self.assertIn("  GIN ", self.inventory)
+        self.assertNotIn("Rum", self.inventory)
+        self.assertNotIn(self.soda, self.inventory)
+
+        self.inventory.append(self.soda)
+        self.assertIs(self.inventory[-1], self.soda)
+        del self.inventory[0]
+        self.assertEqual(list(self.inventory), [self.gin, self.soda])
+        self.inventory.remove(self.gin)
+        self.assertEqual(list(self.inventory), [self.soda])
+        with self.assertRaises(ValueError):
+            self.inventory.remove(self.gin)
+
+        # del removes the item at that position, not the first equal one
+        self.inventory.extend([self.lemon, self.soda])
+        self.assertEqual(list(self.inventory), [self.soda, self.lemon, self.soda])
+        del self.inventory[2]
+        self.assertEqual(list(self.inventory), [self.soda, self.lemon])
+        self.assertEqual(self.inventory[0:], [self.soda, self.lemon])
+        self.assertIs(self.inventory.get("soda"), self.soda)
+        del self.inventory[:1]
+        self.assertEqual(list(self.inventory), [self.lemon])
+        with self.assertRaises(IndexError):
+            self.inventory[1]
+
+    def test_duplicates(self):
+        backup = Spirit("gin", 100.0, "2026-01-01", abv=40.0)
+        self.inventory.append(backup)
+        self.assertIs(self.inventory.get("GIN"), self.gin)
+        self.assertIs(self.inventory.remove_name("Gin"), self.gin)
+        self.assertIs(self.inventory.get("gin"), backup)
+        self.inventory.remove_name("gin")
+        self.assertIsNone(self.inventory.get("gin"))
+        self.assertEqual(self.inventory.names(), ["lemon"])
+        with self.assertRaises(InventoryError):
+            self.inventory.remove_name("gin")
+
+    def test_manager_functions(self):
+        manager.add_item(self.inventory, self.soda)
+        self.assertEqual(manager.check_stock(self.inventory, "soda"), 330.0)
+        self.assertEqual(manager.check_stock(self.inventory, "Missing"), 0.0)
+        self.assertAlmostEqual(manager.total_value(self.inventory), 37.0)
+        self.assertEqual(manager.get_shopping_list(self.inventory, self.threshold), ["Lemon"])
+        self.assertTrue(manager.remove_item(self.inventory, "LEMON"))
+        self.assertEqual(manager.check_stock(self.inventory, "Lemon"), 0.0)
+        with self.assertRaises(InventoryError):
+            manager.remove_item(self.inventory, "Lemon")
+
+    def test_running_aggregates(self):
+        self.assertAlmostEqual(self.inventory.total_value(), 35.0)
+        self.gin.use(350.0)
+        self.assertAlmostEqual(self.inventory.total_value(), 20.0)
+        self.assertEqual(self.inventory.get_shopping_list(400.0), ["Lemon", "Gin"])
+        self.lemon.use(10.0)
+        self.assertEqual(self.inventory.get_shopping_list(0.5), ["Lemon"])
+
+        self.gin.add_lot(100.0, "2026-01-01")
+        self.assertEqual(self.inventory.get_shopping_list(400.0), ["Lemon"])
+
+        manager.add_item(self.inventory, self.soda)
+        self.assertAlmostEqual(manager.total_value(self.inventory), 2.0 + 30.0 / 700.0 * 450.0)
+        manager.remove_item(self.inventory, "Gin")
+        self.assertAlmostEqual(manager.total_value(self.inventory), 2.0)
+        self.assertEqual(manager.get_shopping_list(self.inventory, self.threshold), ["Lemon"])
+
+        # Removed items no longer update the aggregates
+        self.gin.use(10.0)
+        self.assertAlmostEqual(self.inventory.total_value(), 2.0)
+        self.inventory.clear()
+        self.soda.use(30.0)
+        self.assertEqual(self.inventory.total_value(), 0.0)
+        self.assertEqual(self.inventory.get_shopping_list(1000.0), [])
+
+        # The running total returns to exactly zero instead of drifting
+        items = [Ingredient(f"Bitters {i}", 10.0 + i / 7.0, "2025-01-01", value=i / 3.0) for i in range(50)]
+        self.inventory.extend(items)
+        for item in items:
+            item.use(0.1)
+        self.assertAlmostEqual(self.inventory.total_value(), sum(item.current_value() for item in items))
+        for item in items:
+            self.inventory.remove(item)
+        self.assertEqual(self.inventory.total_value(), 0.0)
+
+        # Direct quantity writes go through the same bookkeeping as use()
+        lemon = Ingredient("Lemon", 10, "2024-01-01", value=5)
+        self.inventory.append(lemon)
+        lemon.quantity = 50
+        lemon.use(45)
+        self.assertAlmostEqual(self.inventory.total_value(), 2.5)
+        self.assertEqual(self.inventory.get_shopping_list(20), ["Lemon"])
@@ -0,0 +1,110 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pymixology.inventory.items import Ingredient, Spirit, Mixer
+from pymixology.inventory.journal import JournaledInventory, JOURNAL_NAME, SNAPSHOT_NAME
+from pymixology.inventory import manager
+from pymixology.exceptions import InventoryError
+
+class TestJournaledInventory(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.snapshot_every = None
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.inventory = JournaledInventory(self.directory, snapshot_every=self.snapshot_every)
+        manager.add_item(self.inventory, Ingredient("Lemon", 10.0, "2024-01-01", value=5.0))
+        manager.add_item(self.inventory, Spirit("Gin", 700.0, "2025-01-01", abv=40.0, value=30.0))
+        manager.add_item(self.inventory, Mixer("Soda", 330.0, "2024-06-01", is_carbonated=True, value=2.0))
+
+    def tearDown(self):
+        self.inventory.close()
+        shutil.rmtree(self.directory)
+
+    def reopen(self, **kwargs):
+        self.inventory.close()
+        self.inventory = JournaledInventory(self.directory, **kwargs)
+        return self.inventory
+
+    def test_journal_replay(self):
+        self.inventory.get("Gin").use(100.0)
+        manager.remove_item(self.inventory, "Lemon")
+        restored = self.reopen()
+        self.assertEqual([item.name for item in restored], ["Gin", "Soda"])
+        gin = restored.get("gin")
+        self.assertIsInstance(gin, Spirit)
+        self.assertEqual(gin.quantity, 600.0)
+        self.assertEqual(gin.get_abv(), 40.0)
+        self.assertTrue(restored.get("soda").is_fizzy())
+        self.assertAlmostEqual(restored.total_value(), 30.0 * 600.0 / 700.0 + 2.0)
+
+        # New slots continue after the recovered ones
+        restored.append(Ingredient("Lemon", 5.0, "2024-02-01"))
+        restored.clear()
+        restored.append(Ingredient("Mint", 3.0, "2024-02-01"))
+        self.assertEqual([item.name for item in self.reopen()], ["Mint"])
+
+    def test_price_replay(self):
+        self.inventory.get("Lemon").set_unit_value(5.0)
+        self.assertEqual(self.inventory.total_value(), 5.0 * 10.0 + 30.0 + 2.0)
+        restored = self.reopen()
+        self.assertEqual(restored.get("lemon").unit_value, 5.0)
+        self.assertEqual(restored.total_value(), 5.0 * 10.0 + 30.0 + 2.0)
+        restored.get("lemon").use(4.0)
+        self.assertEqual(self.reopen().total_value(), 5.0 * 6.0 + 30.0 + 2.0)
+
+    def test_closed(self):
+        gin = self.inventory.get("Gin")
+        lemon = self.inventory.remove_name("Lemon")
+        self.inventory.close()
+        changes = [
+            lambda: gin.use(100.0),
+            lambda: gin.add_lot(100.0, "2026-01-01"),
+            lambda: gin.set_unit_value(1.0),
+            lambda: setattr(gin, "quantity", 1.0),
+            lambda: self.inventory.append(Ingredient("Mint", 3.0, "2024-02-01")),
+            lambda: self.inventory.remove_name("Soda"),
+            lambda: self.inventory.remove(gin),
+            lambda: self.inventory.__delitem__(0),
+            self.inventory.clear,
+        ]
+        for change in changes:
+            with self.assertRaises(InventoryError):
+                change()
+        self.assertEqual((gin.quantity, len(self.inventory)), (700.0, 2))
+        self.assertTrue(lemon.use(1.0))
+        restored = self.reopen()
+        self.assertEqual([(item.name, item.quantity) for item in restored], [("Gin", 700.0), ("Soda", 330.0)])
+        self.assertAlmostEqual(restored.total_value(), 32.0)
+
+    def test_snapshot_and_torn_tail(self):
+        self.inventory.snapshot()
+        self.assertEqual(os.path.getsize(os.path.join(self.directory, JOURNAL_NAME)), 0)
+        self.inventory.get("Soda").use(30.0)
+        self.inventory.close()
+
+        # Simulate a crash in the middle of writing a record
+        with open(os.path.join(self.directory, JOURNAL_NAME), "ab") as f:
+            f.write(b"\x01\x02\x03")
+        restored = self.reopen(snapshot_every=2)
+        self.assertEqual(restored.check_stock("Soda"), 300.0)
+        self.assertEqual(len(restored), 3)
+
+        # Automatic compaction after snapshot_every records
+        restored.get("Lemon").use(1.0)
+        self.assertEqual(os.path.getsize(os.path.join(self.directory, JOURNAL_NAME)), 0)
+        self.assertEqual(self.reopen().check_stock("Lemon"), 9.0)
+
+    def test_bad_snapshot(self):
+        self.inventory.close()
+        with open(os.path.join(self.directory, SNAPSHOT_NAME), "wb") as f:
+            f.write(b"XXXX" + bytes(26))
+        with self.assertRaises(InventoryError):
+            JournaledInventory(self.directory)
@@ -0,0 +1,89 @@
+import unittest
+from datetime import date, datetime
+from pymixology.inventory.items import Ingredient, Spirit
+from pymixology.inventory.lots import ExpiryIndex, LotQueue, Lot, parse_expiry
+from pymixology.exceptions import IngredientError
+
+class TestLots(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.today = "2025-01-10"
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def setUp(self):
+        self.lime = Ingredient("Lime", 10.0, "2025-01-20")
+        self.gin = Spirit("Gin", 700.0, "2030-01-01", abv=40.0)
+        self.index = ExpiryIndex([self.lime, self.gin])
+
+    def tearDown(self):
+        self.index = None
+
+    def test_parse_and_queue(self):
+        self.assertEqual(parse_expiry("2025-01-01"), date(2025, 1, 1))
+        self.assertEqual(parse_expiry(datetime(2025, 1, 1, 12)), date(2025, 1, 1))
+        with self.assertRaises(IngredientError):
+            parse_expiry("soon")
+
+        queue = LotQueue()
+        queue.add(Lot(5, "2025-03-01"))
+        queue.add(Lot(5, "2025-02-01"))
+        self.assertEqual(queue.peek().expiry, date(2025, 2, 1))
+        taken = queue.drain(7)
+        self.assertEqual([amount for _, amount in taken], [5, 2])
+        self.assertEqual(len(queue), 1)
+        self.assertEqual(queue.total(), 3)
+        self.assertEqual(queue.expiring_by(date(2025, 2, 15)), [])
+
+    def test_fifo_use(self):
+        self.index.add_lot(self.lime, 5.0, "2025-01-12")
+        self.index.add_lot(self.lime, 5.0, "2025-02-01")
+        self.assertEqual(self.lime.quantity, 20.0)
+        self.assertEqual(self.lime.expiry_date, "2025-01-12")
+
+        self.lime.use(7.0)
+        lots = self.lime.get_lots()
+        self.assertEqual([lot.quantity for lot in lots], [8.0, 5.0])
+        self.assertEqual(self.lime.expiry_date, "2025-01-20")
+        self.assertEqual(self.lime.quantity, 13.0)
+        with self.assertRaises(IngredientError):
+            self.lime.add_lot(0, "2025-01-01")
+
+        # Existing stock with an unparsable date expires after every dated lot
+        bitters = Ingredient("Bitters", 4.0, "N/A")
+        self.index.track(bitters)
+        self.assertEqual(bitters.get_lots()[0].expiry, date.max)
+        self.index.add_lot(bitters, 2.0, "2025-03-01")
+        self.assertEqual(bitters.expiry_date, "2025-03-01")
+        bitters.use(3.0)
+        self.assertEqual([lot.quantity for lot in bitters.get_lots()], [3.0])
+        self.assertEqual(bitters.expiry_date, "N/A")
+        self.assertEqual(self.index.sweep(today=self.today), {})
+
+    def test_queries_and_sweep(self):
+        self.index.add_lot(self.lime, 5.0, "2025-01-05")
+        self.index.add_lot(self.gin, 100.0, "2025-01-15")
+
+        soon = self.index.expiring_within(7, today=self.today)
+        self.assertEqual([(item.name, lot.expiry.isoformat()) for item, lot in soon],
+                         [("Lime", "2025-01-05"), ("Gin", "2025-01-15")])
+        item, lot = self.index.next_to_expire()
+        self.assertIs(item, self.lime)
+
+        discarded = self.index.sweep(today=self.today)
+        self.assertEqual(discarded, {"Lime": 5.0})
+        self.assertEqual(self.lime.quantity, 10.0)
+        self.assertEqual(self.index.sweep(today=self.today), {})
+
+        # Drained lots disappear from queries
+        self.gin.use(100.0)
+        soon = self.index.expiring_within(30, today=self.today)
+        self.assertEqual([item.name for item, _ in soon], ["Lime"])
+        self.assertEqual(self.gin.get_lots()[0].quantity, 700.0)
+
+        self.index.add_lot(self.gin, 50.0, "2025-01-30")
+        self.index.untrack(self.lime)
+        self.assertEqual([item.name for item, _ in self.index.expiring_within(30, today=self.today)], ["Gin"])
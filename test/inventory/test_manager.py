@@ -1,6 +1,7 @@
 import unittest
 from pymixology.inventory.items import Ingredient, Spirit
 from pymixology.inventory import manager
+from pymixology.recipes.tools import scale_recipe_view
 from pymixology.exceptions import InventoryError
 
 class TestManager(unittest.TestCase):
@@ -68,3 +69,42 @@ class TestManager(unittest.TestCase):
         self.assertAlmostEqual(self.inventory[0].quantity, 0.0)
         self.assertAlmostEqual(manager.total_value(self.inventory), 30.0)
 
+
+    def test_consume(self):
+        manager.add_item(self.inventory, self.item2)
+        sour = {
+            "name": "Gin Sour",
+            "ingredients": [
+                {"name": "Gin", "amount": 60},
+                {"name": "Lemon", "amount": 3},
+                "Ice"
+            ]
+        }
+        self.assertTrue(manager.consume(self.inventory, sour, 2))
+        self.assertAlmostEqual(manager.check_stock(self.inventory, "Gin"), 580.0)
+        self.assertAlmostEqual(manager.check_stock(self.inventory, "Lemon"), 4.0)
+
+        # Lemon runs short: nothing may be decremented
+        with self.assertRaises(InventoryError):
+            manager.consume(self.inventory, sour, 2)
+        self.assertAlmostEqual(manager.check_stock(self.inventory, "Gin"), 580.0)
+        self.assertAlmostEqual(manager.check_stock(self.inventory, "Lemon"), 4.0)
+
+        # Batch of orders is validated as a whole
+        martini = {"name": "Martini", "servings": 2, "ingredients": [{"name": "Gin", "amount": 120}]}
+        with self.assertRaises(InventoryError):
+            manager.consume_orders(self.inventory, [martini, (sour, 1), (sour, 1)])
+        self.assertAlmostEqual(manager.check_stock(self.inventory, "Gin"), 580.0)
+        self.assertTrue(manager.consume_orders(self.inventory, [martini, (sour, 1)]))
+        self.assertAlmostEqual(manager.check_stock(self.inventory, "Gin"), 460.0)
+        self.assertAlmostEqual(manager.check_stock(self.inventory, "Lemon"), 1.0)
+
+        # Any recipe mapping is an order, e.g. a scaled view (one serving = 60 ml)
+        double = scale_recipe_view(martini, 4)
+        self.assertTrue(manager.consume_orders(self.inventory, [double, (double, 2)]))
+        self.assertAlmostEqual(manager.check_stock(self.inventory, "Gin"), 280.0)
+
+        with self.assertRaises(ValueError):
+            manager.consume(self.inventory, sour, 0)
+        with self.assertRaises(InventoryError):
+            manager.consume(self.inventory, {"ingredients": [{"name": "Rum", "amount": 1}]})
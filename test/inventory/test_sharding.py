@@ -0,0 +1,58 @@
+import unittest
+from pymixology.inventory.items import Ingredient, Spirit
+from pymixology.inventory.columnar import ColumnarStore
+from pymixology.inventory.container import Inventory
+from pymixology.inventory.sharding import ShardedInventory
+from pymixology.exceptions import InventoryError
+
+class TestShardedInventory(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.threshold = 20.0
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def setUp(self):
+        self.group = ShardedInventory()
+        self.group.add_location("Downtown", [
+            Ingredient("Lemon", 10.0, "2024-01-01", value=5.0),
+            Spirit("Gin", 700.0, "2025-01-01", abv=40.0, value=30.0),
+        ])
+        self.group.add_location("Harbour", Inventory([
+            Spirit("Gin", 5.0, "2025-01-01", abv=40.0, value=1.0),
+            Spirit("Rum", 500.0, "2025-01-01", abv=40.0, value=20.0),
+        ]))
+        self.group.add_location("Airport")
+
+    def tearDown(self):
+        self.group = None
+
+    def check_rollups(self, group):
+        self.assertAlmostEqual(group.total_value(), 56.0)
+        self.assertEqual(group.value_by_location()["Airport"], 0.0)
+        self.assertEqual(group.get_shopping_list(self.threshold),
+                         {"Downtown": ["Lemon"], "Harbour": ["Gin"], "Airport": []})
+        self.assertEqual(group.combined_shopping_list(self.threshold), ["Lemon", "Gin"])
+        self.assertEqual(group.where_in_stock("gin"), {"Downtown": 700.0, "Harbour": 5.0})
+        self.assertEqual(group.where_in_stock("gin", min_quantity=10.0), {"Downtown": 700.0})
+
+    def test_serial_rollups(self):
+        self.check_rollups(self.group)
+        self.group.add_item("Airport", Ingredient("Mint", 30.0, "2024-01-01", value=3.0))
+        self.assertEqual(self.group.check_stock("Airport", "mint"), 30.0)
+        self.assertTrue(self.group.remove_item("Airport", "Mint"))
+        self.assertEqual(self.group.locations(), ["Downtown", "Harbour", "Airport"])
+        self.assertEqual(len(self.group), 3)
+        with self.assertRaises(InventoryError):
+            self.group.shard("Moon")
+        with self.assertRaises(InventoryError):
+            self.group.add_location("Airport")
+        store = self.group.add_location("Depot", ColumnarStore())
+        store.add_ingredient("Mint", 30.0, "2024-01-01")
+        self.assertTrue(self.group.remove_item("Depot", "mint"))
+        self.assertEqual(len(store), 0)
+        with self.assertRaises(InventoryError):
+            self.group.remove_item("Depot", "mint")
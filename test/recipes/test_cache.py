@@ -0,0 +1,86 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+from pymixology.recipes import catalog, cache
+from pymixology.exceptions import DataLoadError
+
+class TestCache(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.test_data = [
+            {"name": "Test Mojito", "base": "Rum", "ingredients": [{"name": "Rum", "amount": 60, "unit": "ml"}, "Mint"]},
+            {"name": "Test Martini", "base": "Gin", "ingredients": [{"name": "Gin", "amount": 60, "unit": "ml"}]},
+        ]
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.source = os.path.join(self.directory, "recipes.json")
+        with open(self.source, "w") as f:
+            json.dump(self.test_data, f)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_warm_load_skips_parsing(self):
+        cold = catalog.load_recipes(self.source, cache=True)
+        self.assertIsInstance(cold, catalog.RecipeCatalog)
+        self.assertTrue(cache.cache_path(self.source).exists())
+
+        with patch.object(cache, "iter_recipes", side_effect=AssertionError("parsed again")):
+            warm = catalog.load_recipes(self.source, cache=True)
+        self.assertEqual(warm, cold)
+        self.assertEqual(warm.search("mart")[0]["name"], "Test Martini")
+        self.assertEqual(len(warm.with_ingredient("mint")), 1)
+        self.assertEqual(warm.filter_by_base("rum")[0]["name"], "Test Mojito")
+        warm.add({"name": "Test Margarita", "base": "Tequila", "ingredients": []})
+        self.assertEqual(len(warm.find_prefix("test mar")), 2)
+
+    def test_invalidation(self):
+        catalog.load_recipes(self.source, cache="hash")
+        with open(self.source, "w") as f:
+            json.dump(self.test_data[:1], f)
+        self.assertIsNone(cache.read_cache(self.source, validate="hash"))
+        self.assertEqual(len(catalog.load_recipes(self.source, cache="hash")), 1)
+
+        # Touching the file with new contents invalidates the mtime check
+        catalog.load_recipes(self.source, cache=True)
+        with open(self.source, "w") as f:
+            json.dump(self.test_data, f)
+        os.utime(self.source, ns=(0, 10**9))
+        self.assertIsNone(cache.read_cache(self.source))
+        self.assertEqual(len(catalog.load_recipes(self.source, cache=True)), 2)
+
+        # A corrupt cache is treated as a miss
+        with open(cache.cache_path(self.source), "wb") as f:
+            f.write(b"garbage")
+        self.assertIsNone(cache.read_cache(self.source))
+        self.assertEqual(len(catalog.load_recipes(self.source, cache=True)), 2)
+
+        # A source edited while it is being parsed leaves a stale cache, not one stamped as fresh
+        os.remove(cache.cache_path(self.source))
+        parse = catalog.iter_recipes
+
+        def edit_during_parse(*args, **kwargs):
+            recipes = list(parse(*args, **kwargs))
+            with open(self.source, "w") as f:
+                json.dump(self.test_data[:1], f)
+            return iter(recipes)
+
+        with patch.object(cache, "iter_recipes", side_effect=edit_during_parse):
+            self.assertEqual(len(cache.load_cached_catalog(self.source, validate="hash")), 2)
+        self.assertIsNone(cache.read_cache(self.source, validate="hash"))
+        self.assertEqual(len(cache.load_cached_catalog(self.source, validate="hash")), 1)
+
+        with self.assertRaises(ValueError):
+            cache.load_cached_catalog(self.source, validate="size")
+        with self.assertRaises(DataLoadError):
+            catalog.load_recipes(os.path.join(self.directory, "missing.json"), cache=True)
+        self.assertFalse(cache.write_cache(os.path.join(self.directory, "missing.json"), catalog.RecipeCatalog()))
@@ -3,6 +3,7 @@ import json
 import os
 import tempfile
 import io
+import marshal
 from unittest.mock import patch
 from pymixology.recipes import catalog
 from pymixology.exceptions import DataLoadError
@@ -160,3 +161,116 @@ class TestCatalog(unittest.TestCase):
         self.assertIn("wedge", fmt)
         self.assertIn("Lime", fmt)
 
+
+    def test_recipe_catalog(self):
+        compiled = catalog.load_recipes(self.temp_file.name, compiled=True)
+        self.assertIsInstance(compiled, catalog.RecipeCatalog)
+        self.assertEqual(compiled, self.recipes)
+        self.assertEqual(len(compiled), 2)
+        self.assertEqual(compiled[1]["name"], "Test Martini")
+        self.assertEqual([r["name"] for r in compiled], ["Test Mojito", "Test Martini"])
+
+        # Module-level queries dispatch to the indexes
+        self.assertEqual(catalog.search_cocktail(compiled, "mojito"), catalog.search_cocktail(self.recipes, "mojito"))
+        self.assertEqual(len(catalog.search_cocktail(compiled, "Test")), 2)
+        self.assertEqual(catalog.search_cocktail(compiled, "Whiskey"), [])
+        self.assertEqual(len(catalog.search_cocktail(compiled, "test", limit=1)), 1)
+        self.assertEqual(len(catalog.search_cocktail(self.recipes, "test", limit=1)), 1)
+        self.assertEqual(catalog.filter_by_base(compiled, " GIN ")[0]["name"], "Test Martini")
+        self.assertEqual(catalog.filter_by_base(compiled, "Tequila"), [])
+
+        self.assertEqual(compiled.get("test martini")["base"], "Gin")
+        self.assertIsNone(compiled.get("Martini"))
+        self.assertEqual([r["name"] for r in compiled.with_ingredient("ice")], ["Test Mojito"])
+        self.assertEqual([r["name"] for r in compiled.find_prefix("test m")], ["Test Martini", "Test Mojito"])
+
+        compiled.add({"name": "Test Margarita", "base": "Tequila", "ingredients": ["Tequila", "Lime"]})
+        self.assertEqual([r["name"] for r in compiled.find_prefix("Test Mar")], ["Test Margarita", "Test Martini"])
+        self.assertEqual(len(compiled.filter_by_base("tequila")), 1)
+        self.assertEqual(len(compiled.with_ingredient("Lime")), 1)
+        self.assertNotEqual(compiled, self.recipes)
+        self.assertIn("3 recipes", repr(compiled))
+
+    def test_columnar_storage(self):
+        raw = [
+            {"name": "Sour", "ingredients": [{"name": "Gin", "amount": 60, "unit": "ml"}, {"name": "Lemon", "amount": 22.5, "unit": "ml"}]},
+            {"name": "Mixed", "flavor": "odd", "ingredients": [
+                "Mint", {"name": "Rum", "amount": 45, "unit": "ml", "abv": 40}, {"name": "Salt", "amount": None, "unit": "pinch"},
+                {"name": "Sugar", "amount": "a little", "unit": None}, {"name": "Ice", "amount": True, "unit": None},
+                {"name": "Cola", "amount": 2 ** 60, "unit": "ml"},
+            ]},
+            {"name": "Bare"},
+            {"name": "Tuple", "ingredients": ("Gin", "Tonic")},
+        ]
+        compiled = catalog.RecipeCatalog(raw)
+        self.assertEqual(compiled, raw)
+        self.assertEqual(list(compiled), raw)
+        self.assertEqual(compiled[-3:], raw[-3:])
+        self.assertIsInstance(compiled[0]["ingredients"][0]["amount"], int)
+        self.assertEqual(list(compiled[1]), ["name", "flavor", "ingredients"])
+        self.assertNotIn("ingredients", compiled[2])
+        self.assertEqual(compiled.field(1, "flavor"), "odd")
+        self.assertEqual(compiled.field(0, "ingredients"), raw[0]["ingredients"])
+        with self.assertRaises(IndexError):
+            compiled[4]
+
+        # Accessed dicts are rebuilt every time, so editing one changes nothing
+        compiled[0]["ingredients"].clear()
+        self.assertEqual(compiled[0], raw[0])
+
+        restored = catalog.RecipeCatalog.from_state(marshal.loads(marshal.dumps(compiled.to_state())))
+        self.assertEqual(restored, raw)
+        restored.add({"name": "Rickey", "ingredients": [{"name": "Gin", "amount": 45, "unit": "oz"}]})
+        self.assertEqual(restored.get("rickey")["ingredients"][0]["unit"], "oz")
+
+    def test_iter_recipes(self):
+        # Tiny chunks force records to straddle chunk boundaries
+        streamed = list(catalog.iter_recipes(self.temp_file.name, chunk_size=7))
+        self.assertEqual(streamed, self.recipes)
+
+        lines_file = tempfile.NamedTemporaryFile(delete=False, mode='w', suffix='.jsonl')
+        for recipe in self.test_data:
+            lines_file.write(json.dumps(recipe) + "\n\n")
+        lines_file.close()
+        self.assertEqual(catalog.load_recipes(lines_file.name), self.recipes)
+        os.unlink(lines_file.name)
+
+        cases = [
+            ('.json', '[{"name": "A"}, 42]', "record 1 at offset 16"),
+            ('.json', '[{"name": "A"}, {"name": }]', "record 1"),
+            ('.json', '[{"name": "A"} {"name": "B"}]', "after record 0"),
+            ('.json', '[{"name": "A"},', "record 1"),
+            ('.json', '', "expected '['"),
+            ('.json', '[{"name": "A"}] garbage', "extra data after the array at offset 16"),
+            ('.json', '[{"name": "A"}][{"name": "B"}]', "extra data"),
+            ('.json', '[] []', "extra data"),
+            ('.jsonl', '{"name": "A"}\n[1]\n', "record 1 at line 2"),
+            ('.jsonl', '{"name": "A"}\n\n{oops}\n', "record 1 on line 3"),
+        ]
+        for suffix, text, message in cases:
+            bad_file = tempfile.NamedTemporaryFile(delete=False, mode='w', suffix=suffix)
+            bad_file.write(text)
+            bad_file.close()
+            with self.assertRaises(DataLoadError) as ctx:
+                list(catalog.iter_recipes(bad_file.name, chunk_size=4))
+            self.assertIn(message, str(ctx.exception))
+            os.unlink(bad_file.name)
+
+        # A malformed record fails without reading the rest of the file
+        stream = io.StringIO('[{"name": "A"}, {"name": oops}' + ', {"name": "B"}' * 10000 + ']')
+        with self.assertRaises(DataLoadError):
+            list(catalog._JsonArrayReader(stream, 64))
+        self.assertLess(stream.tell(), 256)
+
+        # Numbers, literals and escapes cut by a chunk edge are completed, not rejected
+        text = '[{"name": "A", "abv": 12.5}, 1.25, "\\u00e9", -Infinity]'
+        for chunk_size in range(1, len(text) + 1):
+            records = [record for _, _, record in catalog._JsonArrayReader(io.StringIO(text), chunk_size)]
+            self.assertEqual(records[:3], [{"name": "A", "abv": 12.5}, 1.25, "\u00e9"])
+            self.assertEqual(records[3], float("-inf"))
+
+        empty_file = tempfile.NamedTemporaryFile(delete=False, mode='w', suffix='.json')
+        empty_file.write(" [ ] ")
+        empty_file.close()
+        self.assertEqual(catalog.load_recipes(empty_file.name), [])
+        os.unlink(empty_file.name)
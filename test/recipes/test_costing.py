@@ -0,0 +1,90 @@
+import unittest
+from pymixology.recipes.costing import MenuCosting
+from pymixology.recipes.catalog import RecipeCatalog
+from pymixology.inventory.items import Ingredient, Spirit
+from pymixology.inventory.container import Inventory
+from pymixology.exceptions import InventoryError, RecipeError, IngredientError
+
+class TestCosting(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.recipes = [
+            {"name": "Gin Sour", "ingredients": [
+                {"name": "Gin", "amount": 2, "unit": "cl"},
+                {"name": "Lemon Juice", "amount": 10, "unit": "ml"},
+            ]},
+            {"name": "Rum Punch", "ingredients": [
+                {"name": "Rum", "amount": 50, "unit": "ml"},
+                {"name": "Lemon Juice", "amount": 10, "unit": "ml"},
+                {"name": "Mint", "amount": 3, "unit": "leaves"},
+                {"name": "Sugar", "amount": "to taste"},
+            ]},
+            {"name": "Neat Gin", "ingredients": [{"name": "Gin", "amount": 60, "unit": "ml"}]},
+        ]
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def setUp(self):
+        self.gin = Spirit("Gin", 700.0, "2025-01-01", abv=40.0, value=35.0)
+        self.lemon = Ingredient("Lemon Juice", 100.0, "2024-01-01", value=2.0)
+        self.mint = Ingredient("Mint", 30.0, "2024-01-01", value=3.0)
+        self.inventory = Inventory([self.gin, self.lemon, self.mint])
+        self.costing = MenuCosting(self.recipes, self.inventory, sale_prices={"gin sour": 8.0})
+
+    def tearDown(self):
+        self.costing.close()
+
+    def test_costs(self):
+        self.assertAlmostEqual(self.costing.cost("Gin Sour"), 20 * 0.05 + 10 * 0.02)
+        self.assertAlmostEqual(self.costing.cost("Rum Punch"), 10 * 0.02 + 3 * 0.1)
+        self.assertAlmostEqual(self.costing.costs()["Neat Gin"], 3.0)
+        with self.assertRaises(RecipeError):
+            self.costing.cost("Martini")
+        with self.assertRaises(RecipeError):
+            self.costing.set_sale_price("Neat Gin", -1)
+
+        report = self.costing.margin_report()
+        self.assertEqual([row["name"] for row in report], ["Gin Sour", "Rum Punch", "Neat Gin"])
+        self.assertAlmostEqual(report[0]["margin"], 6.8)
+        self.assertAlmostEqual(report[0]["margin_pct"], 85.0)
+        self.assertTrue(report[0]["complete"])
+        self.assertFalse(report[1]["complete"])
+        self.assertIsNone(report[2]["price"])
+        self.assertIsNone(report[2]["margin"])
+
+    def test_price_changes(self):
+        before = self.costing.recomputed
+        self.assertEqual(self.costing.set_price("GIN", 0.1), 2)
+        self.assertEqual(self.costing.recomputed - before, 2)
+        self.assertAlmostEqual(self.costing.cost("Neat Gin"), 6.0)
+        self.assertAlmostEqual(self.inventory.total_value(), 70.0 + 2.0 + 3.0)
+
+        self.mint.set_unit_value(0.2)
+        self.assertEqual(self.costing.recomputed - before, 3)
+        self.assertAlmostEqual(self.costing.cost("Rum Punch"), 10 * 0.02 + 3 * 0.2)
+        with self.assertRaises(IngredientError):
+            self.mint.set_unit_value(-1)
+        with self.assertRaises(InventoryError):
+            self.costing.set_price("Rum", 1.0)
+
+        self.inventory.append(Spirit("Rum", 1000.0, "2025-01-01", abv=40.0, value=20.0))
+        self.assertEqual(self.costing.refresh("rum"), 1)
+        self.assertAlmostEqual(self.costing.cost("Rum Punch"), 50 * 0.02 + 10 * 0.02 + 3 * 0.2)
+        self.assertEqual(self.costing.refresh("Vermouth"), 0)
+
+        self.costing.close()
+        self.gin.set_unit_value(1.0)
+        self.assertAlmostEqual(self.costing.cost("Neat Gin"), 6.0)
+
+    def test_shared_catalog(self):
+        catalog = RecipeCatalog(self.recipes)
+        costing = MenuCosting(catalog, [self.gin, self.lemon], unit="oz")
+        self.assertIs(costing.catalog, catalog)
+        self.assertAlmostEqual(costing.cost("Neat Gin"), 60 / 29.5735 * 0.05)
+        costing.close()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import os
+import json
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pymixology.recipes import ingest
+from pymixology.recipes.catalog import RecipeCatalog
+from pymixology.exceptions import DataLoadError, RecipeError
+
+class TestIngest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        root = cls.tmpdir.name
+        sour = {"name": "Gin Sour", "ingredients": [
+            {"name": "Gin", "amount": 2, "unit": "oz"}, {"name": "Lemon", "amount": 1, "unit": "oz"},
+        ]}
+        with open(os.path.join(root, "a.json"), "w") as f:
+            json.dump([sour, {"name": "Mojito", "ingredients": ["Mint"]}], f)
+        with open(os.path.join(root, "b.jsonl"), "w") as f:
+            reordered = {"name": " GIN SOUR", "ingredients": list(reversed(sour["ingredients"]))}
+            f.write(json.dumps(reordered) + "\n")
+            f.write(json.dumps({"name": "Gin Sour", "ingredients": [{"name": "Gin", "amount": 3, "unit": "oz"}]}) + "\n")
+        with open(os.path.join(root, "c.json"), "w") as f:
+            f.write('[{"name": "Broken",')
+        with open(os.path.join(root, "notes.txt"), "w") as f:
+            f.write("not recipes")
+        cls.root = root
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+
+    def setUp(self):
+        self.expected_files = [os.path.join(self.root, name) for name in ("a.json", "b.jsonl", "c.json")]
+
+    def tearDown(self):
+        pass
+
+    def test_sources_and_digest(self):
+        self.assertEqual(ingest.expand_sources(self.root), self.expected_files)
+        pattern = os.path.join(self.root, "*.json")
+        self.assertEqual(ingest.expand_sources([pattern, self.expected_files[0]]), [self.expected_files[0], self.expected_files[2]])
+        one = {"name": "Gin Sour", "ingredients": [{"name": "Gin", "amount": 2, "unit": "oz"}]}
+        two = {"name": "gin sour ", "ingredients": [{"name": "GIN", "amount": 2.0, "unit": "OZ"}]}
+        self.assertEqual(ingest.recipe_digest(one), ingest.recipe_digest(two))
+        two["ingredients"][0]["amount"] = 2.5
+        self.assertNotEqual(ingest.recipe_digest(one), ingest.recipe_digest(two))
+
+    def test_load_serial(self):
+        result = ingest.load_recipe_files(self.root)
+        self.assertEqual([r["name"] for r in result.recipes], ["Gin Sour", "Mojito", "Gin Sour"])
+        self.assertEqual(result.duplicates, 1)
+        self.assertEqual(list(result.errors), [self.expected_files[2]])
+        self.assertIsInstance(result.errors[self.expected_files[2]], DataLoadError)
+        self.assertIn("c.json", str(result.errors[self.expected_files[2]]))
+        self.assertIn("3 recipes", repr(result))
+
+        missing = ingest.load_recipe_files([self.expected_files[0], os.path.join(self.root, "gone.json")], compiled=True)
+        self.assertIsInstance(missing.recipes, RecipeCatalog)
+        self.assertEqual(len(missing.recipes), 2)
+        self.assertEqual(len(missing.errors), 1)
+        with self.assertRaises(RecipeError):
+            ingest.load_recipe_files(self.root, unit="gal")
+
+    def test_load_parallel(self):
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            threaded = ingest.load_recipe_files(self.root, unit="ml", executor=pool)
+        self.assertAlmostEqual(threaded.recipes[0]["ingredients"][0]["amount"], 2 * 29.5735)
+        pooled = ingest.load_recipe_files(self.root, unit="ml", max_workers=2, parallel_threshold=0)
+        self.assertEqual(pooled.recipes, threaded.recipes)
+        self.assertEqual(pooled.duplicates, 1)
+        self.assertEqual(list(pooled.errors), [self.expected_files[2]])
+
+if __name__ == "__main__":
+    unittest.main()
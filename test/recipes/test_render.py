@@ -0,0 +1,83 @@
+import io
+import unittest
+from unittest.mock import patch
+from pymixology.recipes import catalog
+from pymixology.recipes.render import RecipeRenderer, render_recipes
+
+class CountingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+class TestRender(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.recipe = {
+            "name": "Gin & Tonic",
+            "ingredients": [
+                {"name": "Gin", "amount": 50.0, "unit": "ml"},
+                {"name": "Tonic", "amount": 2.5, "unit": None},
+                "Ice",
+            ],
+            "steps": ["Build over ice", "Stir <gently>"],
+        }
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def setUp(self):
+        self.stream = CountingStream()
+
+    def tearDown(self):
+        self.stream.close()
+
+    def test_text_matches_display(self):
+        with patch('sys.stdout', new=io.StringIO()) as fake_out:
+            catalog.display_recipe(self.recipe)
+        expected = (
+            "Recipe: Gin & Tonic\nIngredients:\n- 50 ml Gin\n- 2.5 Tonic\n- Ice\n"
+            "Steps:\n1. Build over ice\n2. Stir <gently>\n"
+        )
+        self.assertEqual(fake_out.getvalue(), expected)
+        self.assertEqual(render_recipes([self.recipe] * 3, self.stream), 3)
+        self.assertEqual(self.stream.getvalue(), expected * 3)
+        self.assertEqual(self.stream.writes, 1)
+
+    def test_buffering(self):
+        renderer = RecipeRenderer(self.stream, buffer_size=250)
+        renderer.write_many([self.recipe] * 10)
+        flushed = self.stream.writes
+        self.assertGreater(flushed, 1)
+        self.assertLess(flushed, 10)
+        renderer.flush()
+        renderer.flush()
+        self.assertEqual(self.stream.getvalue().count("Recipe: "), 10)
+        with self.assertRaises(ValueError):
+            RecipeRenderer(self.stream, fmt="pdf")
+
+    def test_markdown_and_html(self):
+        render_recipes([self.recipe], self.stream, fmt="markdown")
+        markdown = self.stream.getvalue()
+        self.assertTrue(markdown.startswith("## Gin & Tonic\n"))
+        self.assertIn("- 50 ml Gin\n", markdown)
+        self.assertIn("2. Stir <gently>\n", markdown)
+
+        out = io.StringIO()
+        with RecipeRenderer(out, fmt="html") as renderer:
+            renderer.write({"name": "Neat", "ingredients": [{"name": "Rum", "amount": 2, "unit": "oz"}]})
+            renderer.write(self.recipe)
+        page = out.getvalue()
+        self.assertIn("<h2>Gin &amp; Tonic</h2>", page)
+        self.assertIn("<li>Stir &lt;gently&gt;</li>", page)
+        self.assertIn("<li>2 oz Rum</li>", page)
+        self.assertEqual(page.count("<article"), 2)
+        self.assertEqual(page.count("<ol>"), 1)
+
+if __name__ == "__main__":
+    unittest.main()
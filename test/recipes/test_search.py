@@ -0,0 +1,38 @@
+import unittest
+from pymixology.recipes.search import NameIndex
+
+class TestNameIndex(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.names = ["mojito", "martini", "dry martini", "margarita", "mai tai", "daiquiri"]
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def setUp(self):
+        self.index = NameIndex(self.names)
+
+    def tearDown(self):
+        self.index = None
+
+    def scan(self, query):
+        return [pos for pos, name in enumerate(self.names) if query in name]
+
+    def test_substring(self):
+        for query in ["", "m", "ai", "tin", "martini", "rtin", "ita", "dry m", "xyz", "tinim", "a r"]:
+            self.assertEqual(self.index.substring(query), self.scan(query), query)
+        self.assertEqual(self.index.substring("ma", limit=2), [1, 2])
+        self.assertEqual(len(self.index), 6)
+
+    def test_prefix(self):
+        self.assertEqual(self.index.prefix("ma"), [4, 3, 1])
+        self.assertEqual(self.index.prefix("ma", limit=2), [4, 3])
+        self.assertEqual(self.index.prefix("z"), [])
+        self.assertEqual(self.index.prefix(""), [5, 2, 4, 3, 1, 0])
+
+        pos = self.index.add("manhattan")
+        self.assertEqual(pos, 6)
+        self.assertEqual(self.index.prefix("ma"), [4, 6, 3, 1])
+        self.assertEqual(self.index.substring("hat"), [6])
@@ -1,4 +1,5 @@
 import unittest
+import math
 from pymixology.recipes import tools
 from pymixology.exceptions import RecipeError
 
@@ -40,6 +41,7 @@ class TestTools(unittest.TestCase):
         # Test same unit
         res_same = tools.unit_converter(10, "ml", "ml")
         self.assertEqual(res_same, 10)
+        self.assertEqual(tools.unit_converter(10, "leaves", "Leaves"), 10)
         
         # Test invalid unit
         with self.assertRaises(RecipeError):
@@ -80,3 +82,63 @@ class TestTools(unittest.TestCase):
         with self.assertRaises(ValueError):
             tools.scale_recipe(recipe, -1)
 
+
+    def test_batch_calculations(self):
+        menu = [self.ingredients_abv, [{"vol": 0, "abv": 40}], [], [{"vol": 50, "abv": 40}]]
+        indptr, cols = tools.build_menu_matrix(menu, ["vol", "abv"])
+        self.assertEqual(list(indptr), [0, 2, 3, 3, 4])
+        abvs = tools.calculate_abv_batch(indptr, cols["vol"], cols["abv"])
+        self.assertEqual(len(abvs), 4)
+        for row, ingredients in enumerate(menu):
+            self.assertAlmostEqual(abvs[row], tools.calculate_abv(ingredients))
+
+        menu = [self.ingredients_cost, self.ingredients_cost_invalid, [], self.ingredients_cost[:1]]
+        indptr, cols = tools.build_menu_matrix(menu, ["used_vol", "price_per_bottle", "bottle_vol"])
+        costs, bad_rows = tools.estimate_cost_batch(indptr, cols["used_vol"], cols["price_per_bottle"], cols["bottle_vol"])
+        self.assertEqual(bad_rows, [1])
+        self.assertAlmostEqual(costs[0], 6.0)
+        self.assertTrue(math.isnan(costs[1]))
+        self.assertEqual(costs[2], 0.0)
+        self.assertAlmostEqual(costs[3], 5.0)
+
+        # Rows are summed independently: a NaN or inf does not leak into later drinks
+        indptr = [0, 1, 2, 4]
+        abvs = tools.calculate_abv_batch(indptr, [math.nan, 50.0, math.inf, -math.inf], [40.0, 40.0, 40.0, 40.0])
+        self.assertEqual(abvs[1], 40.0)
+        self.assertEqual(abvs[2], 0.0)
+        costs, bad_rows = tools.estimate_cost_batch([0, 1, 2], [30.0, 30.0], [math.inf, 700.0], [700.0, 700.0])
+        self.assertEqual((costs[0], costs[1], bad_rows), (math.inf, 30.0, []))
+        self.assertEqual(list(tools.calculate_abv_batch([0, 2, 3], [1e308, 1e308, 10.0], [0.0, 0.0, 40.0]))[1], 40.0)
+
+    def test_scaled_views(self):
+        recipe = {
+            "name": "Test",
+            "servings": 2,
+            "ingredients": [
+                {"name": "Gin", "amount": 60, "unit": "ml"},
+                {"name": "Bitters", "amount": "dash"},
+                "Ice"
+            ],
+            "steps": ["Stir"]
+        }
+        view = tools.scale_recipe_view(recipe, 6)
+        self.assertEqual(view["servings"], 6)
+        self.assertEqual(view.amount(0), 180)
+        self.assertEqual(view.amount(1), "dash")
+        self.assertIsNone(view.amount(2))
+        self.assertIs(view["steps"], recipe["steps"])
+        self.assertEqual(view.to_dict(), tools.scale_recipe(recipe, 6))
+        self.assertEqual(dict(view), view.to_dict())
+        self.assertEqual(recipe["ingredients"][0]["amount"], 60)
+        self.assertIn("servings=6", repr(view))
+        no_servings = tools.scale_recipe_view({"name": "X", "ingredients": []}, 3)
+        self.assertEqual(len(no_servings), 3)
+        self.assertEqual(list(no_servings), ["name", "ingredients", "servings"])
+        with self.assertRaises(ValueError):
+            tools.scale_recipe_view(recipe, 0)
+
+        totals = tools.scale_recipes_batch([recipe, {"ingredients": [{"name": "gin", "amount": 30, "unit": "ml"}]}], [4, 2])
+        self.assertEqual(totals, {("Gin", "ml"): 180.0})
+        self.assertEqual(tools.scale_recipes_batch([recipe], 2), {("Gin", "ml"): 60.0})
+        with self.assertRaises(ValueError):
+            tools.scale_recipes_batch([recipe], [1, 2])
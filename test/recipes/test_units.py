@@ -0,0 +1,83 @@
+import os
+import json
+import tempfile
+import unittest
+from pymixology.recipes.units import UnitRegistry, DEFAULT_REGISTRY, OZ_TO_ML
+from pymixology.recipes import catalog
+from pymixology.exceptions import RecipeError
+
+class TestUnits(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.tmpdir.name, "recipes.json")
+        recipes = [
+            {"name": "Gimlet", "base": "Gin", "ingredients": [
+                {"name": "Gin", "amount": 2, "unit": "oz"},
+                {"name": "Lime Juice", "amount": 2, "unit": "cl"},
+                {"name": "Bitters", "amount": 2, "unit": "Dashes"},
+                {"name": "Mint", "amount": 4, "unit": "leaves"},
+            ]},
+        ]
+        with open(cls.path, "w") as f:
+            json.dump(recipes, f)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+
+    def setUp(self):
+        self.registry = UnitRegistry()
+
+    def tearDown(self):
+        self.registry = None
+
+    def test_registry(self):
+        self.assertAlmostEqual(self.registry.convert(1, "OZ", "ml"), OZ_TO_ML)
+        self.assertAlmostEqual(self.registry.convert(3, "cl", "ml"), 30.0)
+        self.assertAlmostEqual(self.registry.convert(1, "shot", "oz"), 1.5)
+        self.assertAlmostEqual(self.registry.convert(3, "tsp", "tbsp"), 1.0, places=4)
+        self.assertEqual(self.registry.canonical(" Ounces "), "oz")
+        self.assertTrue(self.registry.knows("bar spoon"))
+        self.assertFalse(self.registry.knows("gal"))
+        with self.assertRaises(RecipeError):
+            self.registry.factor("gal", "ml")
+        with self.assertRaises(RecipeError):
+            self.registry.register("gal", 0)
+        self.registry.register("gal", 3785.41, ["gallon"])
+        self.assertAlmostEqual(self.registry.convert(1, "gallon", "l"), 3.78541)
+        self.assertFalse(DEFAULT_REGISTRY.knows("gal"))
+        pairs = self.registry.compile()
+        self.assertAlmostEqual(pairs[("cl", "ml")], 10.0)
+
+    def test_convert_many(self):
+        out = self.registry.convert_many([1, 2, 30], ["oz", "cl", "ml"], "ml")
+        self.assertEqual(len(out), 3)
+        self.assertAlmostEqual(out[0], OZ_TO_ML)
+        self.assertAlmostEqual(out[1], 20.0)
+        self.assertAlmostEqual(out[2], 30.0)
+        self.assertEqual(len(self.registry.convert_many([], [], "oz")), 0)
+        with self.assertRaises(ValueError):
+            self.registry.convert_many([1], [], "ml")
+        with self.assertRaises(RecipeError):
+            self.registry.convert_many([1], ["pinch"], "ml")
+
+    def test_normalize(self):
+        recipes = catalog.load_recipes(self.path, unit="ML")
+        items = recipes[0]["ingredients"]
+        self.assertEqual([item["unit"] for item in items], ["ml", "ml", "ml", "leaves"])
+        self.assertAlmostEqual(items[0]["amount"], 2 * OZ_TO_ML)
+        self.assertAlmostEqual(items[1]["amount"], 20.0)
+        self.assertEqual(items[3]["amount"], 4)
+        raw = catalog.load_recipes(self.path)
+        self.assertEqual(raw[0]["ingredients"][0]["unit"], "oz")
+        self.assertEqual(self.registry.normalize_catalog(raw, "ml"), recipes)
+        cached = catalog.load_recipes(self.path, cache=True, unit="oz")
+        self.assertAlmostEqual(cached[0]["ingredients"][1]["amount"], 20.0 / OZ_TO_ML)
+        self.assertTrue(os.path.exists(self.path + ".oz.pmxcache"))
+        with self.assertRaises(RecipeError):
+            catalog.load_recipes(self.path, unit="gal")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import math
+import unittest
+from pymixology.recipes.vocab import IngredientVocabulary, EncodedRecipes
+from pymixology.recipes import catalog
+
+class TestVocab(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.names = ["Gin", "Lime Juice", "Sugar"]
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def setUp(self):
+        self.vocab = IngredientVocabulary(self.names)
+
+    def tearDown(self):
+        self.vocab = None
+
+    def test_vocabulary(self):
+        self.assertEqual(len(self.vocab), 3)
+        self.assertEqual(self.vocab.id_for(" GIN "), 0)
+        self.assertEqual(self.vocab.lookup("lime juice"), 1)
+        self.assertIsNone(self.vocab.lookup("Rum"))
+        self.assertEqual(self.vocab.id_for("Rum"), 3)
+        self.assertEqual(self.vocab.name(3), "rum")
+        self.assertIn("SUGAR", self.vocab)
+        self.assertNotIn(3, self.vocab)
+        restored = IngredientVocabulary.from_state(self.vocab.to_state())
+        self.assertEqual(restored.lookup("rum"), 3)
+
+    def test_encoded_rows(self):
+        encoded = EncodedRecipes(self.vocab)
+        row = encoded.add([{"name": "Gin", "amount": 60}, {"name": "Tonic", "amount": None}])
+        encoded.add([])
+        self.assertEqual(row, 0)
+        self.assertEqual(len(encoded), 2)
+        ids, amounts = encoded.row(0)
+        self.assertEqual(list(ids), [0, 3])
+        self.assertEqual(amounts[0], 60.0)
+        self.assertTrue(math.isnan(amounts[1]))
+        self.assertEqual([len(ids) for ids, _ in encoded.rows()], [2, 0])
+        restored = EncodedRecipes.from_state(self.vocab, encoded.to_state())
+        self.assertEqual(list(restored.row(0)[0]), [0, 3])
+
+    def test_shared_catalog_vocabulary(self):
+        first = catalog.RecipeCatalog([catalog._normalize_recipe({"name": "G&T", "ingredients": ["Gin", "Tonic"]})],
+                                      vocab=self.vocab)
+        second = catalog.RecipeCatalog([{"name": "Gimlet", "ingredients": [{"name": "gin"}]}], vocab=self.vocab)
+        self.assertIs(first.vocab, second.vocab)
+        self.assertEqual(list(second.encoded.row(0)[0]), [0])
+        self.assertEqual(first.positions_with(self.vocab.lookup("tonic")), [0])
+        self.assertEqual(first.positions_with(None), [])
+        # Normalized ingredient names are interned and shared
+        a = catalog._normalize_ingredient({"name": "".join(["Li", "me"])})["name"]
+        b = catalog._normalize_ingredient("".join(["Lim", "e"]))["name"]
+        self.assertIs(a, b)
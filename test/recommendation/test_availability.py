@@ -0,0 +1,115 @@
+import os
+import random
+import sys
+import threading
+import unittest
+from pymixology.recommendation import suggester
+from pymixology.recommendation.availability import AvailabilityTracker
+from pymixology.recipes.catalog import load_recipes
+from pymixology.inventory.items import Ingredient, Spirit
+from pymixology.inventory.container import Inventory
+from pymixology.inventory.concurrent import ConcurrentInventory
+from pymixology.inventory import manager
+
+class TestAvailability(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        path = os.path.join(os.path.dirname(suggester.__file__), "..", "data", "cocktails.json")
+        cls.cocktails = load_recipes(path)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def setUp(self):
+        self.recipes = [
+            {"name": "Sour", "ingredients": [{"name": "Gin", "amount": 60}, {"name": "Lemon", "amount": 30}]},
+            {"name": "Neat", "ingredients": [{"name": "Gin", "amount": 90}]},
+            {"name": "Highball", "ingredients": [{"name": "Gin", "amount": 45}, "Tonic"]},
+            {"name": "Empty", "ingredients": []},
+        ]
+        self.gin = Spirit("Gin", 100.0, "2025-01-01", abv=40.0)
+        self.inventory = Inventory([self.gin, Ingredient("Lemon", 30.0, "2024-01-01")])
+        self.tracker = AvailabilityTracker(self.recipes, self.inventory)
+
+    def tearDown(self):
+        self.tracker.close()
+
+    def test_events(self):
+        events = []
+        self.inventory.add_listener(lambda inventory, name: events.append(name))
+        self.assertEqual(self.tracker.makeable(), ["Sour", "Neat"])
+        self.assertEqual(self.tracker.count(), 2)
+
+        manager.add_item(self.inventory, Ingredient("Tonic", 0.0, "2024-01-01"))
+        self.assertTrue(self.tracker.is_makeable("highball"))
+        self.gin.use(20)
+        self.assertEqual(self.tracker.makeable(), ["Sour", "Highball"])
+        before = self.tracker.updates
+        self.inventory.get("lemon").use(1)
+        self.assertEqual(self.tracker.updates - before, 1)
+        self.assertEqual(self.tracker.makeable(), ["Highball"])
+        manager.remove_item(self.inventory, "tonic")
+        self.assertEqual(self.tracker.count(), 0)
+        self.assertFalse(self.tracker.is_makeable("Martini"))
+        self.assertFalse(self.tracker.is_makeable("Empty"))
+        self.assertEqual(events, ["Tonic", "Gin", "Lemon", "Tonic"])
+
+        self.inventory.clear()
+        self.assertEqual(events[-2:], ["Gin", "Lemon"])
+        self.tracker.close()
+        self.inventory.append(Spirit("Gin", 500.0, "2025-01-01", abv=40.0))
+        self.assertEqual(self.tracker.count(), 0)
+
+    def test_matches_suggester(self):
+        rng = random.Random(21)
+        names = sorted({item["name"] for recipe in self.cocktails for item in recipe["ingredients"]})
+        inventory = ConcurrentInventory(
+            Ingredient(name, rng.choice([15, 60, 1000]), "2025-01-01") for name in names if rng.random() < 0.85
+        )
+        with AvailabilityTracker(self.cocktails, inventory) as tracker:
+            for _ in range(200):
+                item = rng.choice(list(inventory))
+                if rng.random() < 0.1:
+                    inventory.remove(item)
+                elif rng.random() < 0.1:
+                    inventory.append(Ingredient(rng.choice(names), 200, "2025-01-01"))
+                elif inventory.check_stock(item.name) >= 5:
+                    inventory.use(item.name, 5)
+                expected = suggester.get_makeable_cocktails(list(inventory), self.cocktails)
+                self.assertEqual(tracker.makeable(), expected)
+                self.assertEqual(tracker.count(), len(expected))
+    def test_threads(self):
+        inventory = ConcurrentInventory([Spirit("Gin", 10000.0, "2025-01-01", abv=40.0), Ingredient("Lemon", 30.0, "2024-01-01")])
+        tracker = AvailabilityTracker(self.recipes, inventory)
+        events = []
+        inventory.add_listener(lambda inv, name: events.append(inv.check_stock(name)))
+
+        def pour():
+            for _ in range(2000):
+                inventory.compare_and_decrement("Gin", 1)
+
+        def stock():
+            for i in range(2000):
+                inventory.append(Ingredient(f"Garnish {i}", 1.0, "2025-01-01"))
+
+        # Switch threads often so a lock-order inversion would deadlock here.
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        workers = [threading.Thread(target=target, daemon=True) for target in (pour, stock, pour)]
+        try:
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join(timeout=30)
+        finally:
+            sys.setswitchinterval(interval)
+        self.assertFalse(any(worker.is_alive() for worker in workers))
+        self.assertEqual(inventory.check_stock("Gin"), 6000.0)
+        self.assertEqual(len(events), 6000)
+        self.assertEqual(tracker.makeable(), suggester.get_makeable_cocktails(list(inventory), self.recipes))
+        tracker.close()
+
+if __name__ == "__main__":
+    unittest.main()
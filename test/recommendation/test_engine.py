@@ -0,0 +1,66 @@
+import os
+import random
+import unittest
+from pymixology.recommendation import suggester
+from pymixology.recommendation.engine import MakeableEngine, iter_bits, mask_from_positions
+from pymixology.recipes.catalog import RecipeCatalog, load_recipes
+from pymixology.inventory.items import Ingredient
+
+class TestEngine(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        path = os.path.join(os.path.dirname(suggester.__file__), "..", "data", "cocktails.json")
+        cls.catalog = RecipeCatalog(load_recipes(path))
+        cls.engine = MakeableEngine(cls.catalog)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.engine = None
+
+    def setUp(self):
+        self.recipes = [
+            {"name": "Sour", "ingredients": [{"name": "Gin", "amount": 60}, {"name": "Lemon", "amount": 30}]},
+            {"name": "Neat", "ingredients": [{"name": "Gin", "amount": 90}]},
+            {"name": "Highball", "ingredients": [{"name": "Gin", "amount": 45}, "Tonic"]},
+            {"name": "Empty", "ingredients": []},
+        ]
+        self.small = MakeableEngine(self.recipes)
+
+    def tearDown(self):
+        self.small = None
+
+    def test_bits(self):
+        mask = mask_from_positions([0, 3, 70], 71)
+        self.assertEqual(mask, (1 << 0) | (1 << 3) | (1 << 70))
+        self.assertEqual(list(iter_bits(mask)), [0, 3, 70])
+        self.assertEqual(list(iter_bits(0)), [])
+
+    def test_thresholds(self):
+        self.assertEqual(self.small.makeable({"gin": 100, "LEMON": 30, "Tonic": 1}), ["Sour", "Neat", "Highball"])
+        self.assertEqual(self.small.makeable({"gin": 60, "lemon": 29}), [])
+        self.assertEqual(self.small.makeable({"gin": 60, "lemon": 30}), ["Sour"])
+        self.assertEqual(self.small.makeable({"gin": 45, "tonic": 0}), ["Highball"])
+        self.assertEqual(self.small.makeable({"rum": 1000}), [])
+        self.assertEqual(self.small.makeable([Ingredient("Gin", 95, "2025-01-01"), Ingredient("Gin", 1, "2025-01-01")]), ["Neat"])
+        self.assertEqual(len(self.small), 4)
+        self.assertIn("4 recipes", repr(self.small))
+
+    def test_matches_suggester(self):
+        rng = random.Random(533)
+        names = sorted({item["name"] for recipe in self.catalog for item in recipe["ingredients"]})
+        for _ in range(30):
+            stock = [Ingredient(name, rng.choice([1, 15, 30, 60, 1000]), "2025-01-01") for name in names if rng.random() < 0.8]
+            expected = suggester.get_makeable_cocktails(stock, list(self.catalog))
+            self.assertEqual(suggester.get_makeable_cocktails(stock, self.engine), expected)
+            self.assertEqual(self.engine.makeable(stock), suggester.get_makeable_cocktails(stock, self.catalog))
+        # The first item of a repeated name wins on every path.
+        stock = [Ingredient("Gin", 1, "2025-01-01"), Ingredient("gin", 95, "2025-01-01")]
+        for recipe_db in (self.recipes, RecipeCatalog(self.recipes), self.small):
+            self.assertEqual(suggester.get_makeable_cocktails(stock, recipe_db), [])
+        stock.reverse()
+        for recipe_db in (self.recipes, RecipeCatalog(self.recipes), self.small):
+            self.assertEqual(suggester.get_makeable_cocktails(stock, recipe_db), ["Neat"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import os
+import unittest
+from pymixology.recommendation import suggester, preference
+from pymixology.recommendation.flavor import FlavorMatrix, flavor_vector, profile_vector, FLAVOR_VECTORS
+from pymixology.recipes.catalog import load_recipes
+from pymixology.exceptions import RecommendationError
+
+class TestFlavor(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        path = os.path.join(os.path.dirname(suggester.__file__), "..", "data", "cocktails.json")
+        cls.cocktails = load_recipes(path)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def setUp(self):
+        self.recipes = [
+            {"name": "Mojito", "flavor": "sweet"},
+            {"name": "Daiquiri", "flavor": "Sour"},
+            {"name": "Negroni", "flavor_vector": {"bitter": 8, "strong": 6}},
+            {"name": "Custom", "flavor_vector": [1, 1, 1, 1]},
+            {"name": "Plain"},
+        ]
+        self.matrix = FlavorMatrix(self.recipes)
+
+    def tearDown(self):
+        self.matrix = None
+
+    def test_vectors(self):
+        self.assertEqual(flavor_vector(self.recipes[1]), (0.0, 9.0, 0.0, 0.0))
+        self.assertEqual(flavor_vector(self.recipes[2]), (0.0, 0.0, 8.0, 6.0))
+        self.assertEqual(flavor_vector(self.recipes[4]), (0.0, 0.0, 0.0, 0.0))
+        with self.assertRaises(RecommendationError):
+            flavor_vector({"flavor_vector": [1, 2]})
+        self.assertEqual(profile_vector({"sour": 3}), (0.0, 3.0, 0.0, 0.0))
+        with self.assertRaises(RecommendationError):
+            profile_vector({"sweet": -1})
+        for recipe in self.cocktails:
+            self.assertIn(recipe["flavor"], FLAVOR_VECTORS)
+
+    def test_top_k(self):
+        profile = preference.set_flavor_profile(sweet=5, sour=3, bitter=1, strong=0)
+        self.assertEqual(list(self.matrix.scores(profile)), [45.0, 27.0, 8.0, 9.0, 0.0])
+        self.assertEqual(self.matrix.top_k(profile, k=2), [("Mojito", 45.0), ("Daiquiri", 27.0)])
+        self.assertEqual(
+            suggester.recommend_by_flavor(profile, self.matrix), ["Mojito", "Daiquiri", "Custom", "Negroni"],
+        )
+        self.assertEqual(suggester.recommend_by_flavor(profile, self.matrix, k=1), ["Mojito"])
+        self.assertEqual(suggester.recommend_by_flavor({"sweet": 5, "sour": 3}, self.recipes, k=1), ["Mojito"])
+        self.assertEqual(self.matrix.top_k({"bitter": 0}), [])
+        with self.assertRaises(RecommendationError):
+            self.matrix.top_k({"strong": -2})
+
+    def test_batch(self):
+        profiles = [{"strong": 10}, {"sour": 1, "sweet": 1}, {}]
+        batch = self.matrix.top_k_batch(profiles, k=2)
+        self.assertEqual(batch, [self.matrix.top_k(profile, k=2) for profile in profiles])
+        self.assertEqual(batch[0], [("Negroni", 60.0), ("Custom", 10.0)])
+        self.assertEqual(batch[2], [])
+        big = FlavorMatrix(self.cocktails)
+        self.assertEqual(len(big), len(self.cocktails))
+        scores = big.scores_batch(profiles[:2])
+        self.assertEqual(len(scores), 2)
+        self.assertEqual(len(scores[0]), len(self.cocktails))
+
+if __name__ == "__main__":
+    unittest.main()
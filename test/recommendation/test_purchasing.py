@@ -0,0 +1,92 @@
+import os
+import random
+import unittest
+from pymixology.recommendation import suggester
+from pymixology.recommendation.purchasing import PurchasePlanner
+from pymixology.recipes.catalog import load_recipes
+from pymixology.inventory.items import Ingredient
+from pymixology.inventory.container import Inventory
+from pymixology.exceptions import RecommendationError
+
+class TestPurchasing(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        path = os.path.join(os.path.dirname(suggester.__file__), "..", "data", "cocktails.json")
+        cls.cocktails = load_recipes(path)
+        cls.big = PurchasePlanner(cls.cocktails)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.big = None
+
+    def setUp(self):
+        self.recipes = [
+            {"name": "Gin Sour", "ingredients": [{"name": "Gin", "amount": 60}, {"name": "Lemon", "amount": 30}, "Sugar"]},
+            {"name": "Gimlet", "ingredients": [{"name": "Gin", "amount": 60}, {"name": "Lime", "amount": 20}]},
+            {"name": "Daiquiri", "ingredients": [{"name": "Rum", "amount": 60}, {"name": "Lime", "amount": 20}, "Sugar"]},
+            {"name": "Neat Gin", "ingredients": [{"name": "Gin", "amount": 60}, {"name": "Gin", "amount": 90}]},
+            {"name": "Empty", "ingredients": []},
+        ]
+        self.inventory = Inventory([
+            Ingredient("Gin", 70, "2025-01-01"),
+            Ingredient("Sugar", 5, "2025-01-01"),
+            Ingredient("Lemon", 10, "2024-01-01"),
+        ])
+        self.planner = PurchasePlanner(self.recipes)
+
+    def tearDown(self):
+        self.inventory.clear()
+
+    def test_near_misses(self):
+        self.assertEqual(list(self.planner.missing_counts(self.inventory)), [1, 1, 2, 1, 0])
+        self.assertEqual(
+            self.planner.near_misses(self.inventory, k=1),
+            [("Gin Sour", ["Lemon"]), ("Gimlet", ["Lime"]), ("Neat Gin", ["Gin"])],
+        )
+        self.assertEqual(self.planner.near_misses(self.inventory, k=0), [])
+        misses = dict(self.planner.near_misses(self.inventory, k=3, min_threshold=6))
+        self.assertEqual(sorted(misses["Daiquiri"]), ["Lime", "Rum", "Sugar"])
+        self.assertEqual(sorted(misses["Gin Sour"]), ["Lemon", "Sugar"])
+        with self.assertRaises(RecommendationError):
+            self.planner.near_misses(self.inventory, k=-1)
+
+    def test_best_bottles(self):
+        picks = self.planner.best_bottles(self.inventory, 2)
+        self.assertEqual(picks[0], ("Lime", ["Gimlet"]))
+        self.assertEqual(len(picks), 2)
+        self.assertEqual(len(picks[1][1]), 1)
+        self.assertEqual(self.planner.best_bottles(self.inventory, 0), [])
+        self.assertEqual(self.planner.best_bottles([], 1), [("Gin", ["Neat Gin"])])
+        stocked = [Ingredient(name, 100, "2025-01-01") for name in ("Gin", "Lemon", "Lime", "Sugar", "Rum")]
+        self.assertEqual(self.planner.best_bottles(stocked, 3), [])
+        self.assertEqual([name for name, _ in self.planner.best_bottles([], 2)], ["Gin", "Lime"])
+        with self.assertRaises(RecommendationError):
+            self.planner.best_bottles(self.inventory, -1)
+
+    def test_matches_suggester(self):
+        rng = random.Random(22)
+        names = sorted({item["name"] for recipe in self.cocktails for item in recipe["ingredients"]})
+        for _ in range(20):
+            stock = [Ingredient(name, rng.choice([1, 15, 60, 1000]), "2025-01-01") for name in names if rng.random() < 0.7]
+            makeable = [name for name, missing in self.big.near_misses(stock, k=0)]
+            self.assertEqual(sorted(makeable), sorted(suggester.get_makeable_cocktails(stock, self.cocktails)))
+            counts = self.big.missing_counts(stock)
+            for recipe, count in zip(self.cocktails, counts):
+                have = {item.name.lower(): item.quantity for item in stock}
+                needed = {}
+                for item in recipe["ingredients"]:
+                    amount = item["amount"] if isinstance(item["amount"], (int, float)) else 0
+                    needed[item["name"].lower()] = max(needed.get(item["name"].lower(), 0), amount)
+                expected = sum(1 for name, amount in needed.items() if name not in have or have[name] < amount)
+                self.assertEqual(count, expected)
+            picks = self.big.best_bottles(stock, 3)
+            unlocked = sum(len(recipes) for _, recipes in picks)
+            bought = {name.lower() for name, _ in picks}
+            extended = [item for item in stock if item.name.lower() not in bought]
+            extended += [Ingredient(name, 10 ** 6, "2025-01-01") for name, _ in picks]
+            gained = len(suggester.get_makeable_cocktails(extended, self.cocktails)) - len(makeable)
+            self.assertEqual(unlocked, gained)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pymixology.recommendation import suggester
+from pymixology.recommendation.similarity import SimilarityIndex, recipe_abv
+from pymixology.recipes.catalog import RecipeCatalog, load_recipes
+from pymixology.recipes.units import OZ_TO_ML
+from pymixology.inventory.items import Ingredient
+from pymixology.inventory.journal import JournaledInventory, SNAPSHOT_NAME
+from pymixology.exceptions import DataLoadError, RecommendationError
+
+class TestSimilarity(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        path = os.path.join(os.path.dirname(suggester.__file__), "..", "data", "cocktails.json")
+        cls.cocktails = load_recipes(path)
+        cls.abv = {"Gin": 40, "White Rum": 40, "Vodka": 40, "Tequila": 40, "Bourbon": 45, "Sweet Vermouth": 16}
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.recipes = [
+            {"name": "Gimlet", "flavor": "sour", "ingredients": [{"name": "Gin", "amount": 60}, {"name": "Lime", "amount": 20}]},
+            {"name": "Daiquiri", "flavor": "sour", "ingredients": [{"name": "Rum", "amount": 60}, {"name": "Lime", "amount": 20}]},
+            {"name": "Gin Sour", "flavor": "sour", "ingredients": [{"name": "Gin", "amount": 60}, {"name": "Lemon", "amount": 30}]},
+            {"name": "Shirley Temple", "flavor": "sweet", "ingredients": ["Grenadine", "Ginger Ale"]},
+        ]
+        self.index = SimilarityIndex(self.recipes, abv_table={"gin": 40, "RUM": 40})
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_abv(self):
+        self.assertEqual(recipe_abv(self.recipes[0], {"gin": 40}), 30.0)
+        self.assertEqual(recipe_abv(self.recipes[0]), 0.0)
+        self.assertEqual(recipe_abv({"abv": 12, "ingredients": []}), 12.0)
+        self.assertEqual(recipe_abv({"ingredients": [{"name": "Gin", "amount": 30, "abv": 50}, "Mint"]}), 50.0)
+        # Amounts are converted to ml; units without a volume are left out.
+        mixed = {"ingredients": [{"name": "Gin", "amount": 1, "unit": "oz"}, {"name": "Lime", "amount": OZ_TO_ML, "unit": "ml"}]}
+        self.assertAlmostEqual(recipe_abv(mixed, {"gin": 40}), 20.0)
+        mojito = {"ingredients": [{"name": "Rum", "amount": 60, "unit": "ml", "abv": 40}, {"name": "Mint", "amount": 8, "unit": "leaves"}]}
+        self.assertEqual(recipe_abv(mojito), 40.0)
+
+    def test_neighbors(self):
+        result = self.index.neighbors("Gimlet", k=3)
+        self.assertEqual([name for name, _ in result], ["Daiquiri", "Gin Sour", "Shirley Temple"])
+        self.assertEqual(result, self.index.neighbors("gimlet", k=3, exact=True))
+        self.assertEqual([score for _, score in result], sorted((score for _, score in result), reverse=True))
+        twin = dict(self.recipes[0], name="Gimlet Twin")
+        self.assertAlmostEqual(self.index.neighbors(twin, k=1)[0][1], 1.0)
+        self.assertEqual(self.index.neighbors(twin, k=1)[0][0], "Gimlet")
+        self.assertEqual(self.index.neighbors("Gimlet", k=0), [])
+        with self.assertRaises(RecommendationError):
+            self.index.neighbors("Negroni")
+        with self.assertRaises(RecommendationError):
+            self.index.neighbors("Gimlet", k=-1)
+        with self.assertRaises(ValueError):
+            SimilarityIndex(self.recipes, weights=(0, 0, 0))
+        with self.assertRaises(ValueError):
+            SimilarityIndex(self.recipes, rows=0)
+
+    def test_insert(self):
+        self.assertEqual(self.index.add({"name": "Southside", "flavor": "sour", "ingredients": ["Gin", "Lime", "Mint"]}), 4)
+        self.assertEqual(len(self.index), 5)
+        self.assertEqual(self.index.neighbors("Southside", k=1)[0][0], "Gimlet")
+        self.index.catalog.add({"name": "Rum Sour", "flavor": "sour", "ingredients": ["Rum", "Lemon"]})
+        with self.assertRaises(RecommendationError):
+            self.index.neighbors("Rum Sour")
+        self.assertEqual(self.index.refresh(), 1)
+        self.assertEqual(self.index.refresh(), 0)
+        self.assertEqual(len(self.index.neighbors("Rum Sour", k=10)), 5)
+
+    def test_persistence(self):
+        path = os.path.join(self.directory, "index.pmxsim")
+        self.index.save(path)
+        loaded = SimilarityIndex.load(path)
+        self.assertEqual(len(loaded), len(self.index))
+        self.assertEqual(loaded.neighbors("Gimlet", k=3), self.index.neighbors("Gimlet", k=3))
+        loaded.add({"name": "Lime Rickey", "flavor": "sour", "ingredients": ["Gin", "Lime", "Soda"]})
+        self.assertEqual(loaded.neighbors("Lime Rickey", k=1)[0][0], "Gimlet")
+        with open(path, "wb") as f:
+            f.write(b"not an index")
+        with self.assertRaises(DataLoadError):
+            SimilarityIndex.load(path)
+        with self.assertRaises(DataLoadError):
+            SimilarityIndex.load(os.path.join(self.directory, "missing.pmxsim"))
+        journal_dir = os.path.join(self.directory, "journal")
+        with JournaledInventory(journal_dir) as inventory:
+            inventory.append(Ingredient("Gin", 700, "2025-01-01"))
+            inventory.snapshot()
+        with self.assertRaises(DataLoadError):
+            SimilarityIndex.load(os.path.join(journal_dir, SNAPSHOT_NAME))
+
+    def test_catalog(self):
+        index = SimilarityIndex(RecipeCatalog(self.cocktails), abv_table=self.abv)
+        self.assertEqual(len(index), len(self.cocktails))
+        for recipe in self.cocktails[:10]:
+            exact = index.neighbors(recipe["name"], k=5, exact=True)
+            self.assertEqual(len(index.neighbors(recipe["name"], k=5)), 5)
+            self.assertNotIn(recipe["name"], [name for name, _ in exact])
+            self.assertTrue(all(0.0 <= score <= 1.0 + 1e-9 for _, score in exact))
+
+if __name__ == "__main__":
+    unittest.main()
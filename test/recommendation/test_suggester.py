@@ -1,6 +1,7 @@
 import unittest
 from pymixology.recommendation import suggester
 from pymixology.inventory.items import Ingredient
+from pymixology.recipes.catalog import RecipeCatalog
 from pymixology.exceptions import RecommendationError
 
 class TestSuggester(unittest.TestCase):
@@ -127,3 +128,48 @@ class TestSuggester(unittest.TestCase):
         name_dict = suggester._ingredient_name({"name": "Gin", "amount": 10})
         self.assertEqual(name_dict, "Gin")
 
+
+    def test_compiled_catalog(self):
+        compiled = RecipeCatalog(self.recipes)
+        self.assertEqual(suggester.get_makeable_cocktails(self.inventory, compiled),
+                         suggester.get_makeable_cocktails(self.inventory, self.recipes))
+        self.assertEqual(suggester.find_cocktails_with_ingredients(["mint", "Lime"], compiled),
+                         ["Mojito", "Daiquiri"])
+        self.assertEqual(suggester.find_cocktails_with_ingredients(["Unknown"], compiled), [])
+
+        weird = RecipeCatalog([
+            {"name": "Simple Drink", "ingredients": ["Rum"]},
+            {"name": "No Ingredients", "ingredients": []},
+            {"name": "Free Drink", "ingredients": [{"name": "Air", "amount": None}]},
+            {"name": "Big Mojito", "ingredients": [{"name": "Rum", "amount": 5000}]},
+        ])
+        self.assertEqual(suggester.get_makeable_cocktails(self.inventory, weird), ["Simple Drink"])
+        self.inventory.append(Ingredient("Air", 100, "2099-01-01"))
+        self.assertEqual(suggester.get_makeable_cocktails(self.inventory, weird), ["Simple Drink", "Free Drink"])
+
+    def test_ranked_search(self):
+        ranked = suggester.rank_cocktails_by_ingredients(["Mint", "lime", "Sugar", "Gin"], self.recipes)
+        self.assertEqual(ranked, [("Mojito", 3.0), ("Daiquiri", 2.0)])
+        self.assertEqual(suggester.rank_cocktails_by_ingredients(["Lime", "Rum"], self.recipes, k=1), [("Mojito", 2.0)])
+        self.assertEqual(suggester.rank_cocktails_by_ingredients(["Rum"], self.recipes, k=0), [])
+
+        compiled = RecipeCatalog(self.recipes)
+        weights = {"unicorn tears": 4, "Mint": 1}
+        covered = suggester.rank_cocktails_by_ingredients(
+            ["Unicorn Tears", "Mint", "Rum"], compiled, weights=weights, mode="coverage",
+        )
+        self.assertEqual([name for name, _ in covered], ["Impossible Drink", "Mojito", "Daiquiri"])
+        self.assertAlmostEqual(covered[0][1], 4 / 6)
+        self.assertAlmostEqual(covered[1][1], 2 / 6)
+        with self.assertRaises(RecommendationError):
+            suggester.rank_cocktails_by_ingredients(["Rum"], compiled, mode="bm25")
+        with self.assertRaises(RecommendationError):
+            suggester.rank_cocktails_by_ingredients(["Rum"], compiled, weights={"rum": -1}, mode="coverage")
+        with self.assertRaises(RecommendationError):
+            suggester.rank_cocktails_by_ingredients(["Rum"], compiled, k=-1)
+        for targets in (["Mint", "Rum", "Lime"], ["unicorn tears", "sugar"], ["Gin"]):
+            for mode in ("overlap", "coverage"):
+                self.assertEqual(
+                    suggester.rank_cocktails_by_ingredients(targets, self.recipes, k=2, weights=weights, mode=mode),
+                    suggester.rank_cocktails_by_ingredients(targets, compiled, k=2, weights=weights, mode=mode),
+                )